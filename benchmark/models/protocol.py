@@ -67,6 +67,11 @@ def validate(data):
         return False, err
 
 
+def check(data):
+    result = model_protocol.check(data)
+    return result.valid, result
+
+
 def deserialize(data):
     try:
         return True, model_protocol.transmute(data)
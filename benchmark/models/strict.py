@@ -0,0 +1,64 @@
+from datetime import datetime
+from dataclasses import field
+from typing import List, Optional
+
+import typic
+
+from benchmark.models.klass import (
+    DBString,
+    GReCaptchaResponse,
+    HTTPReferer,
+    PositiveInt,
+)
+
+
+def _protocol(fused: bool) -> typic.SerdeProtocol:
+    klass = typic.klass(strict=True, always=False, serde=typic.flags(fused=fused))
+
+    @klass
+    class Location:
+        latitude: Optional[float] = None
+        longitude: Optional[float] = None
+
+    @klass
+    class Skill:
+        subject: str
+        subject_id: int
+        category: str
+        qual_level: str
+        qual_level_id: int
+        qual_level_ranking: float = 0.0
+
+    @klass
+    class Model:
+        id: int
+        client_name: DBString
+        sort_index: float
+        client_phone: Optional[DBString] = None
+        grecaptcha_response: Optional[GReCaptchaResponse] = None
+        location: Optional[Location] = None
+        contractor: Optional[PositiveInt] = None
+        upstream_http_referrer: Optional[HTTPReferer] = None
+        last_updated: Optional[datetime] = None
+        skills: List[Skill] = field(default_factory=list)
+
+    return typic.protocol(Model, is_strict=True)
+
+
+# In strict mode, deserialization validates the input and builds the model.
+strict_protocol = _protocol(fused=False)
+fused_protocol = _protocol(fused=True)
+
+
+def deserialize(data):
+    try:
+        return True, strict_protocol.transmute(data)
+    except (TypeError, ValueError) as err:
+        return False, err
+
+
+def deserialize_fused(data):
+    try:
+        return True, fused_protocol.transmute(data)
+    except (TypeError, ValueError) as err:
+        return False, err
@@ -1,14 +1,32 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 import dataclasses
+import datetime
 import json
+import os
 import pathlib
+import subprocess
+import sys
+import timeit
+import tracemalloc
 from copy import deepcopy
 
+import pendulum
 import pytest
 import typic
+from typic import gen
 
-from benchmark.models import apisch, drf, functional, klass, marsh, protocol, pyd
+from benchmark.models import (
+    apisch,
+    drf,
+    functional,
+    klass,
+    marsh,
+    protocol,
+    pyd,
+    strict,
+)
+from typic.common import LAZY_INIT_ENV
 
 THIS_DIR = pathlib.Path(__file__).parent.resolve()
 
@@ -57,6 +75,33 @@ def test_benchmarks_validate_valid_data(benchmark, mod):
     assert valid, data
 
 
+_STRICT_DESERIALIZERS = {
+    "typic-strict": strict.deserialize,
+    "typic-strict-fused": strict.deserialize_fused,
+}
+
+
+@pytest.mark.parametrize(argnames="name", argvalues=(*_STRICT_DESERIALIZERS,))
+@pytest.mark.parametrize(
+    argnames="group", argvalues=("Validate Valid Data", "Deserialize Valid Data")
+)
+def test_benchmarks_strict_valid_data(benchmark, group, name):
+    benchmark.group = group
+    benchmark.name = name
+    deserialize = _STRICT_DESERIALIZERS[name]
+    valid, data = benchmark(deserialize, deepcopy(VALID_DESER))
+    assert valid, data
+
+
+@pytest.mark.parametrize(argnames="name", argvalues=(*_STRICT_DESERIALIZERS,))
+def test_benchmarks_strict_invalid_data(benchmark, name):
+    benchmark.group = "Deserialize Invalid Data"
+    benchmark.name = name
+    deserialize = _STRICT_DESERIALIZERS[name]
+    valid, data = benchmark(deserialize, deepcopy(INVALID))
+    assert not valid, data
+
+
 @pytest.mark.parametrize(argnames="mod", argvalues=(*reversed([*_MODS]),))
 def test_benchmarks_validate_invalid_data(benchmark, mod):
     benchmark.group = "Validate Invalid Data"
@@ -66,6 +111,13 @@ def test_benchmarks_validate_invalid_data(benchmark, mod):
     assert not valid, data
 
 
+def test_benchmarks_check_invalid_data(benchmark):
+    benchmark.group = "Validate Invalid Data"
+    benchmark.name = "typic-protocol-check"
+    valid, data = benchmark(protocol.check, deepcopy(INVALID))
+    assert not valid, data
+
+
 @pytest.mark.parametrize(argnames="mod", argvalues=(*reversed([*_MODS]),))
 def test_benchmarks_deserialize_valid_data(benchmark, mod):
     benchmark.group = "Deserialize Valid Data"
@@ -75,6 +127,39 @@ def test_benchmarks_deserialize_valid_data(benchmark, mod):
     assert valid, data
 
 
+@dataclasses.dataclass
+class FlatRow:
+    id: int
+    name: str
+    score: float
+    note: str = ""
+
+
+# Nested rows spend most of their time in the field deserializers,
+#   flat rows in the per-row overhead which a batch removes.
+_ROWS = {
+    "model": (protocol.model_protocol, [deepcopy(VALID_RAW) for _ in range(1_000)]),
+    "flat": (
+        typic.protocol(FlatRow),
+        [{"id": i, "name": "row", "score": i / 2, "note": ""} for i in range(1_000)],
+    ),
+}
+
+
+@pytest.mark.parametrize(argnames="payload", argvalues=(*_ROWS,))
+@pytest.mark.parametrize(argnames="mode", argvalues=("per-row", "batch"))
+def test_benchmarks_deserialize_many(benchmark, mode, payload):
+    benchmark.group = f"Deserialize Many Valid Data ({payload})"
+    benchmark.name = f"typic-{mode}"
+    proto, rows = _ROWS[payload]
+    if mode == "batch":
+        deserialize = proto.transmute_many
+    else:
+        deserialize = lambda rows: [proto.transmute(r) for r in rows]  # noqa: E731
+    result = benchmark(deserialize, rows)
+    assert result == [proto.transmute(r) for r in rows]
+
+
 @pytest.mark.parametrize(argnames="mod", argvalues=(*reversed([*_MODS]),))
 def test_benchmarks_deserialize_invalid_data(benchmark, mod):
     benchmark.group = "Deserialize Invalid Data"
@@ -142,3 +227,163 @@ def test_benchmarks_translate_from_class(benchmark, mod):
     instance = typic.transmute(marsh.Model, VALID_RAW)
     valid, data = benchmark(translate, instance)
     assert valid, data
+
+
+@dataclasses.dataclass
+class Resolvable:
+    a: int
+
+
+def _local_class() -> type:
+    @dataclasses.dataclass
+    class Resolvable:
+        a: int
+
+    return Resolvable
+
+
+_RESOLVABLE = {"module": Resolvable, "local": _local_class()}
+
+
+def _resolve_time(cls: type) -> float:
+    typic.resolver.resolve(cls)
+    return min(
+        timeit.repeat(lambda: typic.resolver.resolve(cls), number=10_000, repeat=5)
+    )
+
+
+@pytest.mark.parametrize(argnames="scope", argvalues=[*_RESOLVABLE])
+def test_benchmarks_resolve(benchmark, scope):
+    benchmark.group = "Resolve Protocol"
+    benchmark.name = f"typic-{scope}-class"
+    cls = _RESOLVABLE[scope]
+    proto = benchmark(typic.resolver.resolve, cls)
+    assert proto.annotation.resolved is cls
+    if scope == "local":
+        # A class built at runtime should be looked up as fast as one in a module.
+        assert _resolve_time(cls) < _resolve_time(Resolvable) * 2
+
+
+# The time budget (in seconds) for `import typic` with lazy initialization.
+IMPORT_BUDGET = float(os.environ.get("TYPIC_IMPORT_BUDGET", "1.0"))
+_IMPORT_TIMER = (
+    "import time; start = time.perf_counter(); import typic; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def _import_time(lazy: bool) -> float:
+    env = {**os.environ, LAZY_INIT_ENV: "1" if lazy else "0"}
+    proc = subprocess.run(
+        [sys.executable, "-c", _IMPORT_TIMER],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(proc.stdout)
+
+
+@pytest.mark.parametrize(
+    argnames="lazy", argvalues=(False, True), ids=("eager", "lazy")
+)
+def test_benchmarks_import_time(benchmark, lazy):
+    benchmark.group = "Import Time"
+    benchmark.name = "typic-lazy" if lazy else "typic-eager"
+    elapsed = benchmark.pedantic(_import_time, args=(lazy,), rounds=5)
+    if lazy:
+        assert elapsed < IMPORT_BUDGET
+
+
+def _render_source(i: int) -> str:
+    with gen.Block() as main:
+        with main.f(f"generated_{i}", main.param("val")) as f:
+            for n in range(20):
+                f.l(f"val = val if val is not None else {n!r}  # line {n}")
+            f.l("return val")
+    return main.render()
+
+
+def _retained_source(retention: gen.SourceRetention) -> int:
+    cache = gen.SourceCache(retention, maxsize=100)
+    sources = [_render_source(i) for i in range(2_000)]
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for i, source in enumerate(sources):
+            cache.add(cache.filename(f"generated_{i}"), source)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        cache.clear()
+    return after - before
+
+
+@pytest.mark.parametrize(argnames="retention", argvalues=[*gen.SourceRetention])
+def test_benchmarks_source_retention(benchmark, retention):
+    benchmark.group = "Generated Source Memory"
+    benchmark.name = f"typic-{retention.value}"
+    retained = benchmark.pedantic(_retained_source, args=(retention,), rounds=3)
+    benchmark.extra_info["retained_bytes"] = retained
+    if retention is not gen.SourceRetention.ALL:
+        assert retained < _retained_source(gen.SourceRetention.ALL) / 2
+
+
+_TIMESTAMPS = [
+    (
+        datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+        + datetime.timedelta(seconds=i * 37, microseconds=i)
+    ).isoformat()
+    for i in range(100_000)
+]
+
+
+@pytest.mark.parametrize(argnames="parser", argvalues=("typic", "pendulum"))
+def test_benchmarks_timestamps(benchmark, parser):
+    benchmark.group = "Deserialize Timestamps"
+    benchmark.name = parser
+    if parser == "typic":
+        deserialize = typic.protocol(datetime.datetime).transmute_many
+    else:
+        deserialize = lambda column: [*map(pendulum.parse, column)]  # noqa: E731
+    result = benchmark(deserialize, _TIMESTAMPS)
+    assert len(result) == len(_TIMESTAMPS)
+
+
+_TEMPORALS = {
+    "datetime": [
+        datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+        + datetime.timedelta(seconds=i * 37, microseconds=i)
+        for i in range(100_000)
+    ],
+    "timedelta": [
+        datetime.timedelta(seconds=i * 37, microseconds=i) for i in range(100_000)
+    ],
+}
+
+
+def _retained_temporals(column: list) -> int:
+    serialize = typic.protocol(type(column[0])).primitive
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = [*map(serialize, column)]
+        del result
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return after - before
+
+
+@pytest.mark.parametrize(argnames="kind", argvalues=[*_TEMPORALS])
+def test_benchmarks_serialize_temporals(benchmark, kind):
+    benchmark.group = "Serialize Temporals"
+    benchmark.name = kind
+    column = _TEMPORALS[kind]
+    # Unique values must not be pinned in memory by a cache.
+    retained = _retained_temporals(column)
+    benchmark.extra_info["retained_bytes"] = retained
+    assert retained < 1_000_000
+    serialize = typic.protocol(type(column[0])).primitive
+    result = benchmark(lambda: [*map(serialize, column)])
+    assert len(result) == len(column)
@@ -102,3 +102,14 @@ def test_validate_values_nested_constraints(
     val: str, constraint: ListConstraints, expected: list
 ):
     assert constraint.validate(val) == expected
+
+
+def test_validate_values_elides_copy():
+    constraint = ListConstraints(values=ListConstraints(unique=True))
+    val = [[1], [2]]
+    assert constraint.validate(val) is val
+    val = [[1], [2, 2], [3]]
+    validated = constraint.validate(val)
+    assert validated == [[1], [2], [3]]
+    assert validated is not val
+    assert validated[0] is val[0] and validated[2] is val[2]
@@ -8,6 +8,7 @@ import pytest
 
 from typic.constraints import (
     DictConstraints,
+    ListConstraints,
     StrConstraints,
     IntContraints,
     ConstraintValueError,
@@ -108,3 +109,15 @@ def test_validate_keys_error(
 def test_syntax_error(kwargs):
     with pytest.raises(ConstraintSyntaxError):
         DictConstraints(**kwargs)
+
+
+def test_validate_elides_copy():
+    constraint = DictConstraints(values=ListConstraints(unique=True))
+    val = {"foo": [1], "bar": [2]}
+    assert constraint.validate(val) is val
+    val = {"foo": [1], "bar": [2, 2], "baz": [3]}
+    validated = constraint.validate(val)
+    assert validated == {"foo": [1], "bar": [2], "baz": [3]}
+    assert [*validated] == [*val]
+    assert validated is not val
+    assert validated["foo"] is val["foo"] and validated["baz"] is val["baz"]
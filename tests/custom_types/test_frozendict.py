@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import pickle
 
 import pytest
 
@@ -47,3 +48,7 @@ def test_deepcopy():
     assert copy.deepcopy(test_dict) == test_dict
     assert copy.deepcopy(test_dict) is not test_dict
     assert copy.deepcopy(test_dict)["loo"] is not test_dict["loo"]
+
+
+def test_pickle():
+    assert pickle.loads(pickle.dumps(test_dict)) == test_dict
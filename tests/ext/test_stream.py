@@ -0,0 +1,194 @@
+import dataclasses
+import io
+import json
+
+import pytest
+
+import typic
+
+
+@dataclasses.dataclass
+class Record:
+    id: int
+    name: str = ""
+
+
+RECORDS = [Record(id=i, name=f"name- {i}") for i in range(50)]
+RAW = [dataclasses.asdict(r) for r in RECORDS]
+
+
+def ndjson(records, binary):
+    data = "\n".join(json.dumps(r, ensure_ascii=False) for r in records) + "\n"
+    return io.BytesIO(data.encode()) if binary else io.StringIO(data)
+
+
+def array(records, binary):
+    data = json.dumps(records, indent=2, ensure_ascii=False)
+    return io.BytesIO(data.encode()) if binary else io.StringIO(data)
+
+
+@pytest.mark.parametrize(argnames="binary", argvalues=[True, False])
+@pytest.mark.parametrize(argnames="chunk_size", argvalues=[1, 7, 4096])
+@pytest.mark.parametrize(
+    argnames="format,stream", argvalues=[("ndjson", ndjson), ("array", array)]
+)
+def test_iterdecode(format, stream, chunk_size, binary):
+    # Given
+    fp = stream(RAW, binary)
+    # When
+    decoded = typic.iterdecode(Record, fp, format=format, chunk_size=chunk_size)
+    # Then
+    assert [*decoded] == RECORDS
+    assert decoded.errors == []
+
+
+def test_iterdecode_array_large_record():
+    # Given
+    record = {"id": 1, "name": "x" * 100_000}
+    fp = array([record, record], True)
+    reads = []
+    read = fp.read
+    fp.read = lambda n: reads.append(n) or read(n)
+    # When
+    decoded = typic.iterdecode(Record, fp, format="array", chunk_size=16)
+    # Then
+    assert [*decoded] == [Record(**record)] * 2
+    # Refills grow with the record, rather than one chunk at a time.
+    assert len(reads) < 50
+
+
+@pytest.mark.parametrize(
+    argnames="format,stream", argvalues=[("ndjson", ndjson), ("array", array)]
+)
+def test_iterdecode_lazy(format, stream):
+    # Given
+    fp = stream(RAW, True)
+    decoded = typic.iterdecode(Record, fp, format=format, chunk_size=16)
+    # When
+    first = next(decoded)
+    # Then
+    assert first == RECORDS[0]
+    assert fp.tell() < len(fp.getvalue())
+
+
+@pytest.mark.parametrize(argnames="scalar", argvalues=["12345", "-1.5e10", "true"])
+def test_iterdecode_array_scalar_boundary(scalar):
+    # Given
+    fp = io.StringIO(f"[{scalar}, {scalar}]")
+    # When
+    decoded = typic.iterdecode(str, fp, format="array", chunk_size=2)
+    # Then
+    assert [*decoded] == [str(json.loads(scalar))] * 2
+
+
+@pytest.mark.parametrize(
+    argnames="format,stream", argvalues=[("ndjson", ndjson), ("array", array)]
+)
+def test_iterdecode_errors(format, stream):
+    # Given
+    raw = [*RAW[:2], {"id": "foo"}, *RAW[2:4]]
+    # When
+    skipped = typic.iterdecode(Record, stream(raw, True), format=format, errors="skip")
+    collected = typic.iterdecode(
+        Record, stream(raw, True), format=format, errors="collect"
+    )
+    raised = typic.iterdecode(Record, stream(raw, True), format=format)
+    # Then
+    assert [*skipped] == RECORDS[:4]
+    assert skipped.errors == []
+    assert [*collected] == RECORDS[:4]
+    assert [e.index for e in collected.errors] == [2]
+    assert isinstance(collected.errors[0].error, ValueError)
+    with pytest.raises(ValueError):
+        [*raised]
+
+
+def test_iterdecode_ndjson_malformed():
+    # Given
+    fp = io.BytesIO(b'{"id": 1}\n{"id": \n\n{"id": 2}\n')
+    # When
+    decoded = typic.iterdecode(Record, fp, errors="collect")
+    # Then
+    assert [*decoded] == [Record(id=1), Record(id=2)]
+    assert [(e.index, e.raw) for e in decoded.errors] == [(1, b'{"id": ')]
+
+
+@pytest.mark.parametrize(argnames="data", argvalues=['{"id": 1}', '[{"id": 1} {}]'])
+def test_iterdecode_array_malformed(data):
+    # Given
+    fp = io.StringIO(data)
+    # When
+    decoded = typic.iterdecode(Record, fp, format="array", errors="skip")
+    # Then
+    with pytest.raises(ValueError):
+        [*decoded]
+
+
+@pytest.mark.parametrize(
+    argnames="kwargs",
+    argvalues=[{"format": "csv"}, {"errors": "ignore"}, {"chunk_size": 0}],
+)
+def test_iterdecode_invalid_options(kwargs):
+    with pytest.raises(ValueError):
+        typic.iterdecode(Record, io.StringIO(""), **kwargs)
+
+
+@dataclasses.dataclass
+class Page:
+    items: list
+    total: int
+
+
+@pytest.mark.parametrize(
+    argnames="obj",
+    argvalues=[
+        RECORDS,
+        (*RECORDS,),
+        RECORDS[0],
+        Page(items=RECORDS, total=len(RECORDS)),
+        {"records": RECORDS, "none": None, "é": "ü"},
+        {},
+        [],
+        "string",
+        1,
+        None,
+    ],
+)
+@pytest.mark.parametrize(argnames="chunk_size", argvalues=[1, 64, 4096])
+def test_tojson_iter(obj, chunk_size):
+    # When
+    chunks = [*typic.tojson_iter(obj, chunk_size=chunk_size)]
+    # Then
+    assert json.loads(b"".join(chunks)) == json.loads(typic.tojson(obj))
+    assert all(len(c) >= chunk_size for c in chunks[:-1])
+
+
+def test_tojson_iter_non_str_keys():
+    assert b"".join(typic.tojson_iter({1: 1, None: 2})) == b'{"1":1,"null":2}'
+
+
+def test_tojson_iter_lazy():
+    # Given
+    consumed = []
+
+    def records():
+        for i in range(10_000):
+            consumed.append(i)
+            yield Record(id=i)
+
+    # When
+    chunks = typic.tojson_iter(records(), chunk_size=64)
+    first = next(chunks)
+    # Then
+    assert first.startswith(b'[{"id":0')
+    assert len(consumed) < 10_000
+
+
+@pytest.mark.parametrize(argnames="fp", argvalues=[io.BytesIO(), io.StringIO()])
+def test_dump(fp):
+    # When
+    written = typic.dump(RECORDS, fp, chunk_size=128)
+    # Then
+    fp.seek(0)
+    assert [*typic.iterdecode(Record, fp, format="array")] == RECORDS
+    assert written == len(typic.tojson(RECORDS))
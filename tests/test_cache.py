@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import dataclasses
+import gc
+import weakref
+from typing import Dict, List, Tuple
+
+import pytest
+
+import typic
+from typic import checks, util
+from typic.cache import CacheRegistry, LRUCache, caches, references, weakcache
+from typic.serde.resolver import Resolver
+
+
+@dataclasses.dataclass
+class Cached:
+    a: int
+
+
+@dataclasses.dataclass
+class Other:
+    a: str
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    cache["c"] = 3
+    assert [*cache] == ["a", "c"]
+    assert cache.get("b") is None
+    assert cache.cache_info() == (1, 1, 2, 2)
+    cache.maxsize = 1
+    assert [*cache] == ["c"]
+
+
+@pytest.mark.parametrize(
+    argnames=("obj", "expected"),
+    argvalues=[
+        (Cached, True),
+        (List[Cached], True),
+        ((Dict[str, List[Cached]], None), True),
+        (frozenset((Cached,)), True),
+        (List[Other], False),
+        ((Other, "Cached"), False),
+    ],
+)
+def test_references(obj, expected):
+    assert references(obj, Cached) is expected
+
+
+def test_memoize_bound():
+    registry = CacheRegistry(maxsize=2)
+    calls = []
+
+    @registry.memoize("double")
+    def double(val):
+        calls.append(val)
+        return val * 2
+
+    assert [double(i) for i in (1, 2, 1, 3, 1, 2)] == [2, 4, 2, 6, 2, 4]
+    # Only the least-recently-used result is evicted once the cache is full.
+    assert calls == [1, 2, 3, 2]
+    assert registry.info()["double"].currsize == 2
+
+
+def test_memoize_unbounded():
+    registry = CacheRegistry(maxsize=2)
+
+    @registry.memoize("names", bounded=False)
+    def name(val):
+        return f"name_{val}"
+
+    assert [name(i) for i in range(4)] == [f"name_{i}" for i in range(4)]
+    registry.configure(1)
+    assert registry.info()["names"].currsize == 4
+    assert registry.info()["names"].maxsize is None
+
+
+def test_registry_configure_and_clear():
+    registry = CacheRegistry()
+    cache = registry.cache("items")
+    other = registry.cache("items")
+    cache[(Cached, 1)] = 1
+    cache[(Other, 2)] = 2
+    cache[(List[Cached], 3)] = 3
+    assert [*registry.info()] == ["items", "items[2]"]
+    assert registry.clear(Cached) == ("items",)
+    assert [*cache] == [(Other, 2)]
+    registry.configure(0)
+    assert registry.info()["items"].maxsize == other.maxsize == 0
+    assert not cache
+
+
+def test_cache_clear_type():
+    proto = typic.protocol(Cached)
+    typic.protocol(List[Cached])
+    other = typic.protocol(Other)
+    assert typic.protocol(Cached) is proto
+    cleared = typic.cache_clear(Cached)
+    assert {"resolver.protocol", "des.factory", "ser.factory"} <= {*cleared}
+    assert typic.protocol(Cached) is not proto
+    # Compiled artifacts for other types are re-used.
+    assert typic.protocol(Other).serialize is other.serialize
+    assert typic.transmute(Cached, {"a": "1"}) == Cached(1)
+
+
+def test_cache_info():
+    info = typic.cache_info()
+    assert {
+        "resolver.resolve",
+        "resolver.protocol",
+        "des.factory",
+        "ser.factory",
+        "constraints.factory",
+        "translator.compile",
+    } <= {*info}
+    typic.protocol(Cached)
+    typic.protocol(Cached)
+    assert typic.cache_info()["resolver.resolve"].hits > info["resolver.resolve"].hits
+
+
+def _init(self, a: int):
+    self.a = a
+
+
+def _dynamic_class() -> type:
+    return type("Dynamic", (), {"__annotations__": {"a": int}, "__init__": _init})
+
+
+def test_weakcache_releases_dynamic_classes():
+    cls = _dynamic_class()
+    util.cached_type_hints(cls)
+    util.cached_signature(cls)
+    util.safe_get_params(cls)
+    util.cached_simple_attributes(cls)
+    util.get_qualname(cls)
+    checks.isbuiltinsubtype(cls)
+    ref = weakref.ref(cls)
+    del cls
+    gc.collect()
+    assert ref() is None
+
+
+def _use_closure(use) -> Tuple[weakref.ref, weakref.ref]:
+    # Forward references are resolved from the calling frames, so the objects are
+    #   only ever bound in this frame, rather than the test's.
+    Dynamic = dataclasses.make_dataclass("Dynamic", [("a", int)])
+
+    def func(a: int, dyn: Dynamic) -> Dynamic:
+        return dyn
+
+    use(func, Dynamic)
+    use(func, Dynamic)
+    return weakref.ref(func), weakref.ref(Dynamic)
+
+
+@pytest.mark.parametrize(
+    argnames="use",
+    argvalues=[
+        lambda func, cls: typic.wrap(func)(1, {"a": "1"}),
+        lambda func, cls: typic.bind(func, 1, {"a": "1"}),
+        lambda func, cls: typic.resolver.protocols(func),
+        lambda func, cls: typic.resolver.resolve(cls),
+        lambda func, cls: typic.transmute(cls, {"a": "1"}),
+    ],
+    ids=["wrap", "bind", "protocols", "resolve", "transmute"],
+)
+def test_caches_release_dynamic_objects(use):
+    refs = _use_closure(use)
+    gc.collect()
+    assert [r() for r in refs] == [None, None]
+
+
+def test_caches_keep_live_dynamic_objects():
+    cls = dataclasses.make_dataclass("Dynamic", [("a", int)])
+    typic.resolver.resolve(cls)
+    hints = util.cached_type_hints(cls)
+    misses = caches.info()["resolver.resolve"].misses
+    gc.collect()
+    # Entries for an object which is still alive are put back after a collection.
+    typic.resolver.resolve(cls)
+    assert caches.info()["resolver.resolve"].misses == misses
+    assert util.cached_type_hints(cls) is hints
+
+
+def _use_resolver() -> weakref.ref:
+    resolver = Resolver(lazy=True)
+    resolver.transmute(Cached, {"a": "1"})
+    resolver.primitive(Cached(1))
+    resolver.protocols(Other)
+    return weakref.ref(resolver)
+
+
+def test_registry_releases_resolver_caches():
+    gc.collect()
+    names = {*caches.info()}
+    ref = _use_resolver()
+    gc.collect()
+    assert ref() is None
+    assert {*caches.info()} == names
+
+
+def _churn(n: int):
+    for _ in range(n):
+        cls = _dynamic_class()
+        util.origin(cls)
+        util.get_args(cls)
+        util.get_unique_name(cls)
+        util.resolve_supertype(cls)
+        checks.isenumtype(cls)
+        checks.istypeddict(cls)
+
+
+def test_weakcache_memory_is_flat():
+    _churn(1_000)
+    gc.collect()
+    before = len(gc.get_objects())
+    _churn(100_000)
+    gc.collect()
+    # Allow for some incidental allocations, but not one per class.
+    assert len(gc.get_objects()) - before < 1_000
+
+
+def test_weakcache_fallback():
+    calls = []
+
+    @weakcache
+    def ident(obj):
+        calls.append(obj)
+        return obj
+
+    assert ident("foo") == ident("foo") == "foo"
+    assert ident((int, str)) == ident((int, str))
+    assert calls == ["foo", (int, str)]
@@ -0,0 +1,156 @@
+import linecache
+import os
+import subprocess
+import sys
+import traceback
+
+import pytest
+
+import typic
+from typic import gen
+from typic.__main__ import main
+
+
+@pytest.fixture
+def code_cache(tmp_path, monkeypatch):
+    cache = gen.CodeCache(tmp_path)
+    monkeypatch.setattr(gen, "code_cache", cache)
+    return cache
+
+
+def test_code_cache_roundtrip(code_cache, tmp_path):
+    with gen.Block() as main_:
+        with main_.f("foo") as f:
+            f.l("return 1")
+    foo = main_.compile(name="foo")
+    assert foo() == 1
+    assert code_cache.misses == 1
+    assert code_cache.save() == 1
+
+    fresh = gen.CodeCache(tmp_path)
+    code = fresh.get(foo.__code__.co_filename, gen.getsource(foo))
+    assert code is not None
+    assert fresh.hits == 1
+
+
+def test_code_cache_disabled():
+    cache = gen.CodeCache()
+    assert not cache.enabled
+    assert cache.get("<typical generated foo>", "") is None
+    assert cache.misses == 0
+
+
+def test_compile_cli(code_cache, capsys):
+    assert main(["compile", "tests.objects"]) == 0
+    assert code_cache.bundle.exists()
+    assert "Wrote" in capsys.readouterr().out
+
+
+def test_compile_cli_no_cache(monkeypatch):
+    monkeypatch.setattr(gen, "code_cache", gen.CodeCache())
+    with pytest.raises(SystemExit):
+        main(["compile", "tests.objects"])
+
+
+def test_rehydrate_from_cache(tmp_path):
+    env = {**os.environ, gen.CODE_CACHE_ENV: str(tmp_path)}
+    script = "from typic import gen; import tests.objects; print(gen.code_cache.misses)"
+    subprocess.run(
+        [sys.executable, "-W", "ignore", "-m", "typic", "compile", "tests.objects"],
+        env={**env, "PYTHONHASHSEED": "1"},
+        check=True,
+        capture_output=True,
+    )
+    proc = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", script],
+        env={**env, "PYTHONHASHSEED": "2"},
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert proc.stdout.strip() == "0"
+
+
+def test_defname_is_sequential():
+    first = typic.util.get_defname("test_defname", object())
+    second = typic.util.get_defname("test_defname", object())
+    assert first != second
+    assert first.rsplit("_", 1)[0] == second.rsplit("_", 1)[0] == "test_defname"
+
+
+def _compile_failing(name: str):
+    with gen.Block() as main_:
+        with main_.f(name) as f:
+            f.l("raise ValueError('boom')")
+    return main_.compile(name=name)
+
+
+def _failing_line(func) -> str:
+    try:
+        func()
+    except ValueError as e:
+        return traceback.extract_tb(e.__traceback__)[-1].line
+    raise AssertionError("Expected a ValueError.")  # pragma: nocover
+
+
+@pytest.mark.parametrize(argnames="retention", argvalues=[*gen.SourceRetention])
+def test_source_retention_traceback(retention, monkeypatch):
+    monkeypatch.setattr(gen, "source_cache", gen.SourceCache(retention))
+    func = _compile_failing("failing")
+    assert _failing_line(func) == "raise ValueError('boom')"
+    assert "def failing():" in gen.getsource(func)
+    assert hasattr(func, "__raw__") is (retention is gen.SourceRetention.ALL)
+
+
+def test_source_retention_lazy_expands_once(monkeypatch):
+    monkeypatch.setattr(gen, "source_cache", gen.SourceCache(gen.SourceRetention.LAZY))
+    func = _compile_failing("compressed")
+    expanded = []
+    decompress = gen.zlib.decompress
+    monkeypatch.setattr(
+        gen.zlib, "decompress", lambda b: expanded.append(b) or decompress(b)
+    )
+    assert _failing_line(func) == "raise ValueError('boom')"
+    assert "def compressed():" in gen.getsource(func)
+    assert len(expanded) == 1
+
+
+def test_source_retention_lru_evicts(monkeypatch):
+    cache = gen.SourceCache(gen.SourceRetention.LRU, maxsize=2)
+    monkeypatch.setattr(gen, "source_cache", cache)
+    funcs = [_compile_failing("evicted") for _ in range(3)]
+    filenames = [f.__code__.co_filename for f in funcs]
+    assert len({*filenames}) == 3
+    assert filenames[0] not in linecache.cache
+    assert gen.getsource(funcs[0]) is None
+    assert "def evicted():" in gen.getsource(funcs[-1])
+    assert _failing_line(funcs[-1]) == "raise ValueError('boom')"
+    cache.clear()
+    assert filenames[-1] not in linecache.cache
+
+
+def test_source_retention_lru_refreshes(monkeypatch):
+    cache = gen.SourceCache(gen.SourceRetention.LRU, maxsize=2)
+    monkeypatch.setattr(gen, "source_cache", cache)
+    first, second = _compile_failing("first"), _compile_failing("second")
+    # Reading the source for a traceback marks it as recently used.
+    assert _failing_line(first) == "raise ValueError('boom')"
+    _compile_failing("third")
+    assert first.__code__.co_filename in linecache.cache
+    assert second.__code__.co_filename not in linecache.cache
+    cache.clear()
+
+
+def test_warmup():
+    from tests import objects
+
+    report = typic.warmup(
+        objects.E, objects.ABs, include_translators=True, include_schema=True
+    )
+    assert {objects.E, objects.D, objects.F, objects.G, objects.A, objects.B} <= {
+        *report
+    }
+    assert all(s.protocol_ns > 0 for s in report.values())
+    assert report[objects.E].schema_ns > 0
+    for proto in typic.protocols(objects.F).values():
+        assert getattr(proto, "_resolved", True)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import typic
+from typic.serde.resolver import DelayedSerdeProtocol
+
+
+def _models(n: int) -> List[type]:
+    models = []
+    for i in range(n):
+        leaf = dataclasses.make_dataclass(f"Leaf{i}", [("a", int), ("b", str)])
+        node = dataclasses.make_dataclass(
+            f"Node{i}",
+            [
+                ("leaf", leaf),
+                ("leaves", List[leaf]),  # type: ignore
+                ("child", Optional[f"Node{i}"], dataclasses.field(default=None)),
+            ],
+        )
+        # Forward references are resolved against the module namespace.
+        node.__module__ = leaf.__module__ = __name__
+        globals()[node.__name__] = node
+        models.append(node)
+    return models
+
+
+def _transmute(model: type):
+    proto = typic.protocol(model)
+    assert not isinstance(proto, DelayedSerdeProtocol)
+    return proto.transmute(
+        {
+            "leaf": {"a": "1", "b": 2},
+            "leaves": [{"a": "3", "b": 4}],
+            "child": {"leaf": {"a": "5", "b": 6}, "leaves": []},
+        }
+    )
+
+
+def test_concurrent_resolution():
+    models = _models(50)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = [*pool.map(_transmute, models * 4)]
+    for model, result in zip(models * 4, results):
+        assert isinstance(result, model)
+        assert result.leaf.a == 1 and result.leaf.b == "2"
+        assert result.leaves[0].a == 3
+        assert isinstance(result.child, model)
+        assert result.child.leaf.a == 5
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import List
+
+import typic
+from typic.serde.profiler import Profiler
+
+
+@dataclasses.dataclass
+class Profiled:
+    a: int
+    b: List[int]
+
+
+def test_profile_records_protocol_calls():
+    with typic.profile():
+        proto = typic.protocol(Profiled)
+        instance = proto.transmute({"a": "1", "b": ["2"]})
+        proto.primitive(instance)
+        proto.primitive(instance)
+        typic.protocol(Profiled).transmute({"a": "1", "b": ["2"]})
+
+    # Recording stops when the window closes.
+    proto.transmute({"a": "1", "b": ["2"]})
+    stats = typic.stats()
+    assert stats["Profiled"]["deserialize"].calls == 2
+    assert stats["Profiled"]["serialize"].calls == 2
+    assert stats["Profiled"]["deserialize"].total_ns > 0
+    assert stats["Profiled"]["deserialize"].mean_ns > 0
+
+
+@dataclasses.dataclass
+class Cached:
+    a: int
+
+
+def test_profile_instruments_cached_protocols():
+    proto = typic.protocol(Cached)
+    deserialize, primitive = proto.deserialize, proto.primitive
+    with typic.profile():
+        assert proto.transmute is not deserialize
+        typic.transmute(Cached, {"a": "1"})
+        typic.primitive(Cached(1))
+    # The original functions are restored when the window closes.
+    assert proto.deserialize is proto.transmute is deserialize
+    assert proto.primitive is primitive
+    stats = typic.stats()
+    assert stats["Cached"]["deserialize"].calls == 1
+    assert stats["Cached"]["serialize"].calls == 1
+
+
+def test_profile_swaps_registered_protocols():
+    profiler = Profiler(enabled=False)
+
+    @dataclasses.dataclass
+    class Proto:
+        deserialize: object
+        serialize: object
+        validate: object
+
+        def __post_init__(self):
+            self.transmute = self.deserialize
+            self.primitive = self.serialize
+
+    def func(val):
+        return val
+
+    proto = Proto(func, func, func)
+    profiler.register(proto, label="func")
+    with profiler.profile():
+        assert proto.transmute(1) == 1
+        assert proto.transmute.__wrapped__ is func
+    assert proto.transmute is func
+    proto.transmute(1)
+    assert profiler.stats()["func"]["deserialize"].calls == 1
+    profiler.reset()
+    assert profiler.stats() == {}
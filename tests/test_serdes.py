@@ -4,13 +4,19 @@ import dataclasses
 import datetime
 import decimal
 import enum
+import gc
+import inspect
 import ipaddress
 import json
+import multiprocessing
+import pickle
 import re
 import typing
+import weakref
 from types import MappingProxyType
 from typing import ClassVar, Optional, Dict, TypeVar, Generic, List, Mapping
 
+import pendulum
 import pytest
 import ujson
 
@@ -19,6 +25,8 @@ import typic.api
 import typic.common
 import typic.ext.json
 from tests import objects
+from typic.serde import iso
+from typic.serde.common import DelayedSerdeProtocol
 
 
 @typic.klass
@@ -83,6 +91,16 @@ class SubURL(typic.URL): ...
             ),
             "1970-01-01T00:00:00+01:00",
         ),
+        (
+            datetime.datetime(1969, 12, 31, 23, tzinfo=datetime.timezone.utc),
+            "1969-12-31T23:00:00+00:00",
+        ),
+        (datetime.date(1970, 1, 1), "1970-01-01"),
+        (datetime.time(1, 2, 3, 4), "01:02:03.000004"),
+        (datetime.timedelta(days=10, seconds=3661), "P0Y0M10DT1H1M1S"),
+        (datetime.timedelta(microseconds=5), "P0Y0M0DT0H0M0.000005S"),
+        (datetime.timedelta(seconds=-1), "-P0Y0M0DT0H0M1S"),
+        (pendulum.duration(years=1, months=2, days=10), "P1Y2M10DT0H0M0S"),
         (objects.Typic(var="foo"), {"var": "foo"}),
         # (objects.Data(foo="foo"), {"foo": "foo"}),
         (objects.FromDict(), {"foo": None}),
@@ -112,6 +130,30 @@ def test_primitive(obj, expected):
     assert isinstance(primitive, type(expected))
 
 
+@pytest.mark.parametrize(
+    argnames="obj",
+    argvalues=[
+        datetime.timedelta(days=10, seconds=3661, microseconds=5),
+        datetime.timedelta(days=400),
+        pendulum.duration(years=1, months=2, days=10, hours=3),
+        datetime.timedelta(seconds=-1),
+        datetime.timedelta(days=-10, seconds=3661, microseconds=5),
+        -pendulum.duration(years=1, months=2, days=10, hours=3),
+    ],
+    ids=repr,
+)
+def test_timedelta_roundtrip(obj):
+    assert typic.transmute(type(obj), typic.primitive(obj)) == obj
+
+
+def test_isoduration_memoized(monkeypatch):
+    monkeypatch.setenv("TYPIC_DATETIME_CACHE", "10")
+    isoduration = iso._memoize(typic.util.isoduration, typed=True)
+    assert isoduration(datetime.timedelta(days=365)) == "P0Y0M365DT0H0M0S"
+    assert isoduration(pendulum.duration(years=1)) == "P1Y0M0DT0H0M0S"
+    assert isoduration.cache_info().currsize == 2
+
+
 class MultiNum(enum.Enum):
     INT = 1
     STR = "str"
@@ -539,3 +581,517 @@ def test_routine_protocol():
         proto.serialize(foo)
 
     assert list(proto.iterate(foo)) == [None]
+
+
+@pytest.mark.parametrize(
+    argnames="t,rows,expected",
+    argvalues=[
+        (int, ["1", 2.0, b"3"], [1, 2, 3]),
+        (
+            objects.Data,
+            [{"foo": "bar"}, {"foo": 1}],
+            [objects.Data("bar"), objects.Data("1")],
+        ),
+        (objects.Data, '[{"foo": "bar"}]', [objects.Data("bar")]),
+        (objects.A, [{"b": {}}, {}], [objects.A(objects.B()), objects.A()]),
+    ],
+)
+def test_transmute_many(t, rows, expected):
+    assert typic.transmute_many(t, rows) == expected
+    assert typic.protocol(t).transmute_many(rows) == expected
+
+
+@pytest.mark.parametrize(argnames="rows", argvalues=["foo", b"123", '{"foo": 1}'])
+def test_transmute_many_rejects_string_of_non_array(rows):
+    with pytest.raises(ValueError):
+        typic.transmute_many(int, rows)
+
+
+@pytest.mark.parametrize(
+    argnames="t,row",
+    argvalues=[(objects.Nested, {"data": {"foo": 1}}), (objects.A, {"b": {}})],
+)
+def test_transmute_many_matches_transmute(t, row):
+    # Rows with every field take the inlined path, the rest the row deserializer.
+    proto = typic.protocol(t)
+    rows = [row, {**row, "extra": None}, proto.transmute(row), json.dumps(row)]
+    expected = [*map(proto.transmute, rows)]
+    assert proto.transmute_many(rows) == expected
+    assert [*proto.transmute_many(rows, lazy=True)] == expected
+
+
+def test_transmute_many_lazy():
+    rows = ({"foo": x} for x in range(3))
+    result = typic.transmute_many(objects.Data, rows, lazy=True)
+    assert not isinstance(result, list)
+    assert [*result] == [objects.Data(str(x)) for x in range(3)]
+
+
+@pytest.mark.parametrize(
+    argnames="t",
+    argvalues=[objects.Data, objects.NestedSeq, Optional[objects.Nested], objects.A],
+)
+def test_protocol_pickles_by_reference(t):
+    proto = typic.protocol(t)
+    assert pickle.loads(pickle.dumps(proto)) is proto
+
+
+# The protocols are resolved before the child is defined, so its protocol is delayed.
+@typic.klass
+class Pickled:
+    child: Optional["PickledChild"] = None
+
+
+@dataclasses.dataclass
+class PickledChild:
+    value: int = 0
+
+
+def test_delayed_protocol_pickles_unresolved():
+    proto = typic.protocols(Pickled)["child"]
+    assert isinstance(proto, DelayedSerdeProtocol) and not proto._resolved
+    restored = pickle.loads(pickle.dumps(proto))
+    assert isinstance(restored, DelayedSerdeProtocol)
+    assert not proto._resolved and not restored._resolved
+    assert restored.transmute({"value": "1"}) == PickledChild(1)
+    assert not proto._resolved
+
+
+@pytest.mark.parametrize(argnames="start_method", argvalues=["fork", "spawn"])
+def test_transmute_parallel(start_method):
+    rows = ({"foo": x} for x in range(100))
+    result = typic.transmute_parallel(
+        objects.Data,
+        rows,
+        workers=2,
+        chunksize=7,
+        mp_context=multiprocessing.get_context(start_method),
+    )
+    assert result == [objects.Data(str(x)) for x in range(100)]
+
+
+def test_transmute_parallel_invalid():
+    rows = [{"short": "fine", "large": 1001}] * 20
+    rows[16] = {"short": "way too long", "large": 1001}
+    with pytest.raises(typic.ParallelTransmuteError) as info:
+        typic.transmute_parallel(
+            objects.Constrained,
+            rows,
+            workers=2,
+            chunksize=7,
+            mp_context=multiprocessing.get_context("fork"),
+        )
+    assert info.value.index == 16
+    assert info.value.kind.endswith("ConstraintValueError")
+    assert "way too long" in info.value.message
+
+
+def test_transmute_parallel_invalid_single_chunk():
+    rows = [{"short": "fine", "large": 1001}] * 20
+    rows[16] = {"short": "way too long", "large": 1001}
+    with pytest.raises(typic.constraints.ConstraintValueError) as info:
+        typic.transmute_parallel(objects.Constrained, rows, chunksize=100)
+    with pytest.raises(info.type, match=re.escape(str(info.value))):
+        typic.protocol(objects.Constrained).transmute(rows[16])
+
+
+def test_transmute_parallel_single_chunk():
+    rows = [{"foo": x} for x in range(3)]
+    assert typic.transmute_parallel(objects.Data, rows) == [
+        objects.Data(str(x)) for x in range(3)
+    ]
+
+
+def test_klass_transmute_many():
+    assert objects.A.transmute_many([{}, {"b": None}]) == [objects.A(), objects.A()]
+
+
+def test_validate_many():
+    Positive = typic.constrained(gt=0)(int)
+    assert typic.validate_many(Positive, [1, 2]) == [1, 2]
+    with pytest.raises(typic.constraints.ConstraintValueError):
+        typic.validate_many(Positive, [1, -1])
+
+
+def test_check():
+    Positive = typic.constrained(gt=0)(int)
+    proto = typic.protocol(List[Positive], is_strict=True)
+    result = proto.check([1, 2])
+    assert result and result.value == [1, 2]
+    assert result.message is None
+    result = proto.check([1, -1])
+    assert not result
+    assert result.value == -1
+    assert result.path.endswith("[1]")
+    assert "value <-1> fails constraints" in result.message
+    assert not typic.check(Positive, -1)
+
+
+@pytest.mark.parametrize(
+    argnames="t,value,path",
+    argvalues=[
+        (List[List[int]], [[1], [2, "3"]], "list[1][1]"),
+        (typing.Tuple[int, str], (1, 2), "tuple[1]"),
+        (Dict[str, List[int]], {"a": [1, "2"]}, "dict['a'][1]"),
+        (Dict[str, typing.Union[int, bytes]], {"a": "2"}, "dict['a']"),
+    ],
+)
+def test_check_nested_does_not_raise(monkeypatch, t, value, path):
+    def fail(*args, **kwargs):
+        raise AssertionError("check() raised internally.")
+
+    proto = typic.protocol(t, is_strict=True)
+    monkeypatch.setattr(typic.constraints.ConstraintValueError, "__init__", fail)
+    result = proto.check(value)
+    assert not result
+    assert result.path == path
+
+
+def test_constraint_error_pickles():
+    Positive = typic.constrained(gt=0)(int)
+    with pytest.raises(typic.constraints.ConstraintValueError) as info:
+        typic.validate(Positive, -1)
+    err = info.value
+    assert err.args == (err.result.message,)
+    assert str(err) == err.result.message
+    restored = pickle.loads(pickle.dumps(err))
+    assert restored.args == err.args
+    assert restored.result is None
+
+
+def test_structural_protocol_sharing():
+    @dataclasses.dataclass
+    class Shared:
+        a: str
+        b: str
+        c: Optional[int] = None
+        d: Optional[int] = None
+        e: int = 1
+        f: int = 2
+
+    protos = typic.protocols(Shared)
+    assert protos["a"].deserialize is protos["b"].deserialize
+    assert protos["a"].serialize is protos["b"].serialize
+    assert protos["c"].deserialize is protos["d"].deserialize
+    assert protos["c"].serialize is protos["d"].serialize
+    # Defaults are a part of the signature.
+    assert protos["e"].deserialize is not protos["f"].deserialize
+    assert typic.transmute(Shared, {"a": 1, "b": 2, "c": "3"}) == Shared("1", "2", 3)
+
+
+class Opaque:
+    __hash__ = None  # type: ignore
+
+    def __repr__(self):
+        return "Opaque()"
+
+
+def test_signature_unhashable_default_by_identity():
+    def annotation(default):
+        parameter = inspect.Parameter(
+            "_", inspect.Parameter.POSITIONAL_OR_KEYWORD, default=default
+        )
+        return typic.resolver.annotation(list, parameter=parameter)
+
+    first, second = Opaque(), Opaque()
+    # Distinct defaults may share a repr, but never a protocol.
+    assert annotation(first).signature() != annotation(second).signature()
+    assert annotation(first).signature() == annotation(first).signature()
+
+
+def _strict_protocol(fused: bool):
+    klass = typic.klass(strict=True, always=False, serde=typic.flags(fused=fused))
+
+    @klass
+    class Inner:
+        a: int
+        b: Optional[str] = None
+
+    @klass
+    class Outer:
+        id: int
+        inner: Optional[Inner] = None
+        inners: List[Inner] = dataclasses.field(default_factory=list)
+
+    return typic.protocol(Outer, is_strict=True)
+
+
+@pytest.mark.parametrize(
+    argnames="value",
+    argvalues=[
+        {"id": 1},
+        {"id": 1, "inner": {"a": 1, "b": "b"}, "inners": [{"a": 2}]},
+        {"id": "1"},
+        {"id": 1, "extra": 2},
+        {"inner": {"a": 1}},
+        {"id": 1, "inner": {"a": "1"}},
+        {"id": 1, "inners": [{"a": 1, "b": 2}]},
+        None,
+    ],
+)
+def test_strict_fused(value):
+    protocol, fused = _strict_protocol(False), _strict_protocol(True)
+    assert fused.transmute is not protocol.transmute
+    try:
+        expected = repr(protocol.transmute(value))
+    except (TypeError, ValueError) as e:
+        with pytest.raises(e.__class__) as err:
+            fused.transmute(value)
+        # Nested constraints may be delayed, so just compare the error itself.
+        assert str(err.value).split(" fails ")[0] == str(e).split(" fails ")[0]
+    else:
+        assert repr(fused.transmute(value)) == expected
+
+
+@dataclasses.dataclass
+class Inlined:
+    a: int
+    b: str
+    c: Optional[float] = None
+    d: bool = False
+
+
+@pytest.mark.parametrize(
+    argnames="annotation,value,expected",
+    argvalues=[
+        (List[int], [1, "2", 3.0, True], [1, 2, 3, 1]),
+        (Dict[str, int], {"a": 1, 2: "2"}, {"a": 1, "2": 2}),
+        (Dict[int, bool], {1: True, "2": 0}, {1: True, 2: False}),
+        (
+            Inlined,
+            {"a": "1", "b": 2, "c": 3, "d": 1},
+            Inlined(a=1, b="2", c=3.0, d=True),
+        ),
+        (Inlined, {"a": 1, "b": "b", "c": None}, Inlined(a=1, b="b")),
+    ],
+)
+def test_inlined_child_deserializers(annotation, value, expected):
+    assert typic.transmute(annotation, value) == expected
+
+
+@dataclasses.dataclass
+class Unrolled:
+    field_a: int
+    field_b: Optional[str] = None
+
+
+@typic.klass
+class UnrolledKlass:
+    field_a: int
+    field_b: Optional[str] = None
+
+
+@typic.klass(serde=typic.flags(case=typic.common.Case.CAMEL))
+class UnrolledCamel:
+    field_a: int
+    field_b: Optional[str] = None
+
+
+@pytest.mark.parametrize(
+    argnames="cls,value",
+    argvalues=[
+        (Unrolled, {"field_a": "1", "field_b": 2}),
+        (Unrolled, {"field_a": "1", "field_b": 2, "extra": 3}),
+        (UnrolledKlass, {"field_a": "1", "field_b": 2}),
+        (UnrolledKlass, {"field_a": "1", "field_b": 2, "extra": 3}),
+        (UnrolledCamel, {"fieldA": "1", "fieldB": 2}),
+    ],
+)
+def test_unrolled_user_type(cls, value):
+    assert typic.transmute(cls, value) == cls(field_a=1, field_b="2")
+    partial = {k: v for k, v in value.items() if k.lower() != "fieldb"}
+    partial.pop("field_b", None)
+    assert typic.transmute(cls, partial) == cls(field_a=1)
+
+
+@dataclasses.dataclass
+class UnrolledSlotted:
+    __slots__ = ("field_a", "field_b")
+    field_a: int
+    field_b: Optional[str]
+
+
+@typic.klass(serde=typic.flags(case=typic.common.Case.CAMEL, exclude=("field_c",)))
+class UnrolledOut:
+    field_a: int
+    field_b: Optional[str] = None
+    field_c: str = "c"
+
+
+@pytest.mark.parametrize(
+    argnames="obj,expected",
+    argvalues=[
+        (Unrolled(field_a=1, field_b="2"), {"field_a": 1, "field_b": "2"}),
+        (Unrolled(field_a=1), {"field_a": 1, "field_b": None}),
+        (UnrolledSlotted(field_a=1, field_b="2"), {"field_a": 1, "field_b": "2"}),
+        (UnrolledOut(field_a=1, field_b="2"), {"fieldA": 1, "fieldB": "2"}),
+    ],
+)
+def test_unrolled_class_serializer(obj, expected):
+    proto = typic.protocol(obj.__class__)
+    primitive = proto.primitive(obj)
+    assert primitive == expected
+    assert [*primitive] == [*expected]
+    assert dict(proto.primitive(obj, lazy=True)) == expected
+
+
+@pytest.fixture
+def adaptive_unions(monkeypatch):
+    monkeypatch.setattr(typic.resolver.des, "adaptive_unions", True)
+
+
+def test_adaptive_union_dispatch(adaptive_unions):
+    @dataclasses.dataclass
+    class First:
+        a: int
+
+    @dataclasses.dataclass
+    class Second:
+        b: int
+
+    proto = typic.protocol(typing.Union[int, First, Second])
+    assert proto.transmute({"a": "1"}) == First(1)
+    for i in range(3):
+        assert proto.transmute({"b": i}) == Second(i)
+    stats = typic.resolver.des.dispatch_stats()
+    label = repr(typing.Union[int, First, Second]).replace("typing.", "")
+    counts = stats[label]["dict"]
+    assert counts["First"] == 1 and counts["Second"] == 3
+    # Second is now attempted first for a dict, so there are no more failures.
+    failures = counts["failures"]
+    assert proto.transmute({"b": 4}) == Second(4)
+    stats = typic.resolver.des.dispatch_stats()
+    assert stats[label]["dict"]["failures"] == failures
+    assert proto.transmute({"a": "1"}) == First(1)
+
+
+def _dispatch_dynamic_input(proto) -> weakref.ref:
+    DynamicMapping = type("DynamicMapping", (dict,), {})
+    assert proto.transmute(DynamicMapping(foo="bar")) == objects.Data("bar")
+    return weakref.ref(DynamicMapping)
+
+
+def test_adaptive_union_dispatch_releases_input_types(adaptive_unions):
+    proto = typic.protocol(typing.Union[int, objects.Data])
+    ref = _dispatch_dynamic_input(proto)
+    gc.collect()
+    assert ref() is None
+    stats = typic.resolver.des.dispatch_stats()
+    label = repr(typing.Union[int, objects.Data]).replace("typing.", "")
+    assert "DynamicMapping" not in stats[label]
+
+
+def test_adaptive_unions_not_shared_with_static(monkeypatch):
+    des = typic.resolver.des
+    annotation = typic.resolver.annotation(typing.Union[int, objects.Data])
+    monkeypatch.setattr(des, "adaptive_unions", False)
+    static = des.factory(annotation)
+    monkeypatch.setattr(des, "adaptive_unions", True)
+    adaptive = des.factory(annotation)
+    assert adaptive is not static
+    assert "dispatch" in adaptive.__globals__
+    assert "dispatch" not in static.__globals__
+
+
+@dataclasses.dataclass
+class DynamicFields:
+    union: Optional[typing.Union[int, objects.Data]] = None
+    anything: typing.Any = None
+
+
+@pytest.mark.parametrize(
+    argnames="obj,expected",
+    argvalues=[
+        (DynamicFields(), {"union": None, "anything": None}),
+        (DynamicFields(1, 1.5), {"union": 1, "anything": 1.5}),
+        (
+            DynamicFields(objects.Data("foo"), objects.FooNum.bar),
+            {"union": {"foo": "foo"}, "anything": "bar"},
+        ),
+        (
+            DynamicFields(anything=objects.Nested(objects.Data("foo"))),
+            {"union": None, "anything": {"data": {"foo": "foo"}}},
+        ),
+        (DynamicFields(anything=(1, "foo")), {"union": None, "anything": [1, "foo"]}),
+    ],
+)
+def test_dispatch_serializer(obj, expected):
+    assert typic.primitive(obj) == expected
+    assert typic.primitive(obj) == expected
+
+
+class MixedNum(enum.Enum):
+    INT = 1
+    STR = "str"
+    PAIR = (1, 2)
+    ALIAS = 1
+    UNHASHABLE = [3]
+
+    @classmethod
+    def _missing_(cls, value):
+        if value == "int":
+            return cls.INT
+
+
+class StrNum(str, enum.Enum):
+    FOO = "foo"
+
+
+class Perm(enum.Flag):
+    R = 4
+    W = 2
+    X = 1
+
+
+class IntPerm(enum.IntFlag):
+    R = 4
+    W = 2
+    X = 1
+
+
+@pytest.mark.parametrize(
+    argnames="t,value,expected",
+    argvalues=[
+        (MixedNum, 1, MixedNum.INT),
+        (MixedNum, "1", MixedNum.INT),
+        (MixedNum, "str", MixedNum.STR),
+        (MixedNum, (1, 2), MixedNum.PAIR),
+        (MixedNum, [3], MixedNum.UNHASHABLE),
+        (MixedNum, "int", MixedNum.INT),
+        (MixedNum, MixedNum.STR, MixedNum.STR),
+        (StrNum, b"foo", StrNum.FOO),
+    ],
+)
+def test_enum_transmute(t, value, expected):
+    assert typic.transmute(t, value) is expected
+
+
+@pytest.mark.parametrize(
+    argnames="t,value,expected",
+    argvalues=[
+        (MixedNum, MixedNum.INT, 1),
+        (MixedNum, MixedNum.PAIR, [1, 2]),
+        (MixedNum, MixedNum.UNHASHABLE, [3]),
+        (StrNum, StrNum.FOO, "foo"),
+        (Optional[StrNum], None, None),
+        (Perm, Perm.R, 4),
+        (Perm, Perm.R | Perm.W, 6),
+        (IntPerm, IntPerm.R | IntPerm.X, 5),
+    ],
+)
+def test_enum_primitive(t, value, expected):
+    assert typic.protocol(t).primitive(value) == expected
+
+
+@pytest.mark.parametrize(
+    argnames="t,value,valid",
+    argvalues=[
+        (MixedNum, MixedNum.STR, True),
+        (MixedNum, "str", False),
+        (StrNum, "foo", True),
+        (StrNum, ["foo"], False),
+        (Optional[StrNum], None, True),
+    ],
+)
+def test_enum_validate(t, value, valid):
+    assert typic.protocol(t).constraints.check(value).valid is valid
@@ -8,7 +8,10 @@ from typing import Optional
 
 import pytest
 
+import typic
 from typic.api import _resolve_from_env, environ
+from typic.env import Environ, EnvironmentValueError, EnvVar
+from typic.serde.resolver import Resolver
 
 
 class Foo:
@@ -99,3 +102,73 @@ def test__resolve_from_env_factory(kwargs, environ):
 def test_environ(getter, name, value):
     environ.setenv(name, value)
     assert getter(name) == value
+
+
+def test_lazy_init():
+    resolver = Resolver(lazy=True)
+    env = Environ(resolver)
+    assert resolver.lazy
+    assert "int" not in vars(env)
+    env.setenv("lazy_int", 1)
+    assert env.int("lazy_int") == 1
+    assert "int" in vars(env)
+    assert env.DSN is env.DSN
+
+
+def test_lazy_init_unknown_attribute():
+    env = Environ(Resolver(lazy=True))
+    with pytest.raises(AttributeError):
+        env.not_a_type
+
+
+def test_environ_snapshot():
+    env = Environ(Resolver(lazy=True))
+    os.environ["SNAPSHOT_VAR"] = "1"
+    snapshot = env.snapshot()
+    assert env.snapshot() is snapshot
+    assert snapshot["snapshot_var"] == "1"
+    os.environ["SNAPSHOT_VAR"] = "2"
+    assert env.getenv("SNAPSHOT_VAR", t=int) == 2
+    env.setenv("SNAPSHOT_VAR", 3)
+    assert env.getenv("snapshot_var", t=int) == 3
+    del os.environ["SNAPSHOT_VAR"]
+    assert env.getenv("SNAPSHOT_VAR", None, t=Optional[int]) is None
+    os.environb[b"SNAPSHOT_VAR"] = b"4"
+    assert env.getenv("snapshot_var", t=int) == 4
+    os.environ.pop("SNAPSHOT_VAR")
+
+
+def test_environ_snapshot_replaced_environ(monkeypatch):
+    env = Environ(Resolver(lazy=True))
+    monkeypatch.setattr(os, "environ", {"SNAPSHOT_VAR": "1"})
+    assert env.getenv("snapshot_var", t=int) == 1
+    os.environ["SNAPSHOT_VAR"] = "2"
+    assert env.getenv("snapshot_var", t=int) == 2
+
+
+def test_environ_getmany():
+    os.environ.update({"MANY_A": "1", "MANY_ALIAS": "2"})
+    values = environ.getmany(
+        {
+            "a": EnvVar("many_a", t=int),
+            "b": EnvVar("many_b", t=int, aliases=("MANY_ALIAS",)),
+            "c": EnvVar("many_c", t=int, default=3),
+        }
+    )
+    assert values == {"a": 1, "b": 2, "c": 3}
+    with pytest.raises(EnvironmentValueError):
+        environ.getmany({"d": EnvVar("many_d", t=int)})
+
+
+def test_settings_bulk_init():
+    @typic.settings(prefix="BULK_")
+    class Settings:
+        host: str
+        port: int = 5432
+        debug: bool = False
+
+    os.environ.update({"BULK_HOST": "localhost", "BULK_DEBUG": "true"})
+    assert Settings() == Settings("localhost", 5432, True)
+    assert Settings("remote", debug=False) == Settings("remote", 5432, False)
+    os.environ["BULK_PORT"] = "1"
+    assert Settings().port == 1
@@ -38,6 +38,7 @@ from typic.api import (
 from typic.checks import isbuiltintype, BUILTIN_TYPES, istypeddict
 from typic.compat import Literal
 from typic.constraints import ConstraintValueError
+from typic.serde import iso
 from typic.util import safe_eval, resolve_supertype, origin as get_origin, get_args
 from typic.types import NetworkAddress, DirectoryPath
 from typic.klass import klass
@@ -1148,3 +1149,49 @@ def test_pep_604():
         objects.Pep604, {"union": {"key": 1, "field": "blah"}}
     ) == objects.Pep604(union=objects.DFoo("blah"))
     assert objects.pep604({"key": 2, "field": "blah"}) == objects.DBar(b"blah")
+
+
+@pytest.mark.parametrize(
+    argnames="value",
+    argvalues=[
+        "2020-01-02T03:04:05Z",
+        "2020-01-02T03:04:05.123456+02:00",
+        "2020-01-02 03:04:05-05:30",
+        "2020-01-02T03:04:05-00:00",
+        "2020-01-02T03:04",
+        "2020-01-02",
+        "20200102T030405Z",
+        "2020-01-02T03:04:05.1234567Z",
+    ],
+)
+def test_iso_parse(value):
+    assert_iso_identical(iso.parse(value), pendulum.parse(value))
+    assert_iso_identical(
+        iso.parse_exact(value), pendulum.parse(value, exact=True)
+    )
+
+
+@pytest.mark.parametrize(argnames="value", argvalues=["03:04:05.5", "03:04"])
+def test_iso_parse_time(value):
+    assert_iso_identical(
+        iso.parse_exact(value), pendulum.parse(value, exact=True)
+    )
+
+
+@pytest.mark.parametrize(argnames="value", argvalues=["2020-02-30", "junk"])
+def test_iso_parse_invalid(value):
+    with pytest.raises(ValueError):
+        iso.parse(value)
+
+
+def assert_iso_identical(result, expected):
+    assert type(result) is type(expected)
+    assert result == expected
+    assert getattr(result, "tzinfo", None) == getattr(expected, "tzinfo", None)
+
+
+def test_iso_parse_memoized(monkeypatch):
+    monkeypatch.setenv("TYPIC_DATETIME_CACHE", "10")
+    parse = iso._memoize(iso._parse)
+    assert parse("2020-01-02T03:04:05Z") is parse("2020-01-02T03:04:05Z")
+    assert parse.cache_info().maxsize == 10
@@ -0,0 +1,88 @@
+"""Command-line utilities for typical.
+
+Usage
+-----
+Cache the compiled code for the protocols of all typed classes in a package::
+
+    $ TYPIC_CODE_CACHE=.typic python -m typic compile mypackage.models
+
+Processes started with the same ``TYPIC_CODE_CACHE`` will then load the bytecode for
+these protocols from the cache, rather than compiling their source again. The source
+is still generated in every process.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import inspect
+import pathlib
+import pkgutil
+import sys
+from types import ModuleType
+from typing import Iterator, List, Optional, Sequence, Type
+
+from typic import gen
+from typic.serde.resolver import resolver
+from typic.serde.warmup import warmup
+
+
+def _walk(module: ModuleType) -> Iterator[ModuleType]:
+    yield module
+    path = getattr(module, "__path__", None)
+    if path is None:
+        return
+    for info in pkgutil.walk_packages(path, prefix=f"{module.__name__}."):
+        yield importlib.import_module(info.name)
+
+
+def _typed_classes(module: ModuleType) -> Iterator[Type]:
+    for _, obj in inspect.getmembers(module, inspect.isclass):
+        if obj.__module__ == module.__name__ and (
+            resolver.known(obj) or resolver.delayed(obj)
+        ):
+            yield obj
+
+
+def compile_modules(names: Sequence[str]) -> List[Type]:
+    """Import the given modules (and their sub-modules) and resolve all typed classes.
+
+    Any code generated along the way is recorded by the active
+    :py:class:`~typic.gen.CodeCache`.
+    """
+    resolved = []
+    for name in names:
+        for module in _walk(importlib.import_module(name)):
+            resolved.extend(_typed_classes(module))
+    warmup(*resolved)
+    return resolved
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m typic")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compile_ = commands.add_parser(
+        "compile", help="Write the bytecode of a package's protocols to a code cache."
+    )
+    compile_.add_argument("modules", nargs="+", help="The modules or packages to load.")
+    compile_.add_argument(
+        "--cache-dir",
+        default=None,
+        help=f"The cache directory. Defaults to ${gen.CODE_CACHE_ENV}.",
+    )
+    args = parser.parse_args(argv)
+    if args.cache_dir:
+        gen.code_cache.path = pathlib.Path(args.cache_dir)
+    if not gen.code_cache.enabled:
+        parser.error(f"Provide --cache-dir or set ${gen.CODE_CACHE_ENV}.")
+    sys.path.insert(0, "")
+    classes = compile_modules(args.modules)
+    total = gen.code_cache.save()
+    print(
+        f"Resolved {len(classes)} classes. "
+        f"Wrote {total} code objects to {gen.code_cache.bundle}."
+    )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: nocover
+    sys.exit(main())
@@ -24,12 +24,15 @@ from typing import (
 )
 
 import typic.constraints as c
+from typic.cache import caches
 from typic.checks import issubclass, isfrozendataclass, isbuiltintype
-from typic.compat import lru_cache, Generic
-from typic.env import Environ, EnvironmentTypeError, EnvironmentValueError
+from typic.compat import Generic
+from typic.env import Environ, EnvironmentTypeError, EnvironmentValueError, EnvVar
 from typic.serde.binder import BoundArguments
 from typic.serde.common import (
     Annotation,
+    BatchDeserializerT,
+    BatchValidatorT,
     SerdeFlags,
     SerializerT,
     SerdeProtocol,
@@ -39,6 +42,7 @@ from typic.serde.common import (
     FieldIteratorT,
 )
 from typic.common import (
+    ENV_FIELDS_ATTR,
     ORIG_SETTER_NAME,
     SCHEMA_NAME,
     SERDE_FLAGS_ATTR,
@@ -48,8 +52,11 @@ from typic.common import (
     SERDE_ATTR,
     TYPIC_ANNOS_NAME,
 )
+from typic.serde.parallel import transmute_parallel, ParallelTransmuteError
+from typic.serde.profiler import profiler
 from typic.serde.resolver import resolver
 from typic.serde.ser import SerializationValueError
+from typic.serde.warmup import warmup, WarmupStats
 from typic.strict import (
     is_strict_mode,
     strict_mode,
@@ -67,10 +74,14 @@ __all__ = (
     "annotations",
     "bind",
     "BoundArguments",
+    "cache_clear",
+    "cache_info",
     "Case",
+    "check",
     "coerce",
     "constrained",
     "decode",
+    "dump",
     "encode",
     "environ",
     "EnvironmentTypeError",
@@ -78,8 +89,11 @@ __all__ = (
     "flags",
     "is_strict_mode",
     "iterate",
+    "iterdecode",
     "tojson",
+    "tojson_iter",
     "primitive",
+    "profile",
     "protocol",
     "protocols",
     "ReadOnly",
@@ -93,13 +107,20 @@ __all__ = (
     "SerdeFlags",
     "SerdeProtocol",
     "SerializationValueError",
+    "stats",
     "Strict",
     "strict_mode",
     "StrictStrT",
     "transmute",
+    "transmute_many",
+    "transmute_parallel",
+    "ParallelTransmuteError",
     "translate",
     "typed",
     "validate",
+    "validate_many",
+    "warmup",
+    "WarmupStats",
     "wrap",
     "wrap_cls",
     "WriteOnly",
@@ -110,8 +131,11 @@ SchemaGenT = Callable[[Type[ObjectT]], SchemaFieldT]
 
 
 transmute = resolver.transmute
+transmute_many = resolver.transmute_many
 translate = resolver.translate
 validate = resolver.validate
+validate_many = resolver.validate_many
+check = resolver.check
 bind = resolver.bind
 register = resolver.des.register
 primitive = resolver.primitive
@@ -119,10 +143,17 @@ schemas = schema_builder.all
 protocols = resolver.protocols
 protocol = resolver.resolve
 tojson = resolver.tojson
+tojson_iter = resolver.tojson_iter
+dump = resolver.dump
 iterate = resolver.iterate
 flags = SerdeFlags
+profile = profiler.profile
+stats = profiler.stats
+cache_info = caches.info
+cache_clear = caches.clear
 encode = resolver.encode
 decode = resolver.decode
+iterdecode = resolver.iterdecode
 
 # TBDeprecated
 coerce = resolver.coerce_value
@@ -145,8 +176,10 @@ class TypicObjectT(Generic[_T]):
     schema: SchemaGenT
     primitive: SerializerT[_T]
     transmute: DeserializerT[_T]
+    transmute_many: BatchDeserializerT[_T]
     translate: TranslatorT[_T]
     validate: c.ValidatorT[_T]
+    validate_many: BatchValidatorT[_T]
     tojson: Callable[..., str]
     iterate: FieldIteratorT[_T]
 
@@ -198,6 +231,8 @@ def _bind_proto(cls, proto: SerdeProtocol):
         ("tojson", proto.tojson),
         ("transmute", staticmethod(proto.transmute)),
         ("validate", staticmethod(proto.validate)),
+        ("transmute_many", staticmethod(proto.transmute_many)),
+        ("validate_many", staticmethod(proto.validate_many)),
         ("translate", proto.translate),
         ("encode", proto.encode),
         ("decode", staticmethod(proto.decode)),
@@ -207,7 +242,7 @@ def _bind_proto(cls, proto: SerdeProtocol):
         setattr(cls, n, attr)
 
 
-@lru_cache(maxsize=None)
+@caches.memoize("api.resolve_class")
 def _resolve_class(
     cls: Type[ObjectT],
     *,
@@ -669,7 +704,7 @@ def settings(
         cls = wrap_cls(
             dataclasses.dataclass(_cls, frozen=frozen), jsonschema=False, always=False
         )
-        return cls
+        return _bind_env_init(cls, case_sensitive)
 
     return settings_wrapper(_klass) if _klass is not None else settings_wrapper
 
@@ -689,6 +724,7 @@ def _resolve_from_env(
     for alias, attr in aliases.items():
         attr_to_aliases[attr].add(alias)
 
+    env_fields: Dict[str, EnvVar] = {}
     sentinel = object()
     for name in vars:
         attr, typ = vars[name]
@@ -709,7 +745,34 @@ def _resolve_from_env(
         factory = environ.register(typ, *names, name=name)
         field.default_factory = functools.partial(factory, **kwargs)
         setattr(cls, attr, field)
+        env_fields[attr] = EnvVar(
+            var=name, t=typ, aliases=(*names,), default=kwargs.get("default", ...)
+        )
+
+    setattr(cls, ENV_FIELDS_ATTR, env_fields)
+    return cls
+
 
+def _bind_env_init(cls: Type[ObjectT], case_sensitive: bool) -> Type[ObjectT]:
+    # Read all the env-backed fields which weren't passed in from a single snapshot,
+    # rather than calling a default factory per-field.
+    env_fields: Mapping[str, EnvVar] = getattr(cls, ENV_FIELDS_ATTR, {})
+    if not env_fields:
+        return cls
+    params = tuple(f.name for f in dataclasses.fields(cls) if f.init)
+    init = cls.__init__
+    getmany = environ.getmany
+    ci = not case_sensitive
+
+    @functools.wraps(init)
+    def __init__(self, *args, **kwargs):
+        given = {*params[: len(args)], *kwargs}
+        pending = {x: y for x, y in env_fields.items() if x not in given}
+        if pending:
+            kwargs.update(getmany(pending, ci=ci))
+        init(self, *args, **kwargs)
+
+    cls.__init__ = __init__  # type: ignore
     return cls
 
 
@@ -718,7 +781,7 @@ SchemaPrimitiveT = Dict[str, PrimitiveT]
 SchemaReturnT = Union[SchemaPrimitiveT, ObjectSchemaField]
 
 
-@lru_cache(maxsize=None)
+@caches.memoize("api.schema")
 def schema(obj: Type[ObjectT], *, primitive: bool = False) -> SchemaReturnT:
     """Get a JSON schema for object for the given object.
 
@@ -0,0 +1,630 @@
+from __future__ import annotations
+
+import collections
+import functools
+import gc
+import os
+import sys
+import threading
+import types
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from typic.common import CACHE_MAXSIZE_ENV
+
+__all__ = (
+    "CacheInfo",
+    "CacheRegistry",
+    "caches",
+    "LRUCache",
+    "owner",
+    "owns",
+    "pin",
+    "references",
+    "weakcache",
+)
+
+_T = TypeVar("_T")
+_FT = TypeVar("_FT", bound=Callable)
+_KT = TypeVar("_KT", bound=Hashable)
+_VT = TypeVar("_VT")
+RefKeyT = Callable[[Any], Any]
+"""Get the object to inspect for references to a type from a cache key."""
+
+
+def _default_maxsize() -> Optional[int]:
+    maxsize = os.environ.get(CACHE_MAXSIZE_ENV)
+    return int(maxsize) if maxsize else None
+
+
+class _SelfRef(weakref.ref):
+    """A result which refers to the argument it was computed for."""
+
+    __slots__ = ()
+
+
+_STATIC: Set[Any] = set()
+_DYNAMIC: weakref.WeakSet = weakref.WeakSet()
+_PLAIN = frozenset({str, bytes, int, float, bool, type(None)})
+_OWNERS: Tuple[type, ...] = ()
+_MISSING = object()
+_KWD = object()
+_HEAPTYPE = 1 << 9
+# Bound methods are created on every access, so they'd never be re-used.
+_NOREF: Set[type] = {types.MethodType}
+
+
+def owns(cls: Type[_T]) -> Type[_T]:
+    """Mark the instances of `cls` as the owners of the cache entries built from them.
+
+    Entries keyed by such an instance are released along with it, unless it's been
+    pinned with :py:func:`pin`.
+    """
+    global _OWNERS
+    _OWNERS = (*_OWNERS, cls)
+    return cls
+
+
+def pin(obj: _T) -> _T:
+    """Mark a long-lived owner, so the cache entries built from it are never released.
+
+    Entries for a pinned owner aren't tracked, so they're cheaper to store.
+    """
+    _STATIC.add(obj)
+    return obj
+
+
+def _isdynamic(obj: Any) -> bool:
+    # Anything which can't be found by name in its module was built at runtime,
+    #   and may be garbage-collected. Everything else lives as long as its module.
+    #   This is only worked out once for each class or function.
+    if obj in _STATIC:
+        return False
+    if obj in _DYNAMIC:
+        return True
+    # Builtin and extension types are never collected.
+    if isinstance(obj, type) and not obj.__flags__ & _HEAPTYPE:
+        _STATIC.add(obj)
+        return False
+    target = sys.modules.get(obj.__module__)
+    for name in obj.__qualname__.split("."):
+        target = getattr(target, name, None)
+    if target is obj:
+        _STATIC.add(obj)
+        return False
+    _DYNAMIC.add(obj)
+    return True
+
+
+def owner(obj: Any) -> Any:
+    """Get the dynamic class or function which `obj` is built from, if any.
+
+    Classes and functions which can't be found by name in their module (such as
+    closures, or classes built with :py:func:`dataclasses.make_dataclass`) are
+    "dynamic", and may be garbage-collected.
+
+    Examples
+    --------
+    >>> import dataclasses
+    >>> from typing import List
+    >>> Dynamic = dataclasses.make_dataclass("Dynamic", [("a", int)])
+    >>> owner((List[Dynamic], None)) is Dynamic
+    True
+    >>> owner((List[int], None)) is None
+    True
+    """
+    cls = obj.__class__
+    if cls in _PLAIN:
+        return None
+    if cls is tuple or cls is frozenset:
+        for o in obj:
+            found = owner(o)
+            if found is not None:
+                return found
+        return None
+    if cls is types.MethodType:
+        obj = obj.__func__
+        cls = obj.__class__
+    if cls is types.FunctionType or isinstance(obj, type):
+        return obj if _isdynamic(obj) else None
+    if isinstance(obj, _OWNERS):
+        return None if obj in _STATIC else obj
+    args = getattr(obj, "__args__", None)
+    if args.__class__ is tuple:
+        found = owner(getattr(obj, "__origin__", None))
+        return owner(args) if found is None else found
+    return None
+
+
+_TRACKED: weakref.WeakSet = weakref.WeakSet()
+
+
+class _Owned:
+    """The keys of a cache which are built from a dynamic class or function, by owner.
+
+    Cached values (protocols, compiled code) usually refer back to the type they were
+    built for, so they'd keep their owner alive for as long as the cache does. Before
+    each full garbage collection, these entries are set aside where only the collector
+    can see them (see :py:class:`_Detached`). The entries of an owner which is
+    otherwise unreachable are then collected along with it, and the rest are put back.
+
+    Notes
+    -----
+    Weak references to a cached value which nothing else refers to are cleared by a
+    full collection, even if the value is put back into its cache.
+    """
+
+    __slots__ = ("store", "keys", "pending", "__weakref__")
+
+    def __init__(self, store: Dict[Any, Any]):
+        self.store = store
+        self.keys: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        # The owners of the entries which are set aside, by the id of their holder.
+        #   These must be reachable, or the collector would clear them regardless.
+        self.pending: Dict[int, weakref.ref] = {}
+        _TRACKED.add(self)
+
+    def add(self, obj: Any, key: Any):
+        self.keys.setdefault(obj, set()).add(key)
+
+    def detach(self):
+        store = self.store
+        for obj, keys in [*self.keys.items()]:
+            items = []
+            for key in keys:
+                # Keys which have since been evicted are dropped here.
+                value = store.pop(key, _MISSING)
+                if value is not _MISSING:
+                    items.append((key, value))
+            if items:
+                self.pending[id(_Detached(self, items))] = weakref.ref(obj)
+        self.keys.clear()
+
+    def attach(self, holder: _Detached):
+        ref = self.pending.pop(id(holder), None)
+        obj = None if ref is None else ref()
+        # The collector clears any reference to an unreachable object beforehand.
+        if obj is None:
+            return
+        store = self.store
+        for key, value in holder.items:
+            # A weakly-keyed entry for an object which has since been collected.
+            if key.__class__ is weakref.ref and key() is None:
+                continue
+            # A new entry may have been stored while this one was set aside.
+            store.setdefault(key, value)
+            self.add(obj, key)
+
+    def clear(self):
+        self.keys.clear()
+
+
+class _Detached:
+    """Entries of a cache which have been set aside for a full garbage collection.
+
+    This refers to itself, so it's only ever freed by the collector. If the owner of
+    these entries is still alive by then, they're put back into their cache.
+    """
+
+    __slots__ = ("owned", "items", "cycle")
+
+    def __init__(self, owned: _Owned, items: List[Tuple[Any, Any]]):
+        self.owned = owned
+        self.items = items
+        self.cycle = self
+
+    def __del__(self):
+        self.owned.attach(self)
+
+
+def _sweep(phase: str, info: Dict[str, int]):
+    # Only a full collection is sure to find an owner which is no longer reachable.
+    if info["generation"] != 2:
+        return
+    for owned in [*_TRACKED]:
+        if phase == "start":
+            owned.detach()
+        else:
+            # Anything which wasn't put back by now belongs to a collected owner.
+            owned.pending.clear()
+
+
+gc.callbacks.append(_sweep)
+
+
+def weakcache(func: _FT) -> _FT:
+    """Memoize a function of one argument without keeping that argument alive.
+
+    Results are dropped once their argument is garbage-collected, so the metadata for
+    dynamically created classes and functions doesn't outlive them. Arguments which
+    can't be weakly referenced (such as ``str`` or ``int | str``), and bound methods,
+    fall back to a :py:func:`functools.lru_cache`.
+
+    Examples
+    --------
+    >>> import gc
+    >>> @weakcache
+    ... def name(obj):
+    ...     return obj.__name__
+    ...
+    >>> name(type("Dynamic", (), {}))
+    'Dynamic'
+    >>> _ = gc.collect()
+    >>> name.cache_size()
+    0
+    """
+    data: Dict[weakref.ref, Any] = {}
+    hooks: Dict[weakref.ref, weakref.ref] = {}
+    fallback = functools.lru_cache(maxsize=None)(func)
+    owned = _Owned(data)
+    ref = weakref.ref
+
+    def remove(key: weakref.ref):
+        data.pop(key, None)
+        hooks.pop(key, None)
+
+    def miss(obj: Any, key: weakref.ref) -> Any:
+        result = func(obj)
+        data[key] = _SelfRef(obj) if result is obj else result
+        if key not in hooks:
+            hooks[key] = ref(obj, lambda _, key=key: remove(key))
+        # A result for an object built from a dynamic class or function may refer
+        #   back to it, so it's released along with its owner.
+        if result.__class__ not in _PLAIN and result is not obj:
+            found = owner(obj)
+            if found is not None:
+                owned.add(found, key)
+        return result
+
+    @functools.wraps(func)
+    def weakcached(obj):
+        if obj.__class__ in _NOREF:
+            return fallback(obj)
+        # Results are keyed by the shared, callback-free reference to an object,
+        #   so a hit is a plain lookup which doesn't allocate a new one.
+        try:
+            key = ref(obj)
+            result = data[key]
+        except KeyError:
+            return miss(obj, key)
+        except TypeError:
+            # Classes which may be garbage-collected themselves aren't remembered.
+            if not _isdynamic(obj.__class__):
+                _NOREF.add(obj.__class__)
+            return fallback(obj)
+        # A result can't hold on to its own argument, or it would never be freed.
+        return result() if result.__class__ is _SelfRef else result
+
+    def cache_clear():
+        data.clear()
+        hooks.clear()
+        fallback.cache_clear()
+        owned.clear()
+
+    def cache_size() -> int:
+        return len(data) + fallback.cache_info().currsize
+
+    weakcached.cache_clear = cache_clear  # type: ignore
+    weakcached.cache_size = cache_size  # type: ignore
+    return weakcached  # type: ignore
+
+
+class CacheInfo(NamedTuple):
+    """Statistics for a single cache, in the shape of :py:func:`functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+def references(obj: Any, target: Any) -> bool:
+    """Whether `obj` is `target`, or a structure or generic built from it.
+
+    Examples
+    --------
+    >>> from typing import Dict, List
+    >>> references((List[Dict[str, int]], None), int)
+    True
+    >>> references(List[str], int)
+    False
+    """
+    if obj is target:
+        return True
+    if isinstance(obj, (tuple, frozenset)):
+        return any(references(o, target) for o in obj)
+    args = getattr(obj, "__args__", None)
+    if isinstance(args, tuple):
+        return references(getattr(obj, "__origin__", None), target) or any(
+            references(a, target) for a in args
+        )
+    return False
+
+
+def _refresh(store: collections.OrderedDict, key: Any):
+    try:
+        store.move_to_end(key)
+    # The item was set aside for a collection, or evicted by another thread.
+    except KeyError:
+        pass
+
+
+def _evict(store: collections.OrderedDict, maxsize: Optional[int]):
+    if maxsize is None:
+        return
+    while len(store) > maxsize:
+        try:
+            store.popitem(last=False)
+        # Everything was set aside for a collection in the meantime.
+        except KeyError:
+            break
+
+
+class LRUCache(collections.OrderedDict):
+    """A mapping with hit/miss statistics which evicts its least-recently-used items.
+
+    Notes
+    -----
+    Only lookups through :py:meth:`LRUCache.get` are counted and refresh an item.
+    Items for keys built from a dynamic class or function (see :py:func:`owner`) are
+    released along with it.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None, *, refkey: RefKeyT = None):
+        super().__init__()
+        self._maxsize = maxsize
+        self._refkey = refkey
+        self._owned = _Owned(self)
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.cache_info()})"
+
+    @property
+    def maxsize(self) -> Optional[int]:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: Optional[int]):
+        with self._lock:
+            self._maxsize = maxsize
+            _evict(self, maxsize)
+
+    def get(self, key: _KT, default: _VT = None) -> Union[_VT, Any]:  # type: ignore
+        with self._lock:
+            value = super().get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            _refresh(self, key)
+            return value
+
+    def __setitem__(self, key: _KT, value: Any):
+        with self._lock:
+            super().__setitem__(key, value)
+            _refresh(self, key)
+            obj = owner(key if self._refkey is None else self._refkey(key))
+            if obj is not None:
+                self._owned.add(obj, key)
+            _evict(self, self._maxsize)
+
+    def purge(self, predicate: Callable[[Any], bool]) -> int:
+        """Remove every item whose key matches `predicate`."""
+        with self._lock:
+            keys = [k for k in [*self] if predicate(k)]
+            for k in keys:
+                self.pop(k, None)
+            return len(keys)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self._maxsize, len(self))
+
+    def cache_clear(self):
+        with self._lock:
+            self.clear()
+            self._owned.clear()
+            self.hits = self.misses = 0
+
+
+class _Memo:
+    """A registry entry for a memoized function.
+
+    Results are stored by the arguments they were computed for, and hits are looked
+    up by the memoized function itself. As in an :py:class:`LRUCache`, a bounded memo
+    evicts its least-recently-used results, and results for arguments built from a
+    dynamic class or function are released along with it.
+    """
+
+    __slots__ = (
+        "data",
+        "owned",
+        "_maxsize",
+        "bounded",
+        "hits",
+        "misses",
+        "__weakref__",
+    )
+
+    def __init__(self, maxsize: Optional[int], *, bounded: bool = True):
+        self.data: collections.OrderedDict = collections.OrderedDict()
+        self.owned = _Owned(self.data)
+        self.bounded = bounded
+        self._maxsize = maxsize if bounded else None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> Optional[int]:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: Optional[int]):
+        self._maxsize = maxsize
+        _evict(self.data, maxsize)
+
+    def store(self, key: Any, value: Any):
+        self.misses += 1
+        self.data[key] = value
+        obj = owner(key)
+        if obj is not None:
+            self.owned.add(obj, key)
+        _evict(self.data, self._maxsize)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self._maxsize, len(self.data))
+
+    def cache_clear(self):
+        self.data.clear()
+        self.owned.clear()
+        self.hits = self.misses = 0
+
+
+class CacheRegistry:
+    """A registry of the caches which hold the protocols and artifacts built by typic.
+
+    Notes
+    -----
+    Caches are unbounded by default. Set a default bound for all caches with the
+    ``TYPIC_CACHE_MAXSIZE`` environment variable, or call
+    :py:meth:`CacheRegistry.configure` at runtime.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None):
+        self.maxsize = maxsize
+        # Caches live as long as whatever holds them, e.g. the resolver they belong to.
+        self._entries: weakref.WeakValueDictionary[
+            str, Union[LRUCache, _Memo]
+        ] = weakref.WeakValueDictionary()
+        self._lock = threading.RLock()
+
+    def cache(self, name: str, *, refkey: RefKeyT = None) -> LRUCache:
+        """Create and register an :py:class:`LRUCache` under `name`.
+
+        Parameters
+        ----------
+        name
+            The name for this cache. Caches created for each instance of a class
+            share a name, so later instances are suffixed with a counter. A cache is
+            unregistered once it's garbage-collected.
+        refkey : (kw-only)
+            Get the object to inspect when purging a type from a cache key.
+        """
+        cache = LRUCache(self.maxsize, refkey=refkey)
+        self._register(name, cache)
+        return cache
+
+    def memoize(self, name: str, *, bounded: bool = True) -> Callable[[_FT], _FT]:
+        """Memoize a function and register its cache.
+
+        Memoized functions can't be purged by type, so they are cleared entirely.
+
+        Parameters
+        ----------
+        name
+            The name for this cache.
+        bounded : (kw-only)
+            Whether the cache follows the registry's bound. An unbounded cache is
+            for results which must not change once computed, such as names.
+        """
+
+        def decorator(func: _FT) -> _FT:
+            entry = _Memo(self.maxsize, bounded=bounded)
+            data = entry.data
+
+            @functools.wraps(func)
+            def memoized(*args, **kwargs):
+                key = (*args, _KWD, *kwargs.items()) if kwargs else args
+                try:
+                    result = data[key]
+                except KeyError:
+                    result = func(*args, **kwargs)
+                    entry.store(key, result)
+                    return result
+                entry.hits += 1
+                if entry._maxsize is not None:
+                    _refresh(data, key)
+                return result
+
+            memoized.cache_info = entry.cache_info  # type: ignore
+            memoized.cache_clear = entry.cache_clear  # type: ignore
+            self._register(name, entry)
+            return memoized  # type: ignore
+
+        return decorator
+
+    def _register(self, name: str, entry: Union[LRUCache, _Memo]):
+        with self._lock:
+            base, i = name, 1
+            while name in self._entries:
+                i += 1
+                name = f"{base}[{i}]"
+            self._entries[name] = entry
+
+    def info(self) -> Dict[str, CacheInfo]:
+        """Get the statistics for every registered cache, by name.
+
+        Examples
+        --------
+        >>> import typic
+        >>> info = typic.cache_info()
+        >>> info["resolver.resolve"].currsize >= 0
+        True
+        """
+        return {name: entry.cache_info() for name, entry in [*self._entries.items()]}
+
+    def configure(self, maxsize: Optional[int], *names: str):
+        """Set the bound for the named caches, or for all caches if none are given.
+
+        Bounded caches evict their least-recently-used items immediately. Memoized
+        functions registered with ``bounded=False`` are never bounded.
+        """
+        with self._lock:
+            if not names:
+                self.maxsize = maxsize
+                names = (*self._entries,)
+            for name in names:
+                entry = self._entries.get(name)
+                if entry is not None and getattr(entry, "bounded", True):
+                    entry.maxsize = maxsize
+
+    def clear(self, obj: Any = None) -> Tuple[str, ...]:
+        """Clear all caches, or purge everything built for the given type.
+
+        When given a type, any cached artifact for it (or for a generic of it, such
+        as ``List[obj]``) is removed. Memoized lookups are cleared entirely, since
+        they can't be purged selectively.
+
+        Returns
+        -------
+        The names of the caches which were changed.
+        """
+        cleared = []
+        with self._lock:
+            for name, entry in [*self._entries.items()]:
+                if obj is None or isinstance(entry, _Memo):
+                    entry.cache_clear()
+                    cleared.append(name)
+                    continue
+                refkey = entry._refkey or (lambda k: k)
+                if entry.purge(lambda k: references(refkey(k), obj)):
+                    cleared.append(name)
+        return (*cleared,)
+
+
+caches = CacheRegistry(_default_maxsize())
@@ -38,11 +38,11 @@ import typic.common
 import typic.util as util
 import typic.strict as strict
 
+from typic.cache import weakcache
 from typic.compat import (
     Final,
     ForwardRef,
     Literal,
-    lru_cache,
     TypeGuard,
     TypedDict,
     Protocol,
@@ -135,13 +135,15 @@ STDLibTypeT = Union[
     uuid.UUID,
     uuid.SafeUUID,
 ]
-STDLIB_TYPES = frozenset(
-    (type(None), *(t for t in STDLibTypeT.__args__ if t is not None))  # type: ignore
+# Keep the declaration order so anything iterating these types is deterministic.
+STDLIB_TYPES_TUPLE = (
+    type(None),
+    *(t for t in STDLibTypeT.__args__ if t not in {None, type(None)}),  # type: ignore
 )
-STDLIB_TYPES_TUPLE = tuple(STDLIB_TYPES)
+STDLIB_TYPES = frozenset(STDLIB_TYPES_TUPLE)
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isbuiltintype(obj: Type[ObjectT]) -> TypeGuard[Type[BuiltInTypeT]]:
     """Check whether the provided object is a builtin-type.
 
@@ -182,7 +184,7 @@ def isbuiltintype(obj: Type[ObjectT]) -> TypeGuard[Type[BuiltInTypeT]]:
     )
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isstdlibtype(obj: Type[ObjectT]) -> TypeGuard[Type[STDLibTypeT]]:
     return (
         util.resolve_supertype(obj) in STDLIB_TYPES
@@ -190,7 +192,7 @@ def isstdlibtype(obj: Type[ObjectT]) -> TypeGuard[Type[STDLibTypeT]]:
     )
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isbuiltinsubtype(t: Type[ObjectT]) -> TypeGuard[Type[BuiltInTypeT]]:
     """Check whether the provided type is a subclass of a builtin-type.
 
@@ -218,7 +220,7 @@ def isbuiltinsubtype(t: Type[ObjectT]) -> TypeGuard[Type[BuiltInTypeT]]:
     return issubclass(util.resolve_supertype(t), BUILTIN_TYPES_TUPLE)
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isstdlibsubtype(t: Type[ObjectT]) -> TypeGuard[Type[STDLibTypeT]]:
     return issubclass(util.resolve_supertype(t), STDLIB_TYPES_TUPLE)
 
@@ -231,7 +233,7 @@ def isstdlibinstance(o: ObjectT) -> TypeGuard[STDLibTypeT]:
     return _isinstance(o, STDLIB_TYPES_TUPLE)
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isoptionaltype(obj: Type[ObjectT]) -> TypeGuard[Optional]:
     """Test whether an annotation is :py:class`typing.Optional`, or can be treated as.
 
@@ -266,12 +268,12 @@ def isoptionaltype(obj: Type[ObjectT]) -> TypeGuard[Optional]:
     )
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isuniontype(obj: Type[ObjectT]) -> TypeGuard[Union]:
     return util.get_name(util.origin(obj)) in {"Union", "UnionType"}
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isreadonly(obj: Type[ObjectT]) -> TypeGuard[typic.common.ReadOnly]:
     """Test whether an annotation is marked as :py:class:`typic.ReadOnly`
 
@@ -292,7 +294,7 @@ def isreadonly(obj: Type[ObjectT]) -> TypeGuard[typic.common.ReadOnly]:
     return util.origin(obj) is typic.common.ReadOnly
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isfinal(obj: Type[ObjectT]) -> bool:
     """Test whether an annotation is :py:class:`typing.Final`.
 
@@ -310,14 +312,14 @@ def isfinal(obj: Type[ObjectT]) -> bool:
     return util.origin(obj) is Final
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isliteral(obj: Type) -> TypeGuard[Literal]:
     return util.origin(obj) is Literal or (
         obj.__class__ is ForwardRef and obj.__forward_arg__.startswith("Literal")
     )
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def iswriteonly(obj: Type[ObjectT]) -> TypeGuard[typic.common.WriteOnly]:
     """Test whether an annotation is marked as :py:class:`typic.WriteOnly`.
 
@@ -338,7 +340,7 @@ def iswriteonly(obj: Type[ObjectT]) -> TypeGuard[typic.common.WriteOnly]:
     return util.origin(obj) is typic.common.WriteOnly
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isstrict(obj: Type[ObjectT]) -> TypeGuard[typic.Strict]:
     """Test whether an annotation is marked as :py:class:`typic.WriteOnly`.
 
@@ -359,7 +361,7 @@ def isstrict(obj: Type[ObjectT]) -> TypeGuard[typic.Strict]:
     return util.origin(obj) is strict.Strict
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isdatetype(
     obj: Type[ObjectT],
 ) -> TypeGuard[Type[Union[datetime.datetime, datetime.date]]]:
@@ -385,7 +387,7 @@ def isdatetype(
     return builtins.issubclass(util.origin(obj), (datetime.datetime, datetime.date))
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def istimetype(obj: Type[ObjectT]) -> TypeGuard[Type[datetime.time]]:
     """Test whether this annotation is a a date/datetime object.
 
@@ -407,7 +409,7 @@ def istimetype(obj: Type[ObjectT]) -> TypeGuard[Type[datetime.time]]:
     return builtins.issubclass(util.origin(obj), datetime.time)
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def istimedeltatype(obj: Type[ObjectT]) -> TypeGuard[Type[datetime.timedelta]]:
     """Test whether this annotation is a a date/datetime object.
 
@@ -429,7 +431,7 @@ def istimedeltatype(obj: Type[ObjectT]) -> TypeGuard[Type[datetime.timedelta]]:
     return builtins.issubclass(util.origin(obj), datetime.timedelta)
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isdecimaltype(obj: Type[ObjectT]) -> TypeGuard[Type[decimal.Decimal]]:
     """Test whether this annotation is a Decimal object.
 
@@ -451,7 +453,7 @@ def isdecimaltype(obj: Type[ObjectT]) -> TypeGuard[Type[decimal.Decimal]]:
     return builtins.issubclass(util.origin(obj), decimal.Decimal)
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isuuidtype(obj: Type[ObjectT]) -> TypeGuard[Type[uuid.UUID]]:
     """Test whether this annotation is a a date/datetime object.
 
@@ -480,25 +482,25 @@ def isuuidtype(obj: Type[ObjectT]) -> TypeGuard[Type[uuid.UUID]]:
 _COLLECTIONS = {list, set, tuple, frozenset, dict, str, bytes}
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isiterabletype(obj: Type[ObjectT]) -> TypeGuard[Type[Iterable]]:
     obj = util.origin(obj)
     return builtins.issubclass(obj, Iterable)
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isiteratortype(obj: Type[ObjectT]) -> TypeGuard[Type[Iterator]]:
     obj = util.origin(obj)
     return builtins.issubclass(obj, Iterator)
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def istupletype(obj: Type[ObjectT]) -> TypeGuard[Type[tuple]]:
     obj = util.origin(obj)
     return obj is tuple or issubclass(obj, tuple)
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def iscollectiontype(obj: Type[ObjectT]) -> TypeGuard[Type[Collection]]:
     """Test whether this annotation is a subclass of :py:class:`typing.Collection`.
 
@@ -530,7 +532,7 @@ def iscollectiontype(obj: Type[ObjectT]) -> TypeGuard[Type[Collection]]:
     return obj in _COLLECTIONS or builtins.issubclass(obj, Collection)
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def ismappingtype(obj: Type[ObjectT]) -> TypeGuard[Type[Mapping]]:
     """Test whether this annotation is a subtype of :py:class:`typing.Mapping`.
 
@@ -568,7 +570,7 @@ def ismappingtype(obj: Type[ObjectT]) -> TypeGuard[Type[Mapping]]:
     )
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isenumtype(obj: Type[ObjectT]) -> TypeGuard[Type[enum.Enum]]:
     """Test whether this annotation is a subclass of :py:class:`enum.Enum`
 
@@ -590,7 +592,7 @@ def isenumtype(obj: Type[ObjectT]) -> TypeGuard[Type[enum.Enum]]:
     return issubclass(obj, enum.Enum)
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isclassvartype(obj: Type[ObjectT]) -> TypeGuard[ClassVar]:
     """Test whether an annotation is a ClassVar annotation.
 
@@ -617,7 +619,7 @@ _UNWRAPPABLE = (
 )
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def should_unwrap(obj: Type[ObjectT]) -> bool:
     """Test whether we should use the __args__ attr for resolving the type.
 
@@ -626,7 +628,7 @@ def should_unwrap(obj: Type[ObjectT]) -> bool:
     return (not isliteral(obj)) and any(x(obj) for x in _UNWRAPPABLE)
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isfromdictclass(obj: Type[ObjectT]) -> TypeGuard[_FromDict]:
     """Test whether this annotation is a class with a `from_dict()` method."""
     return inspect.isclass(obj) and hasattr(obj, "from_dict")
@@ -636,7 +638,7 @@ class _FromDict(Protocol):
     def from_dict(self, *args, **kwargs) -> _FromDict: ...
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isfrozendataclass(obj: Type[ObjectT]) -> TypeGuard[_FrozenDataclass]:
     """Test whether this is a dataclass and whether it's frozen."""
     return getattr(getattr(obj, "__dataclass_params__", None), "frozen", False)
@@ -649,7 +651,7 @@ class _FrozenDataclass(Protocol):
 _isinstance = isinstance
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def _type_check(t) -> bool:
     if _isinstance(t, tuple):
         return all(_type_check(x) for x in t)
@@ -711,7 +713,7 @@ def issubclass(o: Type[Any], t: Union[Type, Tuple[Type, ...]]) -> bool:
     return _type_check(t) and _type_check(o) and builtins.issubclass(o, t)
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isconstrained(obj: Type[ObjectT]) -> TypeGuard[_Constrained]:
     """Test whether a type is restricted.
 
@@ -766,7 +768,7 @@ def ishashable(obj: ObjectT) -> TypeGuard[Hashable]:
     return __hashgetter(obj) is not None
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def istypeddict(obj: Type[ObjectT]) -> TypeGuard[Type[TypedDict]]:
     """Check whether an object is a :py:class:`typing.TypedDict`.
 
@@ -792,7 +794,7 @@ def istypeddict(obj: Type[ObjectT]) -> TypeGuard[Type[TypedDict]]:
     )
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def istypedtuple(obj: Type[ObjectT]) -> TypeGuard[Type[NamedTuple]]:
     """Check whether an object is a "typed" tuple (:py:class:`typing.NamedTuple`).
 
@@ -818,7 +820,7 @@ def istypedtuple(obj: Type[ObjectT]) -> TypeGuard[Type[NamedTuple]]:
     )
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def isnamedtuple(obj: Type[ObjectT]) -> TypeGuard[namedtuple]:
     """Check whether an object is a "named" tuple (:py:func:`collections.namedtuple`).
 
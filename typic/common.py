@@ -9,6 +9,7 @@ import inflection
 
 DEFAULT_ENCODING = "utf-8"
 EMPTY = inspect.Signature.empty
+ENV_FIELDS_ATTR = "__typic_env_fields__"
 ORIG_SETTER_NAME = "__setattr_original__"
 POSITIONAL_ONLY = inspect.Parameter.POSITIONAL_ONLY
 POSITIONAL_OR_KEYWORD = inspect.Parameter.POSITIONAL_OR_KEYWORD
@@ -22,6 +23,11 @@ TOO_MANY_POS = "too many positional arguments"
 TYPIC_ANNOS_NAME = "__typic_annotations__"
 VAR_POSITIONAL = inspect.Parameter.VAR_POSITIONAL
 VAR_KEYWORD = inspect.Parameter.VAR_KEYWORD
+LAZY_INIT_ENV = "TYPIC_LAZY_INIT"
+PROFILE_ENV = "TYPIC_PROFILE"
+CACHE_MAXSIZE_ENV = "TYPIC_CACHE_MAXSIZE"
+ADAPTIVE_UNIONS_ENV = "TYPIC_ADAPTIVE_UNIONS"
+DATETIME_CACHE_ENV = "TYPIC_DATETIME_CACHE"
 KWD_KINDS = {VAR_KEYWORD, KEYWORD_ONLY}
 POS_KINDS = {VAR_POSITIONAL, POSITIONAL_ONLY}
 AnyOrTypeT = Union[Type, Any]
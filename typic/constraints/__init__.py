@@ -14,6 +14,7 @@ from .array import (
 from .common import (
     ValidatorT,
     ValidateT,
+    CheckT,
     BaseConstraints,
     ConstraintsProtocolT,
     VT,
@@ -21,6 +22,7 @@ from .common import (
     TypeConstraints,
     LiteralConstraints,
     EnumConstraints,
+    ValidationResult,
 )
 from .error import ConstraintValueError, ConstraintSyntaxError
 from .mapping import DictConstraints, MappingConstraints, ObjectConstraints
@@ -46,6 +48,7 @@ __all__ = (
     "SetContraints",
     "StrConstraints",
     "TupleConstraints",
+    "ValidationResult",
     "ValidatorT",
     "BaseConstraints",
     "get_constraints",
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import collections
 import dataclasses
+import itertools
 from types import MappingProxyType
 from typing import (
     Type,
@@ -17,11 +18,18 @@ from typing import (
     Hashable,
     Set,
     FrozenSet,
+    Callable,
 )
 
 from typic import gen, checks, util
 from typic.types.frozendict import freeze
-from .common import BaseConstraints, ContextT, AssertionsT, ConstraintsProtocolT
+from .common import (
+    BaseConstraints,
+    ContextT,
+    AssertionsT,
+    ConstraintsProtocolT,
+    failed,
+)
 
 Array = Union[FrozenSet, Set, List, Tuple, collections.deque]
 """The supported builtin types for defining restricted array-types."""
@@ -82,9 +90,11 @@ def unique(seq: Sequence, *, ret_type: Type[Union[list, tuple]] = list) -> Seque
     `Uniquify List in Python 3.6 <https://www.peterbe.com/plog/fastest-way-to-uniquify-a-list-in-python-3.6>`_
     """
     try:
-        return unique_fast(seq, ret_type=ret_type)
+        uniques = unique_fast(seq, ret_type=ret_type)
     except TypeError:
-        return unique_slow(seq, ret_type=ret_type)
+        uniques = unique_slow(seq, ret_type=ret_type)
+    # If nothing was dropped, the original array is already unique.
+    return seq if len(uniques) == len(seq) else uniques
 
 
 @util.slotted
@@ -117,6 +127,9 @@ class ArrayConstraints(BaseConstraints):
 
     This can be a single type-constraint, or a tuple of multiple constraints.
     """
+    ITEMS = "items"
+    RETX = "retx"
+    RETVAL = "retval"
 
     def _get_assertions(self) -> AssertionsT:
         asserts: List[str] = []
@@ -143,24 +156,52 @@ class ArrayConstraints(BaseConstraints):
         # Validate the items if necessary.
         if self.values:
             o = util.origin(self.type)
-            itval = "__item_validator"
+            itconst = "__item_constraints"
             ctx = {
                 "unique": unique,
-                itval: self.values.validate,
+                itconst: self.values,
                 o.__name__: o,
                 "_lazy_repr": util.collectionrepr,
+                "failed": failed,
             }
             r = "i" if issubclass(self.type, Sequence) else "x"
             field = f"_lazy_repr({self.FNAME}, {r})"
-            func.l(
-                f"{self.VALUE} = "
-                f"{o.__name__}("
-                f"({itval}(x, field={field}) for i, x in enumerate({self.VALUE}))"
-                f")",
-                **ctx,  # type: ignore
-            )
+
+            def check(block: gen.Block):
+                # The validator is looked up on use, since it may be recursive.
+                block.l(f"valid, {self.RETX} = {itconst}.validator(x, field={field})")
+                with block.b("if not valid:") as b:
+                    b.l(f"return False, failed({itconst}, {self.RETX}, {field})")
+
+            self._build_item_validator(func, check, origin=o, context=ctx)
+            context.update(ctx)
         return context
 
+    def _build_item_validator(
+        self,
+        func: gen.Block,
+        check: Callable[[gen.Block], None],
+        *,
+        origin: Type,
+        context: ContextT,
+    ):
+        # Only copy the array once an item validator returns a different object.
+        #   The items before it are kept as-is and validation resumes from there.
+        func.l(f"{self.ITEMS} = enumerate({self.VALUE})")
+        with func.b(f"for i, x in {self.ITEMS}:") as loop:
+            check(loop)
+            with loop.b(f"if {self.RETX} is not x:") as b:
+                b.l(f"{self.RETVAL} = [*islice({self.VALUE}, i), {self.RETX}]")
+                with b.b(f"for i, x in {self.ITEMS}:") as rest:
+                    check(rest)
+                    rest.l(f"{self.RETVAL}.append({self.RETX})")
+                copy = self.RETVAL
+                if origin is not list:
+                    copy = f"{origin.__name__}({copy})"
+                b.l(f"{self.VALUE} = {copy}")
+                b.l("break")
+        context["islice"] = itertools.islice
+
     def for_schema(self, *, with_type: bool = False) -> dict:
         schema: Dict[str, Any] = dict(
             title=self.name,
@@ -198,26 +239,28 @@ class TupleConstraints(ArrayConstraints):
                     f"{self.VALUE} = unique({self.VALUE}, ret_type=tuple)",
                     unique=unique,
                 )
-            item_validators = MappingProxyType(
-                {i: c.validate for i, c in enumerate(self.values)}
-            )
+            item_constraints = MappingProxyType(dict(enumerate(self.values)))
             o = util.origin(self.type)
-            itval = "__item_validators"
+            itconst = "__item_constraints"
             ctx = {
                 "unique": unique,
-                itval: item_validators,
+                itconst: item_constraints,
                 o.__name__: o,
                 "_lazy_repr": util.collectionrepr,
+                "failed": failed,
             }
             field = f"_lazy_repr({self.FNAME}, i)"
-            func.l(
-                f"{self.VALUE} = "
-                f"{o.__name__}("
-                f"({itval}[i](x, field={field}) if i in {itval} else x "
-                f"for i, x in enumerate({self.VALUE}))"
-                f")",
-                **ctx,  # type: ignore
-            )
+
+            def check(block: gen.Block):
+                block.l(f"c = {itconst}.get(i)")
+                with block.b("if c is None:") as b:
+                    b.l(f"{self.RETX} = x")
+                with block.b("else:") as b:
+                    b.l(f"valid, {self.RETX} = c.validator(x, field={field})")
+                    with b.b("if not valid:") as bb:
+                        bb.l(f"return False, failed(c, {self.RETX}, {field})")
+
+            self._build_item_validator(func, check, origin=o, context=ctx)
             return ctx
         return ArrayConstraints._build_validator(
             self, func=func, context=context, assertions=assertions
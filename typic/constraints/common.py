@@ -43,7 +43,9 @@ __all__ = (
     "TypeConstraints",
     "ValidatorT",
     "ValidateT",
+    "CheckT",
     "ConstraintsProtocolT",
+    "ValidationResult",
     "VT",
 )
 
@@ -69,6 +71,96 @@ class ValidateT(Protocol[_T_co]):
     def __call__(self, value: Any, *, field: str = None) -> _T_co: ...
 
 
+class CheckT(Protocol[_T_co]):
+    """The signature of the public, non-raising check callable for a Constraint."""
+
+    def __call__(self, value: Any, *, field: str = None) -> ValidationResult: ...
+
+
+class ValidationResult:
+    """The outcome of checking a value against a set of constraints.
+
+    The error path and message are only rendered when accessed, so a failed check
+    never pays for the ``repr`` of the offending value unless it is reported.
+
+    Examples
+    --------
+    >>> import typic
+    >>> result = typic.get_constraints(int).check("1")
+    >>> result.valid
+    False
+    >>> result.message
+    "Given value <'1'> fails constraints: (type=int, nullable=False)"
+    """
+
+    __slots__ = ("valid", "value", "field", "constraints", "error", "__dict__")
+
+    def __init__(
+        self,
+        valid: bool,
+        value: Any,
+        *,
+        field: util.ReprT = None,
+        constraints: ConstraintsProtocolT = None,
+        error: Exception = None,
+    ):
+        self.valid = valid
+        self.value = value
+        self.field = field
+        self.constraints = constraints
+        self.error = error
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+    def __repr__(self) -> str:
+        if self.valid:
+            return f"{self.__class__.__name__}(valid=True, value={self.value!r})"
+        return f"{self.__class__.__name__}(valid=False, message={self.message!r})"
+
+    def __str__(self) -> str:
+        return self.message or ""
+
+    @util.cached_property
+    def path(self) -> Optional[str]:
+        """The location of the invalid value, if the value was nested."""
+        return None if self.field is None else str(self.field)
+
+    @util.cached_property
+    def message(self) -> Optional[str]:
+        """A description of the failure, or ``None`` if the value is valid."""
+        if self.valid:
+            return None
+        if self.error is not None:
+            return str(self.error)
+        field = "Given" if self.path is None else f"{self.path}:"
+        return f"{field} value <{self.value!r}> fails constraints: {self.constraints}"
+
+
+def failed(
+    constraints: ConstraintsProtocolT,
+    value: Any,
+    field: util.ReprT = None,
+    message: str = None,
+) -> ValidationResult:
+    """The result for a validator which returned ``(False, value)``.
+
+    Validators never raise for invalid input. A nested validator which fails returns
+    its own result in place of the value, so the parent passes it along as-is.
+    """
+    if value.__class__ is ValidationResult:
+        return value
+    if isinstance(constraints, (DelayedConstraints, ForwardDelayedConstraints)):
+        constraints = constraints.constraints
+    return ValidationResult(
+        False,
+        value,
+        field=field,
+        constraints=constraints,
+        error=message and ConstraintValueError(message),  # type: ignore
+    )
+
+
 class ConstraintsProtocolT(Protocol[_T]):
     """The guaranteed protocol for a Constraints instance."""
 
@@ -78,6 +170,7 @@ class ConstraintsProtocolT(Protocol[_T]):
     name: Optional[str]
     validator: ValidatorT[_T]
     validate: ValidateT[_T]
+    check: CheckT[_T]
 
     def for_schema(self, *, with_type: bool = False) -> Dict[str, Any]: ...
 
@@ -136,8 +229,14 @@ class _AbstractConstraints(abc.ABC):
     def type_qualname(self) -> str:
         return util.get_qualname(self.type)
 
+    @util.cached_property
+    def _validator_name(self) -> str:
+        # Constraints can't be traced back to the type they're for, so a name cached
+        #   by value would keep both alive. Each instance is named once instead.
+        return util.new_defname("validator")
+
     def _get_validator_name(self) -> str:
-        return util.get_defname("validator", self)
+        return self._validator_name
 
     @util.cached_property
     @abc.abstractmethod
@@ -167,12 +266,29 @@ class _AbstractConstraints(abc.ABC):
             valid, value = False, value
 
         if not valid:
-            field = f"{field}:" if field is not None else "Given"
-            raise ConstraintValueError(
-                f"{field} value <{value!r}> fails constraints: {self}"
-            ) from None
+            result = failed(self, value, field)
+            raise ConstraintValueError(result.message, result=result) from None
         return value
 
+    def check(self, value: VT, *, field: str = None) -> ValidationResult:
+        """Check whether an incoming value meets the given constraints.
+
+        This is the non-raising counterpart to :py:meth:`validate`, for when invalid
+        input is expected and an exception would be the common case.
+
+        Notes
+        -----
+        Failures reported by nested constraints are surfaced with their own path,
+        value and constraints.
+        """
+        try:
+            valid, value = self.validator(value, field=field)
+        except AttributeError:
+            valid = False
+        if not valid:
+            return failed(self, value, field)
+        return ValidationResult(True, value, field=field, constraints=self)
+
     @abc.abstractmethod
     def for_schema(
         self, *, with_type: bool = False
@@ -387,22 +503,19 @@ class MultiConstraints(_AbstractConstraints):
                             b.l(f"tag_value = {self.VALUE}.get(tag, empty)")
                         with f.b("else:") as b:
                             b.l(f"tag_value = getattr({self.VALUE}, tag, empty)")
-                        f.l(
-                            f"valid, {self.VALUE} = "
-                            f"(True, vmap[tag_value].validate({self.VALUE}, field=field)) "
-                            f"if tag_value in vmap else (False, {self.VALUE})"
-                        )
+                        f.l("v = vmap.get(tag_value)")
                     else:
                         vmap = util.TypeMap(
                             {util.origin(t): v for t, v in vmap.items()}
                         )
                         f.namespace.update(vmap=vmap)
                         f.l(f"v = vmap.get_by_parent({self.VALTNAME}, None)")
-                        f.l(
-                            f"valid, {self.VALUE} = (True, v.validate(value, field=field)) "
-                            f"if v else (False, value)"
-                        )
-                    f.l(f"return valid, {self.VALUE}")
+                    with f.b("if v is None:") as b:
+                        b.l(f"return False, {self.VALUE}")
+                    f.l(f"valid, {self.VALUE} = v.validator({self.VALUE}, field=field)")
+                    with f.b("if not valid:", failed=failed) as b:
+                        b.l(f"return False, failed(v, {self.VALUE}, field)")
+                    f.l(f"return True, {self.VALUE}")
         validator = main.compile(name=func_name)
         return validator  # type: ignore
 
@@ -498,16 +611,25 @@ class EnumConstraints(_AbstractConstraints):
 
     @util.cached_property
     def validator(self) -> ValidatorT:
-        ns = dict(__t=self.type, VT=VT, __values=(*self.type,))
+        ns = dict(__t=self.type, VT=VT)
         func_name = self._get_validator_name()
         with gen.Block(ns) as main:
             with self.define(main, func_name) as f:
+                with f.b("if value.__class__ is __t:") as b:
+                    b.l(f"{gen.Keyword.RET} True, value")
                 if self.nullable:
                     with f.b(f"if value in {self.NULLABLES}:") as b:
                         b.l(f"{gen.Keyword.RET} True, value")
-                # This is O(N), but so is casting to the enum
-                # And handling a ValueError is an order of magnitude heavier
-                f.l(f"{gen.Keyword.RET} value in __values, value")
+                # A member of a mixed-in enum (e.g., `class Foo(str, Enum)`) is equal
+                #   to its value, so the value is valid as well.
+                if self.type._member_type_ is not object:
+                    values = {m.value for m in self.type if checks.ishashable(m.value)}
+                    with f.b("try:", __values=values) as b:
+                        b.l(f"{gen.Keyword.RET} value in __values, value")
+                    with f.b("except TypeError:") as b:
+                        b.l(f"{gen.Keyword.RET} False, value")
+                else:
+                    f.l(f"{gen.Keyword.RET} False, value")
 
         validator: ValidatorT = main.compile(name=func_name, ns=ns)
         return validator
@@ -592,9 +714,15 @@ class DelayedConstraints:
             self._constraints = self._evaluate_contraints()
         return self._constraints
 
+    def validator(self, value: VT, *, field: str = None) -> Tuple[bool, VT]:
+        return self.constraints.validator(value, field=field)
+
     def validate(self, value: VT, *, field: str = None):
         return self.constraints.validate(value, field=field)
 
+    def check(self, value: VT, *, field: str = None) -> ValidationResult:
+        return self.constraints.check(value, field=field)
+
     def __getattr__(self, item):
         return self.constraints.__getattribute__(item)
 
@@ -650,8 +778,14 @@ class ForwardDelayedConstraints:
             self._constraints = self._evaluate_contraints()
         return self._constraints
 
+    def validator(self, value: VT, *, field: str = None) -> Tuple[bool, VT]:
+        return self.constraints.validator(value, field=field)
+
     def validate(self, value: VT, *, field: str = None):
         return self.constraints.validate(value, field=field)
 
+    def check(self, value: VT, *, field: str = None) -> ValidationResult:
+        return self.constraints.check(value, field=field)
+
     def __getattr__(self, item):
         return self.constraints.__getattribute__(item)
@@ -1,3 +1,11 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:  # pragma: nocover
+    from .common import ValidationResult
+
+
 class ConstraintSyntaxError(SyntaxError):
     """A generic error indicating an improperly defined constraint."""
 
@@ -7,4 +15,11 @@ class ConstraintSyntaxError(SyntaxError):
 class ConstraintValueError(ValueError):
     """A generic error indicating a value violates a constraint."""
 
-    pass
+    def __init__(self, *args, result: Optional[ValidationResult] = None):
+        super().__init__(*args)
+        self.result = result
+        """The result of the check which failed, if available."""
+
+    def __reduce__(self):
+        # The result holds the constraints and their compiled validators.
+        return self.__class__, self.args
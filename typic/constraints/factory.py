@@ -21,7 +21,6 @@ from typing import (
     Dict,
     Hashable,
     cast,
-    Set,
     ClassVar,
     Deque,
     Tuple,
@@ -41,7 +40,8 @@ from typic.checks import (
     isenumtype,
     isabstract,
 )
-from typic.compat import Literal, lru_cache, UnionType
+from typic.cache import caches
+from typic.compat import Literal, UnionType
 from typic.types import dsn, email, frozendict, path, secret, url
 from typic.util import (
     origin,
@@ -52,6 +52,7 @@ from typic.util import (
     get_name,
     TypeMap,
     empty,
+    LocalSet,
 )
 from .array import (
     Array,
@@ -86,7 +87,7 @@ from .number import (
 from .text import BytesConstraints, StrConstraints
 
 
-@lru_cache(maxsize=None)
+@caches.memoize("constraints.factory")
 def get_constraints(
     t: Type[VT],
     *,
@@ -144,7 +145,7 @@ def get_constraints(
     return c
 
 
-__stack: Set[Type] = set()
+__stack: LocalSet[Type] = LocalSet()
 
 
 ConstraintsT = Union[
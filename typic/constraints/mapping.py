@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import dataclasses
+import itertools
 import uuid
 from types import MappingProxyType
 from typing import (
@@ -30,6 +31,8 @@ from .common import (
     VT,
     InstanceCheck,
     ConstraintsProtocolT,
+    ValidationResult,
+    failed,
 )
 from .error import ConstraintSyntaxError
 
@@ -46,6 +49,17 @@ def validate_pattern_constraints(
     return val
 
 
+def check_pattern_constraints(
+    constraints: Dict[Pattern, ConstraintsT], key: str, val: VT
+) -> Tuple[bool, Union[VT, ValidationResult]]:
+    for pattern, const in constraints.items():
+        if pattern.match(key):
+            valid, val = const.validator(val)
+            if not valid:
+                return False, failed(const, val)
+    return True, val
+
+
 MappedItemConstraints = Dict[Type, BaseConstraints]
 ItemValidator = Union[
     Callable[[BaseConstraints, VT], VT], Callable[[MappedItemConstraints, VT], VT]
@@ -99,48 +113,68 @@ class MappingConstraints(BaseConstraints):
     RETX = "retx"
     RETY = "rety"
     RETVAL = "retval"
+    ITEMS = "items"
 
-    def _set_item_validator_loop_line(
-        self, loop: gen.Block, func_name: str
-    ) -> ContextT:
+    def _get_item_validator(
+        self, func_name: str
+    ) -> Tuple[Callable[[gen.Block], None], ContextT]:
         names = ItemValidatorNames(
             item_validators_name=f"{func_name}_items",
             vals_validator_name=f"{func_name}_vals",
             keys_validator_name=f"{func_name}_keys",
             patterns_validators_name=f"{func_name}_patterns",
         )
-        ctx: Dict[str, Any] = {}
-        x = self.X
-        y = self.Y
+        ctx: Dict[str, Any] = {"failed": failed}
         field = f"_lazy_repr({self.FNAME}, {self.X})"
         if self.values:
-            y = f"{names.vals_validator_name}({y}, field={field})"
-            ctx[names.vals_validator_name] = self.values.validate
+            ctx[names.vals_validator_name] = self.values
         if self.keys:
-            x = f"{names.keys_validator_name}({self.X})"
-            ctx[names.keys_validator_name] = self.keys.validate
+            ctx[names.keys_validator_name] = self.keys
         if self.patterns:
-            y = (
-                "validate_pattern_constraints"
-                f"({names.patterns_validators_name}, {self.X}, {y})"
-            )
             ctx[names.patterns_validators_name] = self.patterns
-            ctx["validate_pattern_constraints"] = validate_pattern_constraints
+            ctx["check_pattern_constraints"] = check_pattern_constraints
         if self.items:
-            ctx.update(
-                {
-                    names.item_validators_name: MappingProxyType(
-                        {x: y.validate for x, y in self.items.items()}  # type: ignore
-                    )
-                }
-            )
-            y = (
-                f"{names.item_validators_name}[{self.X}]({y}, field={field}) "
-                f"if {self.X} in {names.item_validators_name} else {self.Y}"
+            ctx[names.item_validators_name] = MappingProxyType(
+                {**self.items}  # type: ignore
             )
 
-        loop.l(f"{x}: {y}")
-        return ctx
+        def check(block: gen.Block):
+            # Each validator returns its result rather than raising, so a failure
+            #   is returned as-is, with its own path.
+            y = self.Y
+            if self.keys:
+                name = names.keys_validator_name
+                block.l(f"valid, {self.RETX} = {name}.validator({self.X})")
+                with block.b("if not valid:") as b:
+                    b.l(f"return False, failed({name}, {self.RETX})")
+            if self.values:
+                name = names.vals_validator_name
+                block.l(f"valid, {self.RETY} = {name}.validator({y}, field={field})")
+                with block.b("if not valid:") as b:
+                    b.l(f"return False, failed({name}, {self.RETY}, {field})")
+                y = self.RETY
+            if self.patterns:
+                block.l(
+                    f"valid, {self.RETY} = check_pattern_constraints"
+                    f"({names.patterns_validators_name}, {self.X}, {y})"
+                )
+                with block.b("if not valid:") as b:
+                    b.l(f"return False, {self.RETY}")
+                y = self.RETY
+            if self.items:
+                block.l(f"c = {names.item_validators_name}.get({self.X})")
+                with block.b("if c is not None:") as b:
+                    b.l(f"valid, {self.RETY} = c.validator({y}, field={field})")
+                    with b.b("if not valid:") as bb:
+                        bb.l(f"return False, failed(c, {self.RETY}, {field})")
+                if y != self.RETY:
+                    with block.b("else:") as b:
+                        b.l(f"{self.RETY} = {y}")
+                y = self.RETY
+            if y != self.RETY:
+                block.l(f"{self.RETY} = {y}")
+
+        return check, ctx
 
     def _set_item_validator_pattern_constraints(self, loop: gen.Block, func_name: str):
         # Item constraints based upon key-pattern
@@ -167,6 +201,25 @@ class MappingConstraints(BaseConstraints):
             with loop.b("if not valid:") as b:
                 b.l("break")
 
+    def _build_item_loop(self, func: gen.Block, check: Callable[[gen.Block], None]):
+        # Only copy the mapping once an item validator returns a different object.
+        #   The items before it are kept as-is and validation resumes from there.
+        retx = self.RETX if self.keys else self.X
+        changed = f"{self.RETY} is not {self.Y}"
+        if self.keys:
+            changed = f"{retx} is not {self.X} or {changed}"
+        func.l(f"{self.ITEMS} = enumerate({self.VALUE}.items())")
+        with func.b(f"for i, ({self.X}, {self.Y}) in {self.ITEMS}:") as loop:
+            check(loop)
+            with loop.b(f"if {changed}:") as b:
+                b.l(f"{self.RETVAL} = dict(islice({self.VALUE}.items(), i))")
+                b.l(f"{self.RETVAL}[{retx}] = {self.RETY}")
+                with b.b(f"for i, ({self.X}, {self.Y}) in {self.ITEMS}:") as rest:
+                    check(rest)
+                    rest.l(f"{self.RETVAL}[{retx}] = {self.RETY}")
+                b.l(f"{self.VALUE} = {self.RETVAL}")
+                b.l("break")
+
     def _build_item_validator(self, func: gen.Block) -> Optional[ContextT]:
         if any(
             (
@@ -177,10 +230,11 @@ class MappingConstraints(BaseConstraints):
                 self.values,
             )
         ):
-            with func.b(f"{self.VALUE} = {{") as loop:
-                item_context = self._set_item_validator_loop_line(loop, func.name)
-                loop.l(f"for {self.X}, {self.Y} in {self.VALUE}.items()")
-            func.l("}")
+            item_context: ContextT = {}
+            if any((self.items, self.patterns, self.keys, self.values)):
+                check, item_context = self._get_item_validator(func.name)
+                self._build_item_loop(func, check)
+                item_context["islice"] = itertools.islice
             if self.key_pattern:
                 key_pattern_name = f"{func.name}_key_pattern"
                 with func.b(
@@ -207,7 +261,7 @@ class MappingConstraints(BaseConstraints):
             elif isinstance(dep, MappingConstraints):
                 name = f"__{key}_constr_{uuid.uuid4().int}"
                 line = (
-                    f"{name}.validate({self.VALUE}, field=field) "
+                    f"{name}.validator({self.VALUE}, field=field)[0] "
                     f"if {key!r} in {self.VALUE} else True"
                 )
                 context[name] = dep
@@ -264,7 +318,9 @@ class MappingConstraints(BaseConstraints):
         if not issubclass(self.type, Mapping):
             with func.b(f"if not isinstance({self.VALUE}, Mapping):") as b:
                 b.l(f"return False, {self.VALUE}")
-        func.l(f"valkeys = {{*{self.VALUE}}}")
+        # Only gather the keys if an assertion needs them.
+        if defined_keys:
+            func.l(f"valkeys = {{*{self.VALUE}}}")
         context = BaseConstraints._build_validator(
             self, func=func, context=context, assertions=assertions
         )
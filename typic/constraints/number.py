@@ -5,8 +5,8 @@ import decimal
 from typing import Union, Type, ClassVar, Optional, Dict, List
 
 from typic import gen, util
-from .common import BaseConstraints, ContextT, AssertionsT
-from .error import ConstraintSyntaxError, ConstraintValueError
+from .common import BaseConstraints, ContextT, AssertionsT, failed
+from .error import ConstraintSyntaxError
 
 NumberT = Union[int, float, decimal.Decimal]
 
@@ -197,10 +197,12 @@ class DecimalContraints(NumberConstraints):
         # Add setup/sanity checks for decimals.
         func.l(f"{self.VALUE} = decimal.Decimal({self.VALUE})")
         with func.b(
-            f"if {self.VALUE}.is_infinite():",
-            ConstraintValueError=ConstraintValueError,
+            f"if {self.VALUE}.is_infinite():", failed=failed, __constraints=self
         ) as b:
-            b.l("raise ConstraintValueError('Cannot validate infinite values.')")
+            b.l(
+                f"return False, failed(__constraints, {self.VALUE}, field, "
+                "'Cannot validate infinite values.')"
+            )
         func.l(f"tup = {self.VALUE}.as_tuple()")
         func.l(
             "whole, digits, decimals = _get_digits(tup)",
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
 import builtins
+import dataclasses
 import inspect
 import os
-from typing import TypeVar, Type, Any, TYPE_CHECKING, Mapping
+from typing import (
+    TypeVar,
+    Type,
+    Any,
+    TYPE_CHECKING,
+    Mapping,
+    Dict,
+    Optional,
+    Tuple,
+    Iterable,
+)
 
 from typic import types
-from typic.checks import STDLIB_TYPES
+from typic.checks import STDLIB_TYPES_TUPLE
 from typic.serde import common
-from typic.util import get_name
+from typic.util import get_name, slotted
 
 
 if TYPE_CHECKING:  # pragma: nocover
@@ -24,21 +35,92 @@ class EnvironmentValueError(ValueError): ...
 class EnvironmentTypeError(TypeError): ...
 
 
+@slotted(dict=False)
+@dataclasses.dataclass(frozen=True)
+class EnvVar:
+    """The specification for reading a single variable with :py:meth:`Environ.getmany`."""
+
+    var: str
+    """The name of the variable."""
+    t: Type = Any  # type: ignore
+    """The type to validate the value against."""
+    aliases: Tuple[str, ...] = ()
+    """Other names to look for if `var` is not set."""
+    default: Any = ...
+    """The value to use if the variable isn't set."""
+
+
+class _VersionedEnviron(type(os.environ)):  # type: ignore
+    """The os.environ, counting its changes so snapshots are cheap to invalidate."""
+
+    version = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        _VersionedEnviron.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        _VersionedEnviron.version += 1
+
+
+def _track(environ: Mapping):
+    # Only the stdlib mapping can be swapped in place. Anything else (e.g. a plain
+    #   dict patched in for testing) is compared in full.
+    if type(environ) is _VersionedEnviron.__base__:
+        try:
+            environ.__class__ = _VersionedEnviron
+        except TypeError:  # pragma: nocover
+            pass
+
+
+_track(os.environ)
+if hasattr(os, "environb"):
+    _track(os.environb)
+
+
+class _EnvironIndex:
+    """A case-folded snapshot of the os.environ."""
+
+    __slots__ = ("environ", "version", "data", "folded")
+
+    def __init__(self):
+        self.environ = environ = os.environ
+        self.version = _VersionedEnviron.version
+        self.data = None if isinstance(environ, _VersionedEnviron) else {**environ}
+        self.folded: Dict[str, str] = {k.lower(): v for k, v in environ.items()}
+
+    def valid(self) -> bool:
+        environ = os.environ
+        if environ is not self.environ:
+            return False
+        if self.data is None:
+            return self.version == _VersionedEnviron.version
+        return self.data == environ
+
+
 class Environ:
     """A proxy for the os.environ which allows for getting/setting typed values."""
 
-    def __init__(self, resolver: Resolver):
+    def __init__(self, resolver: Resolver, *, lazy: bool = None):
         self.resolver = resolver
-        for t in STDLIB_TYPES:
-            self.register(t)
+        self._lazy: Dict[str, Type] = {get_name(t): t for t in STDLIB_TYPES_TUPLE}
         for name, t in inspect.getmembers(
             types, lambda o: inspect.isclass(o) and not issubclass(o, Exception)
         ):
-            self.register(t, name=name)
+            self._lazy.setdefault(name, t)
+        self._index: Optional[_EnvironIndex] = None
+        lazy = resolver.lazy if lazy is None else lazy
+        if not lazy:
+            for name in [*self._lazy]:
+                self.register(self._lazy.pop(name), name=name)
 
     def __getattr__(self, item):
-        if inspect.isclass(item):
-            t: Type[_ET] = getattr(builtins, item, None) or globals().get(item)
+        # Handlers for known types are registered on first access in lazy mode.
+        if item in self.__dict__.get("_lazy", ()):
+            return self.register(self._lazy.pop(item), name=item)
+        t = getattr(builtins, item, None)
+        if inspect.isclass(t):
             return self.register(t, name=item)
         raise AttributeError(
             f"{self.__class__.__name__!r} object has no attribute {item!r}"
@@ -90,16 +172,56 @@ class Environ:
             t: If provided, the type to validate the value against.
             ci: Whether the variable should be considered case-insensitive.
         """
+        environ = self.snapshot() if ci else os.environ
+        return self._get(environ, var, default, aliases, t, ci)
+
+    def getmany(self, vars: Mapping[str, EnvVar], *, ci: bool = True) -> Dict[str, Any]:
+        """Get the values of many Environment Variables in a single pass.
+
+        All values are read from the same snapshot of the environment.
+
+        Args:
+            vars: A mapping of keys to the specification of the variable to read.
+
+        Keyword Args:
+            ci: Whether the variables should be considered case-insensitive.
+
+        Returns:
+            The resolved values, with the same keys as `vars`.
+        """
+        environ = self.snapshot() if ci else os.environ
+        get = self._get
+        return {
+            k: get(environ, v.var, v.default, v.aliases, v.t, ci)
+            for k, v in vars.items()
+        }
+
+    def snapshot(self) -> Mapping[str, str]:
+        """Get a case-folded copy of the os.environ.
+
+        The copy is re-used until the environment changes.
+        """
+        index = self._index
+        if index is None or not index.valid():
+            index = self._index = _EnvironIndex()
+        return index.folded
+
+    def _get(
+        self,
+        environ: Mapping[str, str],
+        var: str,
+        default: Any,
+        aliases: Iterable[str],
+        t: Type[_ET],
+        ci: bool,
+    ) -> _ET:
         proto = self.resolver.resolve(t)
-        names = {*aliases}
-        environ: Mapping[str, str] = os.environ
         if ci:
             var = var.lower()
-            names = {v.lower() for v in aliases}
-            environ = {k.lower(): value for k, value in os.environ.items()}
+            aliases = [v.lower() for v in aliases]
         value = environ.get(var, default)
-        if value == default and names:
-            value = next((environ[k] for k in environ.keys() & names), default)
+        if value == default and aliases:
+            value = next((environ[k] for k in aliases if k in environ), default)
         if value is ... and t is Any:
             return None  # type: ignore
         if value is ... and not proto.annotation.optional:
@@ -117,7 +239,7 @@ class Environ:
 
     def setenv(self, var: str, value: Any):
         """Set the `value` as `var` in the OS environ."""
-
+        self._index = None
         if not isinstance(value, (str, bytes)):
             value = self.resolver.tojson(value)
             if isinstance(value, bytes):
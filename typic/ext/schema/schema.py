@@ -25,7 +25,7 @@ from typic.common import ReadOnly, WriteOnly
 from typic.serde.resolver import resolver
 from typic.serde.common import SerdeProtocol, Annotation
 from typic.compat import Final, TypedDict, ForwardRef, Literal
-from typic.util import get_args, origin, get_name
+from typic.util import get_args, origin, get_name, LocalSet
 from typic.checks import istypeddict, isnamedtuple, isliteral, isuniontype
 from typic.types.frozendict import FrozenDict
 
@@ -75,7 +75,7 @@ class SchemaBuilder:
     def __init__(self):
         self.__cache = {}
         self.__attached = set()
-        self.__stack = set()
+        self.__stack: LocalSet[Annotation] = LocalSet()
 
     def attach(self, t: Type):
         self.__attached.add(t)
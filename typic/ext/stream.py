@@ -0,0 +1,338 @@
+"""Incremental JSON decoding and encoding for large inputs and outputs.
+
+Read a file-like object in bounded chunks and deserialize each record as it is
+found, or write an object's JSON in chunks as it is serialized, so memory use is
+bound by the size of the largest record rather than the size of the whole.
+"""
+
+from __future__ import annotations
+
+import codecs
+import dataclasses
+import io
+import json as _json
+from itertools import islice
+from types import GeneratorType
+from typing import (
+    IO,
+    Any,
+    AnyStr,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    TypeVar,
+    Union,
+)
+
+from typic import util
+from typic.compat import Literal
+
+from . import json
+
+__all__ = (
+    "DEFAULT_CHUNK_SIZE",
+    "DecodeFailure",
+    "DecodeIterator",
+    "ErrorPolicyT",
+    "StreamFormatT",
+    "iterencode",
+    "write",
+)
+
+_T = TypeVar("_T")
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+StreamFormatT = Literal["ndjson", "array"]
+ErrorPolicyT = Literal["raise", "skip", "collect"]
+
+_FORMATS = frozenset(("ndjson", "array"))
+_POLICIES = frozenset(("raise", "skip", "collect"))
+_WHITESPACE = " \t\n\r"
+_NUMBER = frozenset("-+.0123456789eE")
+_BATCH_SIZE = 128
+
+
+@util.slotted(dict=False, weakref=True)
+@dataclasses.dataclass(frozen=True)
+class DecodeFailure:
+    """A record which could not be decoded or deserialized."""
+
+    index: int
+    """The position of the record in the stream."""
+    raw: Any
+    """The raw record (a line for NDJSON, the decoded value for a JSON array)."""
+    error: Exception
+    """The error which was raised."""
+
+
+class DecodeIterator(Generic[_T]):
+    """A lazy iterator over the deserialized records of a JSON stream.
+
+    Parameters
+    ----------
+    fp
+        A file-like object, opened in text or binary mode.
+    deserializer
+        The callable used to deserialize each decoded record.
+    format
+        ``"ndjson"`` for newline-delimited JSON, ``"array"`` for a top-level JSON array.
+    errors
+        What to do when a record fails to decode or deserialize:
+          - ``"raise"``: re-raise the error (the default).
+          - ``"skip"``: discard the record and continue.
+          - ``"collect"``: discard the record, continue, and record the failure in
+            :py:attr:`DecodeIterator.errors`.
+    chunk_size
+        The number of bytes (or characters) to read from ``fp`` at a time.
+    loads
+        The decoder used for NDJSON records. Defaults to :py:func:`typic.ext.json.loads`.
+
+    Notes
+    -----
+    In ``"array"`` mode, a malformed record can't be reliably skipped, since the
+    record's boundary is unknown, so syntax errors are always raised.
+    """
+
+    __slots__ = (
+        "fp",
+        "deserializer",
+        "format",
+        "policy",
+        "chunk_size",
+        "loads",
+        "errors",
+        "_iter",
+    )
+
+    def __init__(
+        self,
+        fp: IO[AnyStr],
+        deserializer: Callable[[Any], _T],
+        *,
+        format: StreamFormatT = "ndjson",
+        errors: ErrorPolicyT = "raise",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        loads: Callable[[AnyStr], Any] = None,
+    ):
+        if format not in _FORMATS:
+            raise ValueError(
+                f"Unknown stream format {format!r}. Expected one of {(*_FORMATS,)}."
+            )
+        if errors not in _POLICIES:
+            raise ValueError(
+                f"Unknown error policy {errors!r}. Expected one of {(*_POLICIES,)}."
+            )
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}.")
+        self.fp = fp
+        self.deserializer = deserializer
+        self.format = format
+        self.policy = errors
+        self.chunk_size = chunk_size
+        self.loads = loads or json.loads
+        self.errors: List[DecodeFailure] = []
+        self._iter: Iterator[_T] = (
+            self._iter_ndjson() if format == "ndjson" else self._iter_array()
+        )
+
+    def __iter__(self) -> DecodeIterator[_T]:
+        return self
+
+    def __next__(self) -> _T:
+        return next(self._iter)
+
+    def _fail(self, index: int, raw: Any, error: Exception):
+        if self.policy == "raise":
+            raise error
+        if self.policy == "collect":
+            self.errors.append(DecodeFailure(index=index, raw=raw, error=error))
+
+    def _lines(self) -> Iterator[Union[str, bytes]]:
+        read, size = self.fp.read, self.chunk_size
+        # Only split on "\n": str.splitlines() also splits on characters which are
+        # valid (unescaped) within a JSON string, such as "\u2028".
+        tail: list = []
+        chunk = read(size)
+        newline = b"\n" if isinstance(chunk, bytes) else "\n"
+        while chunk:
+            *lines, last = chunk.split(newline)
+            if lines:
+                if tail:
+                    lines[0] = chunk[:0].join((*tail, lines[0]))
+                    tail.clear()
+                yield from lines
+            # The last line may continue in the next chunk.
+            if last:
+                tail.append(last)
+            chunk = read(size)
+        if tail:
+            yield tail[0][:0].join(tail)
+
+    def _iter_ndjson(self) -> Iterator[_T]:
+        loads, des = self.loads, self.deserializer
+        for index, line in enumerate(x for x in self._lines() if x.strip()):
+            try:
+                yield des(loads(line))
+            except (ValueError, TypeError) as e:
+                self._fail(index, line, e)
+
+    def _iter_array(self) -> Iterator[_T]:
+        read, size = self.fp.read, self.chunk_size
+        raw_decode = _json.JSONDecoder().raw_decode
+        decode_text = codecs.getincrementaldecoder("utf-8")().decode
+        des = self.deserializer
+        buffer, pos, eof = "", 0, False
+
+        def fill(amount: int = size) -> bool:
+            nonlocal buffer, pos, eof
+            if eof:
+                return False
+            chunk = read(amount)
+            text = (
+                decode_text(chunk, final=not chunk)
+                if isinstance(chunk, bytes)
+                else chunk
+            )
+            if not chunk:
+                eof = True
+                return False
+            # Drop what we've consumed so the buffer stays bounded.
+            buffer, pos = buffer[pos:] + text, 0
+            return True
+
+        def skip_whitespace():
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                    pos += 1
+                if pos < len(buffer) or not fill():
+                    return
+
+        skip_whitespace()
+        if buffer[pos : pos + 1] != "[":
+            raise ValueError(
+                "Expected a JSON array at the start of the stream, "
+                f"got {buffer[pos:pos + 20]!r}."
+            )
+        pos += 1
+        index = 0
+        while True:
+            skip_whitespace()
+            token = buffer[pos : pos + 1]
+            if token == "]":
+                return
+            if index:
+                if token != ",":
+                    raise ValueError(
+                        f"Expected ',' or ']' after array item {index - 1}, "
+                        f"got {buffer[pos:pos + 20]!r}."
+                    )
+                pos += 1
+                skip_whitespace()
+            while True:
+                try:
+                    value, end = raw_decode(buffer, pos)
+                except _json.JSONDecodeError:
+                    # The record isn't complete, and will be decoded again from its
+                    #   start. Read at least as much again as we have of it, so a
+                    #   record spanning many chunks is only re-scanned a few times.
+                    if fill(max(size, len(buffer) - pos)):
+                        continue
+                    raise
+                # A number may continue past the end of what we've read so far.
+                if (
+                    end < len(buffer)
+                    and (buffer[pos] not in _NUMBER or buffer[end] not in _NUMBER)
+                ) or not fill():
+                    break
+            pos = end
+            try:
+                yield des(value)
+            except (ValueError, TypeError) as e:
+                self._fail(index, value, e)
+            index += 1
+
+
+def iterencode(
+    primitive: Any,
+    *,
+    array: bool,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dumps: Callable[..., AnyStr] = None,
+) -> Iterator[bytes]:
+    """Encode the output of a serializer to JSON, one chunk at a time.
+
+    Parameters
+    ----------
+    primitive
+        The output of a serializer called with ``lazy=True``.
+    array
+        Whether a lazy `primitive` yields values (an array), rather than key-value
+        pairs (an object).
+    chunk_size
+        The size of the write buffer. A chunk is emitted whenever it's reached.
+    dumps
+        The encoder for each item. Defaults to :py:func:`typic.ext.json.dumps`.
+
+    Notes
+    -----
+    Items yielded by a lazy serializer are already primitives. They are encoded in
+    small, fixed-size batches, so peak memory is bound by the largest items, rather
+    than the whole output.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}.")
+    dumps = dumps or json.dumps
+
+    def encode(o: Any) -> bytes:
+        out = dumps(o)
+        return out.encode() if isinstance(out, str) else out
+
+    buffer = bytearray()
+    for piece in _pieces(primitive, array, encode):
+        buffer += piece
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def _pieces(
+    primitive: Any, array: bool, encode: Callable[[Any], bytes]
+) -> Iterator[bytes]:
+    if not isinstance(primitive, GeneratorType):
+        yield encode(primitive)
+        return
+
+    def key(k: Any) -> str:
+        # Coerce keys to strings as the standard library does (e.g., 1 -> "1").
+        return k if k.__class__ is str else encode(k).decode()
+
+    yield b"[" if array else b"{"
+    sep = b""
+    # Encode items in small batches to amortize the cost of each call to dumps().
+    while True:
+        batch = [*islice(primitive, _BATCH_SIZE)]
+        if not batch:
+            break
+        container = batch if array else {key(k): v for k, v in batch}
+        yield sep + encode(container)[1:-1]
+        sep = b","
+    yield b"]" if array else b"}"
+
+
+def write(chunks: Iterable[bytes], fp: IO) -> int:
+    """Write encoded chunks to a file-like object, returning the number of bytes.
+
+    Text streams (:py:class:`io.TextIOBase`) are written decoded chunks.
+    """
+    text = isinstance(fp, io.TextIOBase)
+    total = 0
+    for chunk in chunks:
+        fp.write(chunk.decode() if text else chunk)
+        total += len(chunk)
+    return total
@@ -1,17 +1,284 @@
 from __future__ import annotations
+import collections
+import collections.abc
 import dataclasses
 import enum
+import functools
+import hashlib
+import importlib.util
 import inspect
 import linecache
+import marshal
+import os
 import pathlib
-import uuid
-from typing import List, Union, Type, Tuple, Optional, TypeVar
+import sys
+import threading
+import zlib
+from types import CodeType
+from typing import (
+    Callable,
+    Iterator,
+    List,
+    Union,
+    Type,
+    Tuple,
+    Optional,
+    TypeVar,
+    Dict,
+)
 
 import typic
 from .util import slotted
 
 _empty = inspect.Parameter.empty
 ParameterKind = inspect._ParameterKind
+CODE_CACHE_ENV = "TYPIC_CODE_CACHE"
+SOURCE_RETENTION_ENV = "TYPIC_SOURCE_RETENTION"
+SOURCE_MAXSIZE_ENV = "TYPIC_SOURCE_MAXSIZE"
+
+
+class CodeCache:
+    """An on-disk cache of the code objects compiled for generated protocols.
+
+    Code objects are keyed by a digest of the generated source and its filename, and
+    stored in a single marshalled bundle per interpreter version. The bundle is loaded
+    once, on the first lookup, and is only written by :py:meth:`CodeCache.save`.
+
+    Since the source is the key, it's still generated for every protocol: the cache
+    only saves compiling it.
+
+    Notes
+    -----
+    The cache is disabled unless a directory is provided, either directly or via the
+    ``TYPIC_CODE_CACHE`` environment variable. Populate it with
+    ``python -m typic compile <module>``.
+    """
+
+    def __init__(self, path: Union[str, pathlib.Path, None] = None):
+        self.path = pathlib.Path(path) if path else None
+        self.hits = 0
+        self.misses = 0
+        self._code: Optional[Dict[str, CodeType]] = None
+        self._new: Dict[str, CodeType] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    @property
+    def bundle(self) -> pathlib.Path:
+        if self.path is None:
+            raise RuntimeError("The code cache is not enabled.")
+        tag = importlib.util.MAGIC_NUMBER.hex()
+        return self.path / f"typic-{tag}.bundle"
+
+    @staticmethod
+    def key(filename: str, source: str) -> str:
+        return hashlib.sha1(f"{filename}\0{source}".encode()).hexdigest()
+
+    def _load(self) -> Dict[str, CodeType]:
+        with self._lock:
+            if self._code is None:
+                code: Dict[str, CodeType] = {}
+                try:
+                    code = marshal.loads(self.bundle.read_bytes())
+                except (OSError, EOFError, ValueError, TypeError):
+                    pass
+                self._code = code
+        return self._code
+
+    def get(self, filename: str, source: str) -> Optional[CodeType]:
+        """Get the cached code object for this source, if any."""
+        if self.path is None:
+            return None
+        key = self.key(filename, source)
+        code = self._load().get(key) or self._new.get(key)
+        if code is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return code
+
+    def set(self, filename: str, source: str, code: CodeType):
+        """Record a freshly-compiled code object, to be written on save."""
+        if self.path is None:
+            return
+        self._new[self.key(filename, source)] = code
+
+    def save(self) -> int:
+        """Merge any newly-compiled code objects into the on-disk bundle.
+
+        Returns
+        -------
+        The total number of code objects in the bundle.
+        """
+        bundle = self.bundle
+        bundle.parent.mkdir(parents=True, exist_ok=True)
+        code = {**self._load(), **self._new}
+        tmp = bundle.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(marshal.dumps(code))
+        os.replace(tmp, bundle)
+        with self._lock:
+            self._code = code
+            self._new = {}
+        return len(code)
+
+
+code_cache = CodeCache(os.environ.get(CODE_CACHE_ENV))
+
+
+class SourceRetention(str, enum.Enum):
+    """How long the source of a generated function is kept for tracebacks."""
+
+    ALL = "all"
+    """Keep every source, verbatim, and on the function's ``__raw__``.
+
+    The default in development mode (``-X dev``).
+    """
+    LRU = "lru"
+    """Keep only the most-recently used sources. The default otherwise."""
+    LAZY = "lazy"
+    """Keep every source compressed, and expand it when a traceback needs it."""
+
+
+class _LazyLines(collections.abc.Sequence):
+    """The lines of a compressed source, expanded on access.
+
+    The last source to be expanded is kept, so a traceback or a reader of the whole
+    source only expands it once.
+    """
+
+    __slots__ = ("_source", "_len")
+
+    _expanded: Tuple[Optional[_LazyLines], List[str]] = (None, [])
+
+    def __init__(self, source: str):
+        self._source = zlib.compress(source.encode())
+        self._len = len(source.splitlines())
+
+    def _lines(self) -> List[str]:
+        expanded, lines = _LazyLines._expanded
+        if expanded is not self:
+            lines = zlib.decompress(self._source).decode().splitlines(True)
+            _LazyLines._expanded = (self, lines)
+        return lines
+
+    def __getitem__(self, item):
+        return self._lines()[item]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._lines())
+
+    def __len__(self) -> int:
+        return self._len
+
+
+class _TouchedLines(collections.abc.Sequence):
+    """The lines of a source, which mark it as recently used when they're read."""
+
+    __slots__ = ("_lines", "_touch")
+
+    def __init__(self, lines: List[str], touch: Callable[[], None]):
+        self._lines = lines
+        self._touch = touch
+
+    def __getitem__(self, item):
+        self._touch()
+        return self._lines[item]
+
+    def __iter__(self) -> Iterator[str]:
+        self._touch()
+        return iter(self._lines)
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+
+class SourceCache:
+    """The sources of generated functions, as they are made available to `linecache`.
+
+    Tracebacks and :py:mod:`inspect` look up source code in :py:mod:`linecache`. Since
+    generated functions have no file, their source is registered there under a unique
+    filename, which would otherwise be retained for the life of the process.
+
+    Notes
+    -----
+    Choose a policy with the ``TYPIC_SOURCE_RETENTION`` environment variable, and the
+    number of sources kept by the ``lru`` policy with ``TYPIC_SOURCE_MAXSIZE``.
+    """
+
+    def __init__(
+        self,
+        retention: Union[SourceRetention, str, None] = None,
+        maxsize: int = 1024,
+    ):
+        if retention is None:
+            retention = SourceRetention.ALL if sys.flags.dev_mode else SourceRetention.LRU
+        self.retention = SourceRetention(retention)
+        self.maxsize = maxsize
+        self._sources: collections.OrderedDict[str, None] = collections.OrderedDict()
+        self._names: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def filename(self, name: str) -> str:
+        """Create a "filename" suitable for a function being generated.
+
+        Filenames are allocated in order, so they're stable across processes.
+        """
+        with self._lock:
+            count = self._names[name] = self._names.get(name, 0) + 1
+        extra = f"-{count}" if count > 1 else ""
+        return f"<typical generated {name}{extra}>"
+
+    def add(self, filename: str, source: str):
+        """Register the source for a generated function with `linecache`."""
+        lines: collections.abc.Sequence = source.splitlines(True)
+        if self.retention is SourceRetention.LAZY:
+            lines = _LazyLines(source)
+        elif self.retention is SourceRetention.LRU:
+            lines = _TouchedLines(lines, functools.partial(self._touch, filename))
+        linecache.cache[filename] = (len(source), None, lines, filename)  # type: ignore
+        if self.retention is not SourceRetention.LRU:
+            return
+        with self._lock:
+            self._sources[filename] = None
+            while len(self._sources) > self.maxsize:
+                evicted, _ = self._sources.popitem(last=False)
+                linecache.cache.pop(evicted, None)
+
+    def _touch(self, filename: str):
+        with self._lock:
+            if filename in self._sources:
+                self._sources.move_to_end(filename)
+
+    def clear(self):
+        """Remove every source registered by this cache from `linecache`."""
+        with self._lock:
+            for filename in [*linecache.cache]:
+                if filename.startswith("<typical generated "):
+                    linecache.cache.pop(filename, None)
+            self._sources.clear()
+
+
+def _source_cache() -> SourceCache:
+    maxsize = os.environ.get(SOURCE_MAXSIZE_ENV)
+    return SourceCache(
+        os.environ.get(SOURCE_RETENTION_ENV) or None,
+        maxsize=int(maxsize) if maxsize else 1024,
+    )
+
+
+source_cache = _source_cache()
+
+
+def getsource(func: Callable) -> Optional[str]:
+    """Get the source of a generated function, if it's still retained."""
+    raw = getattr(func, "__raw__", None)
+    if raw is not None:
+        return raw
+    lines = linecache.getlines(func.__code__.co_filename)
+    return "".join(lines) or None
 
 
 class rawstr(str):
@@ -144,40 +411,7 @@ class Block:
 
     @staticmethod
     def _generate_unique_filename(func_name):
-        """Create a "filename" suitable for a function being generated.
-
-        Notes
-        -----
-        Taken approximately from `attrs`.
-
-        See Also
-        --------
-        https://github.com/python-attrs/attrs/blob/8c00f755f9d91c06fbdd9a20e24d2c4663e6339d/src/attr/_make.py#L1066
-        """
-        unique_id = uuid.uuid4()
-        extra = ""
-        count = 1
-
-        while True:
-            unique_filename = f"<typical generated {func_name}{extra}>"
-            # To handle concurrency we essentially "reserve" our spot in
-            # the linecache with a dummy line.  The caller can then
-            # set this value correctly.
-            cache_line = (1, None, (str(unique_id),), unique_filename)
-            if linecache.cache.setdefault(unique_filename, cache_line) == cache_line:
-                return unique_filename
-
-            # Looks like this spot is taken. Try again.
-            count += 1
-            extra = f"-{count}"
-
-    def _add_to_linecache(self, fname, code):
-        linecache.cache[fname] = (
-            len(self.body),
-            None,
-            code.splitlines(True),
-            fname,
-        )
+        return source_cache.filename(func_name)
 
     def _render_head(self) -> str:
         return ""
@@ -194,11 +428,15 @@ class Block:
         fname = self._generate_unique_filename(func_name=name)
         self.namespace.update(ns)
         code = self.render()
-        bytecode = compile(code, fname, "exec")
+        bytecode = code_cache.get(fname, code)
+        if bytecode is None:
+            bytecode = compile(code, fname, "exec")
+            code_cache.set(fname, code, bytecode)
         eval(bytecode, self.namespace, self.namespace)
         target = self.namespace[name]
-        target.__raw__ = code
-        self._add_to_linecache(fname, code)
+        if source_cache.retention is SourceRetention.ALL:
+            target.__raw__ = code
+        source_cache.add(fname, code)
         return target
 
 
@@ -265,7 +503,8 @@ class Class(Block):
 
 
 # This isn't used or tested. It's just here for API completion.
-# Perhaps an optimization could be to allow users to pre-compile their protocols.
+# Pre-compiled protocols are handled by the `CodeCache`, since most namespaces can't
+# be written to a module.
 @dataclasses.dataclass
 class Module:  # pragma: nocover
     namespace: dict = dataclasses.field(init=False, default_factory=dict)
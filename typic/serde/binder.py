@@ -14,10 +14,10 @@ from typing import (
     Type,
     Callable,
     Mapping,
-    MutableMapping,
 )
 
 from typic import util
+from typic.cache import weakcache
 
 if TYPE_CHECKING:  # pragma: nocover
     from .resolver import Resolver  # noqa: F401
@@ -59,9 +59,13 @@ class BoundArguments:
         return self.obj(*args, **kwargs)
 
 
-class Binder:
-    _ENFORCER_CACHE: MutableMapping[Tuple[Union[Type, Callable], bool], Tuple] = {}
+@weakcache
+def _enforcers(obj: Union[Type, Callable]) -> Dict[bool, Tuple]:
+    """The cached bindings for an object, by strictness."""
+    return {}
+
 
+class Binder:
     def __init__(self, resolver: Resolver):
         self.resolver = resolver
 
@@ -253,13 +257,14 @@ class Binder:
                 "and will be removed in a future version.",
                 category=DeprecationWarning,
             )
-        if (obj, strict) in self.__class__._ENFORCER_CACHE:
-            params, protocols, enforcer = self.__class__._ENFORCER_CACHE[(obj, strict)]
+        enforcers = _enforcers(obj)
+        if strict in enforcers:
+            params, protocols, enforcer = enforcers[strict]
         else:
             params = util.cached_signature(obj).parameters
             protocols = self.resolver.protocols(obj=obj, strict=strict)
             enforcer = self.get_enforcer(parameters=params, protocols=protocols)
-            self.__class__._ENFORCER_CACHE[(obj, strict)] = params, protocols, enforcer
+            enforcers[strict] = params, protocols, enforcer
 
         return BoundArguments(
             obj=obj,
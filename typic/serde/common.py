@@ -23,10 +23,11 @@ from typing import (
     Iterator,
     TYPE_CHECKING,
     Generic,
+    List,
 )
 
 from typic import strict as st, util, constraints as const
-from typic.checks import isclassvartype
+from typic.checks import isclassvartype, ishashable
 from typic.common import AnyOrTypeT, Case, EMPTY, ObjectT, OriginT
 from typic.compat import TypedDict, ForwardRef, evaluate_forwardref, Protocol
 from typic.types import freeze
@@ -35,7 +36,7 @@ if TYPE_CHECKING:  # pragma: nocover
     from .resolver import Resolver
 
 
-@util.slotted(dict=False)
+@util.slotted(dict=False, weakref=True)
 @dataclasses.dataclass(unsafe_hash=True)
 class SerdeProtocol(Generic[OriginT]):
     """An actionable run-time serialization & deserialization protocol for a type."""
@@ -60,19 +61,41 @@ class SerdeProtocol(Generic[OriginT]):
     """Iterate over an instance of the annotation, if possible."""
     tojson: EncoderT[OriginT] = dataclasses.field(repr=False)
     """Dump an instance of the annotation to valid JSON."""
+    deserialize_many: BatchDeserializerT[OriginT] = dataclasses.field(repr=False)
+    """The callable to deserialize an iterable of inputs into the annotation."""
+    validate_many: BatchValidatorT[OriginT] = dataclasses.field(repr=False)
+    """Validate an iterable of inputs against the annotation."""
+    check: const.CheckT[OriginT] = dataclasses.field(repr=False)
+    """Check an input against the annotation, returning a result rather than raising."""
     transmute: DeserializerT[OriginT] = dataclasses.field(repr=False, init=False)
     """Transmute an input into the annotation."""
+    transmute_many: BatchDeserializerT[OriginT] = dataclasses.field(
+        repr=False, init=False
+    )
+    """Transmute an iterable of inputs into the annotation."""
     primitive: SerializerT[OriginT] = dataclasses.field(repr=False, init=False)
     """Get the "primitive" representation of the annotation."""
 
     def __post_init__(self):
         # Pin the transmuter and the primitiver
         self.transmute = self.deserialize
+        self.transmute_many = self.deserialize_many
         self.primitive = self.serialize
 
     def __call__(self, val: ObjectT) -> OriginT:
         return self.transmute(val)  # type: ignore
 
+    def __reduce__(self):
+        # Generated code can't be pickled, so we pickle by reference to the type and
+        #   re-build the protocol (or fetch it from the cache) when unpickling.
+        from .resolver import restore_protocol
+
+        anno = self.annotation
+        return (
+            restore_protocol,
+            (anno.un_resolved, anno.serde.flags, anno.optional, anno.strict),
+        )
+
 
 _OutputT = TypeVar("_OutputT", covariant=True)
 _InputT = TypeVar("_InputT", contravariant=True)
@@ -125,6 +148,28 @@ class DeserializerT(Protocol[_OutputT]):
     def __call__(self, val: Any) -> _OutputT: ...
 
 
+class BatchDeserializerT(Protocol[_OutputT]):
+    """The signature of a type deserializer for an iterable of inputs."""
+
+    __name__: str
+    __qualname__: str
+
+    def __call__(
+        self, values: Iterable[Any], *, lazy: bool = False
+    ) -> Union[List[_OutputT], Iterator[_OutputT]]: ...
+
+
+class BatchValidatorT(Protocol[_OutputT]):
+    """The signature of a type validator for an iterable of inputs."""
+
+    __name__: str
+    __qualname__: str
+
+    def __call__(
+        self, values: Iterable[Any], *, lazy: bool = False
+    ) -> Union[List[_OutputT], Iterator[_OutputT]]: ...
+
+
 class FieldIteratorT(Protocol[_InputT]):
     """The type-signature for a FieldIterator function."""
 
@@ -183,6 +228,8 @@ class SerdeFlags:
     """Provide a callable which can encode your data to a bytes/binary output."""
     decoder: Optional[DecoderT] = None
     """Provide a callable with can decode a bytes/binary input for deserialization."""
+    fused: bool = False
+    """Validate and deserialize a strict mapping input in a single pass, if possible."""
 
     def __init__(
         self,
@@ -194,6 +241,7 @@ class SerdeFlags:
         exclude: Iterable[str] = None,
         encoder: EncoderT = None,
         decoder: DecoderT = None,
+        fused: bool = False,
     ):
         self.signature_only = signature_only
         self.case = case
@@ -202,6 +250,7 @@ class SerdeFlags:
         self.exclude = cast(Iterable[str], freeze(exclude)) or ()
         self.encoder = encoder
         self.decoder = decoder
+        self.fused = fused
 
     def merge(self, other: "SerdeFlags") -> "SerdeFlags":
         """Merge the values of another SerdeFlags instance into this one."""
@@ -227,6 +276,7 @@ class SerdeFlags:
             exclude = other.exclude or self.exclude  # type: ignore
         encoder = other.encoder or self.encoder
         decoder = other.decoder or self.decoder
+        fused = self.fused or other.fused
         return SerdeFlags(
             signature_only=signature_only,
             case=case,
@@ -235,6 +285,7 @@ class SerdeFlags:
             exclude=exclude,
             encoder=encoder,
             decoder=decoder,
+            fused=fused,
         )
 
 
@@ -287,6 +338,27 @@ class SerdeConfig:
 _AT = TypeVar("_AT")
 
 
+class _Identity:
+    """A hashable stand-in for an unhashable object, compared by identity.
+
+    The object is held by the key, so its id can't be re-used while the key is alive.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+    def __eq__(self, other: Any) -> bool:
+        return other.__class__ is _Identity and other.obj is self.obj
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.obj!r})"
+
+
 @util.slotted(dict=False)
 @dataclasses.dataclass(unsafe_hash=True)
 class Annotation(Generic[_AT]):
@@ -332,6 +404,26 @@ class Annotation(Generic[_AT]):
         self.generic = getattr(self.resolved, "__origin__", self.resolved_origin)
         self.is_class_var = isclassvartype(self.un_resolved)
 
+    def signature(self) -> Tuple[Any, ...]:
+        """A structural key for the protocols generated from this annotation.
+
+        Unlike the hash of the annotation, this ignores the parameter name, so
+        fields which share a type, default, and settings may share a protocol.
+        """
+        default = self.parameter.default
+        if not ishashable(default):
+            default = _Identity(default)
+        return (
+            self.resolved,
+            self.origin,
+            self.optional,
+            self.strict,
+            self.static,
+            self.parameter.default.__class__,
+            default,
+            self.serde.flags,
+        )
+
 
 _empty = object()
 
@@ -379,7 +471,7 @@ class ForwardDelayedAnnotation:
                         f"Make sure this type is available in {self.module}."
                     )
                     type = Any
-            anno = self.resolver.annotation(
+            self._resolved = self.resolver._resolve_delayed(
                 type,
                 name=self._name,
                 parameter=self.parameter,
@@ -388,7 +480,6 @@ class ForwardDelayedAnnotation:
                 flags=self.flags,
                 default=EMPTY if self.default is _empty else self.default,
             )
-            self._resolved = self.resolver._resolve_from_annotation(anno)
         return self._resolved
 
     @property
@@ -423,7 +514,7 @@ class DelayedAnnotation:
     @property
     def resolved(self):
         if self._resolved is None:
-            anno = self.resolver.annotation(
+            self._resolved = self.resolver._resolve_delayed(
                 self.type,
                 name=self._name,
                 parameter=self.parameter,
@@ -432,7 +523,6 @@ class DelayedAnnotation:
                 flags=self.flags,
                 default=EMPTY if self.default is _empty else self.default,
             )
-            self._resolved = self.resolver._resolve_from_annotation(anno)
         return self._resolved
 
     @property
@@ -479,6 +569,9 @@ class DelayedSerdeProtocol(SerdeProtocol):
             translate=protocol.translate,
             iterate=protocol.iterate,
             tojson=protocol.tojson,
+            deserialize_many=protocol.deserialize_many,
+            validate_many=protocol.validate_many,
+            check=protocol.check,
         )
         self._resolved = True
 
@@ -489,6 +582,24 @@ class DelayedSerdeProtocol(SerdeProtocol):
     def __call__(self, val: Any) -> ObjectT:
         return self.transmute(val)  # type: ignore
 
+    def __reduce__(self):
+        if self._resolved:
+            return super().__reduce__()
+        # Pickle the delayed annotation rather than resolving it for its type.
+        #   The resolver and frame belong to this process and a ForwardRef can't be
+        #   pickled, so they're replaced when unpickling.
+        from .resolver import restore_delayed_protocol
+
+        delayed = self.delayed
+        fields = {
+            f.name: getattr(delayed, f.name)
+            for f in dataclasses.fields(delayed)
+            if f.name not in {"resolver", "frame", "_resolved"}
+        }
+        if "ref" in fields:
+            fields["ref"] = fields["ref"].__forward_arg__
+        return restore_delayed_protocol, (delayed.__class__, fields)
+
 
 SerdeProtocolsT = Dict[str, SerdeProtocol]
 """A mapping of attr/param name to :py:class:`SerdeProtocol`."""
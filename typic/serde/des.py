@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import dataclasses
 import datetime
+import decimal
 import functools
 import inspect
+import keyword
+import os
 import pathlib
 import re
 import uuid
+import weakref
 from collections import deque, defaultdict, abc
 from operator import attrgetter
 from typing import (
@@ -25,35 +29,43 @@ from typing import (
     Optional,
     Set,
     NoReturn,
+    MutableSet,
 )
 
 from pendulum import parse as dateparse, DateTime, instance
 
 from typic import checks, gen
+from typic.cache import caches
 from typic.strict import STRICT_MODE
 from typic.util import (
     safe_eval,
     cached_issubclass,
     cached_signature,
+    get_args,
     get_defname,
     get_tag_for_types,
     get_unique_name,
     get_name,
     slotted,
 )
-from typic.common import DEFAULT_ENCODING, ObjectT
+from typic.common import ADAPTIVE_UNIONS_ENV, DEFAULT_ENCODING, ObjectT
 from typic.compat import TypeGuard, Literal
+from . import iso
 from .common import (
+    BatchDeserializerT,
     DeserializerT,
     DeserializerRegistryT,
     SerdeConfig,
+    SerdeProtocol,
     Annotation,
     DelayedAnnotation,
+    DelayedSerdeProtocol,
     ForwardDelayedAnnotation,
     AnnotationT,
 )
 
 if TYPE_CHECKING:  # pragma: nocover
+    from typic.constraints import ObjectConstraints
     from .resolver import Resolver
 
 _ORIG_SETTER_NAME = "__setattr_original__"
@@ -75,6 +87,62 @@ _TO_RESOLVE: List[Union[Type, Callable]] = []
 _SCHEMA_NAME = "__json_schema__"
 
 
+def _adaptive_unions_init() -> bool:
+    return os.environ.get(ADAPTIVE_UNIONS_ENV, "").lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
+
+
+class UnionDispatch:
+    """An adaptive table of the members to attempt for each type of input to a Union.
+
+    Each type of input gets its own order of attempts, which starts in the order of
+    the Union's members. When a member succeeds, it moves ahead of any member which has
+    succeeded fewer times for the same type of input. The table doesn't keep the types
+    of input alive, so an entry for a class created at runtime is released with it.
+    """
+
+    __slots__ = ("label", "names", "table", "hooks", "__weakref__")
+
+    def __init__(self, label: str, names: Tuple[str, ...]):
+        self.label = label
+        self.names = names
+        self.table: Dict[weakref.ref, Tuple[List[int], List[int]]] = {}
+        """The order of attempts and the counts for each type of input.
+
+        The types are keyed by their shared, callback-free weak reference, so a lookup
+        doesn't allocate a new one. The counts are the successes for each member, then
+        the failed attempts.
+        """
+        self.hooks: Dict[weakref.ref, weakref.ref] = {}
+        """The references which remove an entry once its type is collected."""
+
+    def add(self, t: Type) -> Tuple[List[int], List[int]]:
+        key = weakref.ref(t)
+        n = len(self.names)
+        entry = self.table[key] = ([*range(n)], [0] * (n + 1))
+        if key not in self.hooks:
+            table, hooks = self.table, self.hooks
+
+            def remove(_, key=key):
+                table.pop(key, None)
+                hooks.pop(key, None)
+
+            self.hooks[key] = weakref.ref(t, remove)
+        return entry
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """The counts for each type of input, by member name."""
+        return {
+            get_name(t): {**dict(zip(self.names, counts)), "failures": counts[-1]}
+            for key, (order, counts) in [*self.table.items()]
+            if (t := key()) is not None
+        }
+
+
 class DesFactory:
     """A callable class for ``des``erialzing values.
 
@@ -113,11 +181,33 @@ class DesFactory:
     )
     VNAME = "val"
     VTYPE = "vtype"
-    __DES_CACHE: Dict[str, DeserializerT] = {}
+    # Types whose deserializers return an input of that exact type unchanged.
+    INLINE_TYPES = frozenset((int, float, str, bool, bytes, decimal.Decimal, uuid.UUID))
     __USER_DESS: DeserializerRegistryT = deque()
 
-    def __init__(self, resolver: Resolver):
+    def __init__(self, resolver: Resolver, *, adaptive_unions: bool = None):
         self.resolver = resolver
+        # Deserializers refer to the resolver which built them, so they aren't shared.
+        self._deserializer_cache = caches.cache("des.factory")
+        self.adaptive_unions = (
+            _adaptive_unions_init() if adaptive_unions is None else adaptive_unions
+        )
+        """Whether to re-order the attempts for a Union by how often each succeeds.
+
+        Only applies to Unions which can't be discriminated by a tag.
+        """
+        self.__dispatches: MutableSet[UnionDispatch] = weakref.WeakSet()
+
+    def dispatch_stats(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """The counts for each adaptive Union, by type of input and member name."""
+        stats: Dict[str, Dict[str, Dict[str, int]]] = {}
+        for dispatch in self.__dispatches:
+            label = stats.setdefault(dispatch.label, {})
+            for t, counts in dispatch.stats().items():
+                merged = label.setdefault(t, dict.fromkeys(counts, 0))
+                for name, count in counts.items():
+                    merged[name] += count
+        return stats
 
     def register(self, deserializer: DeserializerT, check: DeserializerT):
         """Register a user-defined coercer.
@@ -132,11 +222,15 @@ class DesFactory:
     def _set_checks(self, func: gen.Block, anno_name: str, annotation: Annotation):
         _ctx = {}
         # run a safe eval if input is text and anno isn't
-        if inspect.isclass(annotation.resolved_origin) and (
-            issubclass(annotation.resolved_origin, (str, bytes))
-            or checks.isdecimaltype(annotation.resolved_origin)
+        origin = annotation.resolved_origin
+        isclass = inspect.isclass(origin)
+        if isclass and (
+            issubclass(origin, (str, bytes)) or checks.isdecimaltype(origin)
         ):
             self._add_vtype(func)
+        elif isclass and (checks.isdatetype(origin) or checks.istimetype(origin)):
+            # ISO-8601 strings are never evaluated, so skip straight to the parser.
+            self._add_eval(func, skip=iso.match)
         else:
             self._add_eval(func)
         # Equality checks for defaults and optionals
@@ -171,9 +265,18 @@ class DesFactory:
             with func.b(f"if {check}:", **_ctx) as b:  # type: ignore
                 b.l(f"return {self.VNAME}")
 
-    @staticmethod
-    def _get_name(annotation: Annotation) -> str:
-        return get_defname("deserializer", annotation)
+    def _get_key(
+        self, annotation: Annotation, namespace: Type = None
+    ) -> Tuple[Any, ...]:
+        # Unions are built differently when adaptive dispatch is enabled.
+        key = (*annotation.signature(), self.adaptive_unions)
+        # Forward references are resolved relative to the namespace.
+        if _has_forwardref(annotation.resolved):
+            key = (*key, namespace)
+        return key
+
+    def _get_name(self, annotation: Annotation, namespace: Type = None) -> str:
+        return get_defname("deserializer", self._get_key(annotation, namespace))
 
     def _build_date_des(self, context: BuildContext):
         func, annotation, anno_name = (
@@ -188,7 +291,7 @@ class DesFactory:
         # From a string
         with func.b(f"elif isinstance({self.VNAME}, (str, bytes)):") as b:
             line = f"{self.VNAME} = dateparse({self.VNAME})"
-            b.l(line, dateparse=dateparse)
+            b.l(line, dateparse=iso.parse)
         if issubclass(origin, datetime.datetime):
             with func.b(
                 f"if isinstance({self.VNAME}, datetime):", datetime=datetime.datetime
@@ -229,8 +332,8 @@ class DesFactory:
         with func.b(f"elif isinstance({self.VNAME}, (int, float)):") as b:
             b.l(f"{self.VNAME} = {anno_name}.fromtimestamp({self.VNAME})")
         with func.b(f"elif isinstance({self.VNAME}, (str, bytes)):") as b:
-            line = f"{self.VNAME} = dateparse({self.VNAME}, exact=True)"
-            b.l(line, dateparse=dateparse)
+            line = f"{self.VNAME} = dateparse_exact({self.VNAME})"
+            b.l(line, dateparse_exact=iso.parse_exact)
 
     def _build_time_des(self, context: BuildContext):
         func, anno_name = context.func, context.anno_name
@@ -239,8 +342,8 @@ class DesFactory:
             b.l(f"{self.VNAME} = {anno_name}(int({self.VNAME}))")
         # From a string
         with func.b(f"elif isinstance({self.VNAME}, (str, bytes)):") as b:
-            line = f"{self.VNAME} = dateparse({self.VNAME}, exact=True)"
-            b.l(line, dateparse=dateparse)
+            line = f"{self.VNAME} = dateparse_exact({self.VNAME})"
+            b.l(line, dateparse_exact=iso.parse_exact)
         # From a datetime
         with func.b(
             f"if isinstance({self.VNAME}, datetime):", datetime=datetime.datetime
@@ -257,8 +360,13 @@ class DesFactory:
             b.l(f"{self.VNAME} = {anno_name}(int({self.VNAME}))")
         # From a string
         with func.b(f"elif isinstance({self.VNAME}, (str, bytes)):") as b:
-            line = f"{self.VNAME} = dateparse({self.VNAME}, exact=True)"
-            b.l(line, dateparse=dateparse)
+            # ISO-8601 durations may be negated with a leading sign, e.g. `-P1D`.
+            with b.b(
+                f"if {self.VNAME}[:1] in ('-', b'-'):", dateparse=dateparse
+            ) as n:
+                n.l(f"{self.VNAME} = -dateparse({self.VNAME}[1:], exact=True)")
+            with b.b("else:") as p:
+                p.l(f"{self.VNAME} = dateparse({self.VNAME}, exact=True)")
 
     def _build_uuid_des(self, context: BuildContext):
         func, anno_name = context.func, context.anno_name
@@ -278,12 +386,19 @@ class DesFactory:
         with func.b(f"elif isinstance({self.VNAME}, tuple):") as b:
             b.l(f"{self.VNAME} = {anno_name}(fields={self.VNAME})")
 
-    def _add_eval(self, func: gen.Block):
+    def _add_eval(self, func: gen.Block, skip: Callable[[str], Any] = None):
+        check, ns = f"isinstance({self.VNAME}, (str, bytes))", {"__eval": safe_eval}
+        # Strings which `skip` matches are passed through as-is.
+        if skip:
+            check += (
+                f" and not ({self.VNAME}.__class__ is str and __skip({self.VNAME}))"
+            )
+            ns["__skip"] = skip
         func.l(
             f"_, {self.VNAME} = __eval({self.VNAME}) "
-            f"if isinstance({self.VNAME}, (str, bytes)) "
+            f"if {check} "
             f"else (False, {self.VNAME})",
-            __eval=safe_eval,
+            **ns,
         )
         self._add_vtype(func)
 
@@ -291,6 +406,35 @@ class DesFactory:
         with func.b(f"if {self.VTYPE} is {anno_name}:") as b:
             b.l(f"{gen.Keyword.RET} {self.VNAME}")
 
+    def _inline_type(self, protocol: SerdeProtocol) -> Optional[Type]:
+        # The exact type which `protocol` passes through, if it is trivial.
+        if isinstance(protocol, DelayedSerdeProtocol):
+            return None
+        annotation = protocol.annotation
+        if (
+            not isinstance(annotation, Annotation)
+            or annotation.resolved not in self.INLINE_TYPES
+            or any(check(annotation.resolved) for check, _ in self.__USER_DESS)
+        ):
+            return None
+        return annotation.resolved
+
+    def _inline(
+        self, func: gen.Block, protocol: SerdeProtocol, name: str, var: str
+    ) -> str:
+        """Get an expression which deserializes `var` with the given protocol.
+
+        Trivial protocols are inlined as an exact type-check, so values which are
+        already the correct type skip the function call.
+        """
+        call = f"{name}({var})"
+        t = self._inline_type(protocol)
+        if t is None:
+            return call
+        tname = f"__inline_{get_name(t)}"
+        func.namespace[tname] = t
+        return f"({var} if {var}.__class__ is {tname} else {call})"
+
     def _add_vtype(self, func: gen.Block):
         func.l(f"{self.VTYPE} = {self.VNAME}.__class__")
 
@@ -482,8 +626,8 @@ class DesFactory:
                 x = "fields_in.get(x, x)"
             # If there are only serializers, get the serialized value
             elif args:
-                x = f"{kd_name}(x)"
-                y = f"{it_name}(y)"
+                x = self._inline(func, key_des, kd_name, "x")
+                y = self._inline(func, item_des, it_name, "y")
             line = f"{anno_name}({{{x}: {y} for x, y in {iterate}}})"
             line_values = f"{anno_name}({{{x}: {y} for x, y in {iterate_values}}})"
         # If we don't have nested annotations, we can short-circuit on valid inputs
@@ -499,8 +643,8 @@ class DesFactory:
                 b.l(f"{self.VNAME} = {line}")
         func.namespace.update(
             {
-                kd_name: key_des,
-                it_name: item_des,
+                kd_name: key_des and key_des.transmute,
+                it_name: item_des and item_des.transmute,
                 "Mapping": abc.Mapping,
                 "iterate": self.resolver.iterate,
                 "ismappingtype": checks.ismappingtype,
@@ -555,22 +699,36 @@ class DesFactory:
             item_des = self.resolver.resolve(
                 item_type, flags=annotation.serde.flags, namespace=namespace
             )
-            line = (
-                f"{self.VNAME} = "
-                f"{anno_name}({it_name}(x) for x in parent({iterate}))"
-            )
+            x = self._inline(func, item_des, it_name, "x")
+            line = f"{self.VNAME} = {anno_name}({x} for x in parent({iterate}))"
         else:
             self._add_type_check(func, anno_name)
         func.l(
             line,
             level=None,
             **{
-                it_name: item_des,
+                it_name: item_des and item_des.transmute,
                 "Collection": abc.Collection,
                 "iterate": self.resolver.iterate,
             },
         )
 
+    def _build_enum_des(self, context: BuildContext):
+        func, anno_name = context.func, context.anno_name
+        origin = context.annotation.resolved_origin
+        self._add_type_check(func, anno_name)
+        if issubclass(origin, str):
+            with func.b(f"if isinstance({self.VNAME}, (bytes, bytearray)):") as b:
+                b.l(f"{self.VNAME} = {self.VNAME}.decode({DEFAULT_ENCODING!r})")
+        # Look up the member by value. Fall back to the enum for unhashable values
+        #   and its `_missing_` hook.
+        members = {m.value: m for m in origin if checks.ishashable(m.value)}
+        with func.b("try:", __members=members) as b:
+            b.l(f"{gen.Keyword.RET} __members[{self.VNAME}]")
+        with func.b("except (KeyError, TypeError):") as b:
+            b.l("pass")
+        func.l(f"{self.VNAME} = {anno_name}({self.VNAME})")
+
     def _build_decimal_des(self, context: BuildContext):
         func, anno_name = context.func, context.anno_name
         self._add_type_check(func, anno_name)
@@ -581,6 +739,82 @@ class DesFactory:
         self._add_type_check(func, anno_name)
         func.l(f"{self.VNAME} = {anno_name}({self.VNAME})")
 
+    def _user_type_fields(
+        self, annotation: Annotation, namespace: Type = None
+    ) -> Tuple[
+        Mapping[str, str], Callable[[str, str], str], str, str, Dict[str, Any]
+    ]:
+        """Get the input fields of a user-defined type and how to deserialize them.
+
+        Returns the input fields mapped to their field names, a function which gets an
+        expression deserializing one field, the expressions for the key and value of
+        a field in a mapping, and the context for those expressions.
+        """
+        serde = annotation.serde
+        resolved = annotation.resolved
+        # Default X - translate given `x` to known input `x`
+        x = "fields_in[x]"
+        # No field name translation needs to happen.
+        if {*serde.fields_in.keys()} == {*serde.fields_in.values()}:
+            x = "x"
+
+        # Default Y - get the given `y` with the given `x`
+        y = f"{self.VNAME}[x]"
+        # Happy path! This is a `@typic.al` wrapped class.
+        if self.resolver.known(resolved) or self.resolver.delayed(resolved):
+            return serde.fields_in, lambda f, val: val, x, y, {}
+        # Secondary happy path! We know how to deserialize already.
+        # Get the intersection of known input fields and annotations.
+        matched = [f for f in serde.fields_in.values() if f in serde.fields]
+        fields_in = serde.fields_in
+        fnamespace = namespace or resolved
+        if serde.fields and len(matched) == len(serde.fields_in):
+            protocols = {
+                f: self.resolver._resolve_from_annotation(
+                    serde.fields[f], namespace=fnamespace
+                )
+                for f in matched
+            }
+        else:
+            protocols = self.resolver.protocols(annotation.resolved_origin)
+            fields_in = {x: x for x in protocols}
+        desers = {f: p.transmute for f, p in protocols.items()}
+        y = f"desers[{x}]({self.VNAME}[x])"
+        # Skip the call for fields whose values are already the correct type.
+        inline = {f: self._inline_type(p) for f, p in protocols.items()}
+        if any(inline.values()):
+            y = (
+                f"(y if (y := {self.VNAME}[x]).__class__ is inline[{x}] "
+                f"else desers[{x}](y))"
+            )
+        names = {f: f"__field_des_{i}" for i, f in enumerate(desers)}
+
+        def value(f, val):
+            if inline[f] is None:
+                return f"{names[f]}({val})"
+            return f"(y if (y := {val}).__class__ is {names[f]}_t else {names[f]}(y))"
+
+        ns = dict(desers=desers, fields_in=fields_in, inline=inline)
+        ns.update({names[f]: d for f, d in desers.items()})
+        ns.update({f"{names[f]}_t": t for f, t in inline.items() if t})
+        return fields_in, value, x, y, ns
+
+    def _unrolled_fields(
+        self, fields: Mapping[str, str], value: Callable[[str, str], str]
+    ) -> Optional[str]:
+        """Get the keyword arguments which pass each field of a mapping directly.
+
+        There are none if the field names can't all be passed as keywords.
+        """
+        names = {*fields.values()}
+        if len(names) < len(fields) or not all(
+            f.isidentifier() and not keyword.iskeyword(f) for f in names
+        ):
+            return None
+        return ", ".join(
+            f"{f}={value(f, f'{self.VNAME}[{i!r}]')}" for i, f in fields.items()
+        )
+
     def _build_user_type_des(self, context: BuildContext):
         func, annotation, namespace, anno_name = (
             context.func,
@@ -588,8 +822,6 @@ class DesFactory:
             context.namespace,
             context.anno_name,
         )
-        serde = annotation.serde
-        resolved = annotation.resolved
         self._add_type_check(func, anno_name)
         # Main branch - we have a mapping for a user-defined class.
         # This is where the serde configuration comes in.
@@ -603,40 +835,19 @@ class DesFactory:
             def mainline(k, v):
                 return f"{{{k}: {v} for x in fields_in.keys() & {self.VNAME}.keys()}}"
 
-            # The "happy path" - e.g., no guesswork needed.
-            def happypath(k, v, **ns):
-                b.l(f"{self.VNAME} = {anno_name}(**{mainline(k, v)})", **ns)
-
-            # Default X - translate given `x` to known input `x`
-            x = "fields_in[x]"
-            # No field name translation needs to happen.
-            if {*serde.fields_in.keys()} == {*serde.fields_in.values()}:
-                x = "x"
-
-            # Default Y - get the given `y` with the given `x`
-            y = f"{self.VNAME}[x]"
-            # Get the intersection of known input fields and annotations.
-            matched = {*serde.fields_in.values()} & serde.fields.keys()
-            # Happy path! This is a `@typic.al` wrapped class.
-            if self.resolver.known(resolved) or self.resolver.delayed(resolved):
-                happypath(x, y)
-            # Secondary happy path! We know how to deserialize already.
+            fields, value, x, y, ns = self._user_type_fields(annotation, namespace)
+            # The "happiest path" - every known field is present in the input.
+            #   Pass each field directly, rather than building a dict of them.
+            kwargs = self._unrolled_fields(fields, value)
+            if kwargs is None:
+                # The "happy path" - e.g., no guesswork needed.
+                b.l(f"{self.VNAME} = {anno_name}(**{mainline(x, y)})", **ns)
             else:
-                fields_in = serde.fields_in
-                fnamespace = namespace or resolved
-                if serde.fields and len(matched) == len(serde.fields_in):
-                    desers = {
-                        f: self.resolver._resolve_from_annotation(
-                            serde.fields[f], namespace=fnamespace
-                        ).transmute
-                        for f in matched
-                    }
-                else:
-                    protocols = self.resolver.protocols(annotation.resolved_origin)
-                    fields_in = {x: x for x in protocols}
-                    desers = {f: p.transmute for f, p in protocols.items()}
-                y = f"desers[{x}]({self.VNAME}[x])"
-                happypath(x, y, desers=desers, fields_in=fields_in)
+                ns["__fields_in_keys"] = frozenset(fields)
+                with b.b(f"if {self.VNAME}.keys() >= __fields_in_keys:", **ns) as ub:
+                    ub.l(f"{self.VNAME} = {anno_name}({kwargs})")
+                with b.b("else:") as eb:
+                    eb.l(f"{self.VNAME} = {anno_name}(**{mainline(x, y)})")
 
         # Secondary branch - we have some other input for a user-defined class
         func.l("# Unknown path, just try casting it directly.")
@@ -750,11 +961,14 @@ class DesFactory:
                     continue
                 with func.b(f"if issubclass({name}, {self.VTYPE}):") as b:
                     b.l(f"return {name}_des({self.VNAME})")
-            for name in desers:
-                with func.b("try:") as b:
-                    b.l(f"return {name}({self.VNAME})")
-                with func.b("except (TypeError, ValueError, KeyError):") as b:
-                    b.l("pass")
+            if self.adaptive_unions:
+                self._build_union_dispatch(context, annos)
+            else:
+                for name in desers:
+                    with func.b("try:") as b:
+                        b.l(f"return {name}({self.VNAME})")
+                    with func.b("except (TypeError, ValueError, KeyError):") as b:
+                        b.l("pass")
             func.namespace.update(ctx)
             func.l(
                 "raise ValueError("
@@ -763,6 +977,37 @@ class DesFactory:
             )
             return False
 
+    def _build_union_dispatch(
+        self, context: BuildContext, annos: Mapping[str, SerdeProtocol]
+    ):
+        func, annotation = context.func, context.annotation
+        label = repr(annotation.resolved).replace("typing.", "")
+        dispatch = UnionDispatch(label, (*annos,))
+        self.__dispatches.add(dispatch)
+        func.namespace.update(
+            dispatch=dispatch,
+            table=dispatch.table,
+            members=(*(p.transmute for p in annos.values()),),
+        )
+        func.l(
+            f"order, counts = table.get(__ref({self.VTYPE})) "
+            f"or dispatch.add({self.VTYPE})",
+            __ref=weakref.ref,
+        )
+        # Iterate over a snapshot, since a concurrent call may re-order the table.
+        with func.b("for pos, i in enumerate((*order,)):") as loop:
+            with loop.b("try:") as b:
+                b.l(f"{self.VNAME} = members[i]({self.VNAME})")
+            with loop.b("except (TypeError, ValueError, KeyError):") as b:
+                b.l("counts[-1] += 1")
+                b.l("continue")
+            loop.l("counts[i] += 1")
+            # Only promote the member if it hasn't been moved since the snapshot.
+            loop.l("prev = order[pos - 1] if pos and order[pos] == i else i")
+            with loop.b("if counts[i] > counts[prev]:") as b:
+                b.l("order[pos - 1], order[pos] = i, prev")
+            loop.l(f"return {self.VNAME}")
+
     def _build_des(  # noqa: C901
         self,
         annotation: Annotation[Type[ObjectT]],
@@ -816,6 +1061,7 @@ class DesFactory:
         lambda origin, args: origin in {Pattern, re.Pattern}: _build_pattern_des,
         lambda origin, args: issubclass(origin, pathlib.Path): _build_path_des,
         lambda origin, args: checks.isdecimaltype(origin): _build_decimal_des,
+        lambda origin, args: checks.isenumtype(origin): _build_enum_des,
         # MUST come before subtype check.
         lambda origin, args: (
             not args and checks.isbuiltintype(origin)
@@ -837,26 +1083,233 @@ class DesFactory:
         lambda origin, args: True: _build_user_type_des,
     }
 
+    def _batch_row(
+        self, annotation: Annotation, handler: Callable[[Any], Any]
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Get the body of `handler` for a mapping with every field, if possible.
+
+        This is the "happiest path" of a deserializer for a user-defined type, so only a
+        deserializer built by :py:meth:`_build_user_type_des` can be inlined.
+        """
+        origin = annotation.resolved_origin
+        if (
+            _has_forwardref(annotation.resolved)
+            or handler is not self._deserializer_cache.get(self._get_key(annotation))
+            or checks.isliteral(origin)
+            or origin in self.UNRESOLVABLE
+            or any(check(annotation.resolved) for check, _ in self.__USER_DESS)
+        ):
+            return None
+        args = annotation.args
+        build = next(h for c, h in self._HANDLERS.items() if c(origin, args))
+        if build is not DesFactory._build_user_type_des:
+            return None
+        fields, value, _, _, ns = self._user_type_fields(annotation)
+        kwargs = self._unrolled_fields(fields, value)
+        if kwargs is None:
+            return None
+        anno_name = get_unique_name(origin)
+        # The unrolled fields only need their deserializers and inline types.
+        ns = {n: o for n, o in ns.items() if n.startswith("__field_des_")}
+        ns.update({anno_name: origin, "__fields_in_keys": frozenset(fields)})
+        return f"{anno_name}({kwargs})", ns
+
+    def _build_batch(
+        self,
+        handler: Callable[[Any], ObjectT],
+        func_name: str,
+        annotation: Optional[Annotation[Type[ObjectT]]] = None,
+    ) -> BatchDeserializerT[ObjectT]:
+        ns: Dict[str, Any] = {"__handler": handler}
+        row = annotation and self._batch_row(annotation, handler)
+        if row:
+            # Inline the row body, so the common case skips the per-row checks.
+            body, row_ns = row
+            ns.update(row_ns)
+            each = (
+                f"{body} if {self.VNAME}.__class__ is dict "
+                f"and {self.VNAME}.keys() >= __fields_in_keys "
+                f"else __handler({self.VNAME}) for {self.VNAME} in values"
+            )
+        else:
+            each = f"__handler({self.VNAME}) for {self.VNAME} in values"
+        with gen.Block(ns) as main:
+            with main.f(
+                func_name,
+                main.param("values"),
+                main.param("lazy", kind=_KEYWORD_ONLY, default=False),
+            ) as func:
+                # Bind the row handler and field deserializers once, outside the loop.
+                func.localize_context(*ns)
+                # A string must hold an array, or we'd iterate over its characters.
+                with func.b(
+                    "if isinstance(values, (str, bytes)):", __eval=safe_eval
+                ) as b:
+                    b.l("_, values = __eval(values)")
+                    with b.b("if not isinstance(values, (list, tuple)):") as bb:
+                        bb.l(
+                            "raise ValueError("
+                            'f"Expected an array of values, got {values!r}"'
+                            ")"
+                        )
+                with func.b("if lazy:") as b:
+                    b.l(f"{gen.Keyword.RET} ({each})")
+                func.l(f"{gen.Keyword.RET} [{each}]")
+        batch: BatchDeserializerT = main.compile(ns=ns, name=func_name)
+        return batch
+
+    def _field_annotations(self, annotation: Annotation) -> Mapping[str, Any]:
+        # Mirror the field protocols selected in `_build_user_type_des`.
+        origin = annotation.resolved_origin
+        if self.resolver.known(origin):
+            protos = getattr(origin, _TYPIC_ANNOS_NAME, None) or {}
+            return {f: p.annotation for f, p in protos.items()}
+        serde = annotation.serde
+        matched = [f for f in serde.fields_in.values() if f in serde.fields]
+        if serde.fields and len(matched) == len(serde.fields_in):
+            return {f: serde.fields[f] for f in matched}
+        return {
+            f: p.annotation
+            for f, p in self.resolver.protocols(origin).items()  # type: ignore
+        }
+
+    def fused(
+        self,
+        annotation: Annotation[Type[ObjectT]],
+        deserializer: DeserializerT[ObjectT],
+        validator: Callable[[Any], Any],
+        constraints: ObjectConstraints,
+        namespace: Type = None,
+    ) -> Optional[DeserializerT[ObjectT]]:
+        """Get a single-pass deserializer for a strict user-defined type, if possible.
+
+        When every field is strict, the field deserializers already validate their
+        input, so the only checks left are the required and allowed keys. We skip the
+        validator for a conforming mapping and fall back to validation followed by
+        deserialization otherwise, which also makes for a consistent error report.
+
+        An invalid mapping with the allowed keys is walked twice: once by the failed
+        deserialization, then by the validator, which reports the invalid field. If the
+        validator passes it, the deserializer's error is raised instead.
+        """
+        origin = annotation.resolved_origin
+        if (
+            checks.istypeddict(origin)
+            or checks.istypedtuple(origin)
+            or checks.isnamedtuple(origin)
+            or constraints.items is None
+            or any(
+                (
+                    constraints.min_items,
+                    constraints.max_items,
+                    constraints.key_pattern,
+                    constraints.patterns,
+                    constraints.keys,
+                    constraints.values,
+                    constraints.key_dependencies,
+                )
+            )
+        ):
+            return None
+        fields = self._field_annotations(annotation)
+        # Delayed annotations can't be known to be strict until they're resolved.
+        if not constraints.items.keys() <= fields.keys() or not all(
+            isinstance(a, Annotation) and a.strict for a in fields.values()
+        ):
+            return None
+
+        func_name = f"{self._get_name(annotation, namespace)}_fused"
+        ns = {"__d": deserializer, "__v": validator, "Mapping": Mapping}
+        checks_: List[str] = []
+        if constraints.required_keys:
+            ns["required"] = constraints.required_keys
+            checks_.append("required <= valkeys")
+        ns["defined"] = constraints.required_keys | constraints.items.keys()
+        checks_.append(
+            "valkeys <= defined" if constraints.total else "valkeys >= defined"
+        )
+        with gen.Block(ns) as main:
+            with main.f(func_name, main.param(self.VNAME)) as func:
+                func.localize_context("__d", "__v")
+                with func.b(f"if isinstance({self.VNAME}, Mapping):") as b:
+                    b.l(f"valkeys = {self.VNAME}.keys()")
+                    with b.b(f"if {' and '.join(checks_)}:") as bb:
+                        with bb.b("try:") as t:
+                            t.l(f"{gen.Keyword.RET} __d({self.VNAME})")
+                        with bb.b("except (TypeError, ValueError, KeyError):") as e:
+                            # Only the validator's error has the path to the field.
+                            e.l(f"__v({self.VNAME})")
+                            e.l("raise")
+                func.l(f"{gen.Keyword.RET} __d(__v({self.VNAME}))")
+        fused: DeserializerT = main.compile(ns=ns, name=func_name)
+        return fused
+
+    def batch(
+        self,
+        handler: Callable[[Any], ObjectT],
+        *,
+        name: str,
+        annotation: Optional[Annotation[Type[ObjectT]]] = None,
+    ) -> BatchDeserializerT[ObjectT]:
+        """Get a loop-level deserializer which applies `handler` to every input.
+
+        If `handler` is the deserializer for the user-defined type in `annotation`, its
+        body for a mapping with every field is inlined into the loop.
+
+        Compilation is deferred until the first call, since most protocols are never
+        used for batches.
+        """
+        return cast(BatchDeserializerT, DelayedBatch(handler, self, name, annotation))
+
     def factory(
         self,
         annotation: Annotation[Type[ObjectT]],
         namespace: Type = None,
     ) -> DeserializerT[ObjectT]:
         annotation.serde = annotation.serde or SerdeConfig()
-        key = self._get_name(annotation)
-        if key in self.__DES_CACHE:
-            return self.__DES_CACHE[key]
-        deserializer: Optional[DeserializerT] = None
+        key = self._get_key(annotation, namespace)
+        deserializer: Optional[DeserializerT] = self._deserializer_cache.get(key)
+        if deserializer is not None:
+            return deserializer
         for check, des in self.__USER_DESS:
             if check(annotation.resolved):
                 deserializer = des
                 break
         if not deserializer:
-            deserializer = self._build_des(annotation, key, namespace)
-        self.__DES_CACHE[key] = deserializer
+            func_name = get_defname("deserializer", key)
+            deserializer = self._build_des(annotation, func_name, namespace)
+        self._deserializer_cache[key] = deserializer
         return deserializer
 
 
+def _has_forwardref(t: Any) -> bool:
+    return any(checks.isforwardref(a) or _has_forwardref(a) for a in get_args(t))
+
+
+class DelayedBatch:
+    __slots__ = "handler", "factory", "annotation", "_batch", "__name__"
+
+    def __init__(
+        self,
+        handler: Callable[[Any], ObjectT],
+        factory: DesFactory,
+        name: str,
+        annotation: Optional[Annotation[Type[ObjectT]]] = None,
+    ):
+        self.handler = handler
+        self.factory = factory
+        self.annotation = annotation
+        self._batch: Optional[BatchDeserializerT] = None
+        self.__name__ = name
+
+    def __call__(self, values: Any, *, lazy: bool = False):
+        if self._batch is None:
+            self._batch = self.factory._build_batch(
+                self.handler, self.__name__, self.annotation
+            )
+        return self._batch(values, lazy=lazy)
+
+
 @slotted(dict=False, weakref=True)
 @dataclasses.dataclass
 class BuildContext:
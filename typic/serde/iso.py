@@ -0,0 +1,113 @@
+"""Fast paths for parsing and formatting the ISO-8601 date/time formats which make
+up most payloads.
+
+Anything outside of these formats is handed off to :py:mod:`pendulum`, and the
+results of the fast path are identical to what :py:mod:`pendulum` would return.
+"""
+from __future__ import annotations
+
+import datetime
+import functools
+import operator
+import os
+import re
+from typing import Any, Callable, Dict, Union
+
+import pendulum
+from pendulum import parse as dateparse
+from pendulum.tz import fixed_timezone
+
+from typic import util
+from typic.common import DATETIME_CACHE_ENV
+
+__all__ = ("isoduration", "isoformat", "match", "parse", "parse_exact")
+
+_DATE = r"\d{4}-\d{2}-\d{2}"
+_TIME = r"\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?"
+_OFFSET = r"Z|[+-]\d{2}:\d{2}"
+_RFC3339_MATCH = re.compile(rf"{_DATE}(?:[T ]{_TIME}({_OFFSET})?)?").fullmatch
+_TIME_MATCH = re.compile(_TIME).fullmatch
+_ISO_MATCH = re.compile(rf"{_DATE}(?:[T ]{_TIME}(?:{_OFFSET})?)?|{_TIME}").fullmatch
+_UTC = pendulum.UTC
+_TIMEZONES: Dict[str, datetime.tzinfo] = {"Z": _UTC}
+
+ParsedT = Union[pendulum.DateTime, pendulum.Date, pendulum.Time]
+
+
+def _timezone(offset: str) -> datetime.tzinfo:
+    tz = _TIMEZONES.get(offset)
+    if tz is None:
+        sign = -1 if offset[0] == "-" else 1
+        seconds = sign * (int(offset[1:3]) * 3600 + int(offset[4:6]) * 60)
+        tz = _TIMEZONES[offset] = fixed_timezone(seconds)
+    return tz
+
+
+def _datetime(value: str, offset: str = None) -> pendulum.DateTime:
+    dt = datetime.datetime.fromisoformat(value[:-1] if offset == "Z" else value)
+    return pendulum.DateTime(
+        dt.year,
+        dt.month,
+        dt.day,
+        dt.hour,
+        dt.minute,
+        dt.second,
+        dt.microsecond,
+        tzinfo=_timezone(offset) if offset else _UTC,
+    )
+
+
+def _parse(value: Union[str, bytes]) -> ParsedT:
+    if value.__class__ is str:
+        match = _RFC3339_MATCH(value)  # type: ignore
+        if match:
+            try:
+                return _datetime(value, match.group(1))  # type: ignore
+            except ValueError:
+                pass
+    return dateparse(value)
+
+
+def _parse_exact(value: Union[str, bytes]) -> ParsedT:
+    if value.__class__ is str:
+        match = _RFC3339_MATCH(value)  # type: ignore
+        try:
+            if match:
+                if len(value) == 10:
+                    return pendulum.Date.fromisoformat(value)  # type: ignore
+                return _datetime(value, match.group(1))  # type: ignore
+            if _TIME_MATCH(value):  # type: ignore
+                t = datetime.time.fromisoformat(value)  # type: ignore
+                return pendulum.Time(t.hour, t.minute, t.second, t.microsecond)
+        except ValueError:
+            pass
+    return dateparse(value, exact=True)
+
+
+def _cache_size() -> int:
+    try:
+        return int(os.environ.get(DATETIME_CACHE_ENV, 0))
+    except ValueError:
+        return 0
+
+
+def _memoize(func: Callable, *, typed: bool = False):
+    size = _cache_size()
+    return functools.lru_cache(maxsize=size, typed=typed)(func) if size > 0 else func
+
+
+match = _ISO_MATCH
+"""Whether a string is in one of the ISO-8601 formats handled by the fast path."""
+parse = _memoize(_parse)
+"""Parse a date/time string, as :py:func:`pendulum.parse`."""
+parse_exact = _memoize(_parse_exact)
+"""Parse a date/time string, as :py:func:`pendulum.parse` with ``exact=True``."""
+
+isoformat: Callable[[Any], str] = operator.methodcaller("isoformat")
+"""Format a date, datetime or time as ISO-8601.
+
+This is never memoized: formatting is as cheap as a cache lookup, and aware values
+which compare equal may have different offsets.
+"""
+isoduration = _memoize(util.isoduration, typed=True)
+"""Format a timedelta as an ISO-8601 duration, as :py:func:`typic.util.isoduration`."""
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Type
+
+from typic import util
+from typic.common import ObjectT
+from typic.serde.common import SerdeProtocol
+from typic.serde.resolver import resolver
+
+__all__ = ("transmute_parallel", "ParallelTransmuteError")
+
+
+class ParallelTransmuteError(ValueError):
+    """A value passed to :py:func:`transmute_parallel` couldn't be transmuted.
+
+    The original error may not survive the trip back from a worker process, so its
+    type and message are kept instead.
+    """
+
+    def __init__(self, index: int, kind: str, message: str):
+        super().__init__(f"Failed to transmute value at index {index}: {message}")
+        self.index = index
+        """The position of the value in the input."""
+        self.kind = kind
+        """The qualified name of the original error's type."""
+        self.message = message
+        """The message of the original error."""
+
+    def __reduce__(self):
+        return self.__class__, (self.index, self.kind, self.message)
+
+
+_protocol: Optional[SerdeProtocol] = None
+
+
+def _init_worker(protocol: SerdeProtocol):
+    # The protocol is re-built once when it's unpickled in the worker.
+    global _protocol
+    _protocol = protocol
+
+
+# The errors a transmute raises for an invalid value.
+#   A ConstraintValueError is a ValueError.
+_TRANSMUTE_ERRORS = (TypeError, ValueError, KeyError)
+
+
+def _transmute(protocol: SerdeProtocol, offset: int, chunk: Sequence[Any]) -> List[Any]:
+    try:
+        return protocol.transmute_many(chunk)  # type: ignore
+    except _TRANSMUTE_ERRORS:
+        pass
+    # Find the offending value. This is only done once a chunk has failed.
+    transmute = protocol.transmute
+    for i, value in enumerate(chunk, start=offset):
+        try:
+            transmute(value)
+        except _TRANSMUTE_ERRORS as err:
+            raise ParallelTransmuteError(
+                i, util.get_qualname(err.__class__), str(err)
+            ) from err
+    return protocol.transmute_many(chunk)  # type: ignore
+
+
+def _transmute_chunk(offset: int, chunk: Sequence[Any]) -> List[Any]:
+    return _transmute(_protocol, offset, chunk)  # type: ignore
+
+
+def _chunks(values: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    it = iter(values)
+    chunk = [*itertools.islice(it, size)]
+    while chunk:
+        yield chunk
+        chunk = [*itertools.islice(it, size)]
+
+
+def transmute_parallel(
+    annotation: Type[ObjectT],
+    values: Iterable[Any],
+    *,
+    workers: int = None,
+    chunksize: int = 10_000,
+    mp_context: Any = None,
+) -> List[ObjectT]:
+    """Convert each value in an iterable `into` the target annotation, using a pool
+    of processes.
+
+    Notes
+    -----
+    Each worker process builds the protocol for `annotation` once, so the type must
+    be importable by the workers. Only worthwhile for large, CPU-bound batches; any
+    input which fits in a single chunk is transmuted in this process.
+
+    Parameters
+    ----------
+    annotation
+        The provided annotation for determining the coercion
+    values
+        The iterable of values to be transmuted
+    workers : (kw-only)
+        The number of worker processes. Defaults to the number of CPUs.
+    chunksize : (kw-only)
+        The number of values to send to a worker at a time.
+    mp_context : (kw-only)
+        The :py:mod:`multiprocessing` context to start the workers with.
+
+    Returns
+    -------
+    The transmuted values, in the order they were given.
+
+    Raises
+    ------
+    :py:class:`ParallelTransmuteError`
+        If any value couldn't be transmuted by a worker. This holds the index of the
+        first offending value in its chunk. An input which fits in a single chunk
+        raises the original error, as :py:meth:`SerdeProtocol.transmute` would.
+    """
+    protocol: SerdeProtocol = resolver.resolve(annotation)
+    chunks = _chunks(values, chunksize)
+    first = next(chunks, [])
+    second = next(chunks, None)
+    if second is None:
+        return protocol.transmute_many(first)  # type: ignore
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(protocol,),
+    ) as pool:
+        chunks = itertools.chain((first, second), chunks)
+        results = pool.map(
+            _transmute_chunk, itertools.count(0, chunksize), chunks
+        )
+        return [*itertools.chain.from_iterable(results)]
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import functools
+import os
+import threading
+import time
+import weakref
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from typic import util
+from typic.common import PROFILE_ENV
+
+if TYPE_CHECKING:  # pragma: nocover
+    from .common import Annotation, SerdeProtocol
+
+__all__ = ("get_label", "Profiler", "ProfileStats", "profiler")
+
+_FT = TypeVar("_FT", bound=Callable)
+
+
+def _profile_init() -> bool:
+    return os.environ.get(PROFILE_ENV, "").lower() in {"1", "true", "yes", "on"}
+
+
+def get_label(annotation: Annotation, namespace: Optional[Type] = None) -> str:
+    """Get the label to record the stats for an annotation under.
+
+    Named fields are labelled by their owner, everything else by its type.
+    """
+    t = annotation.resolved
+    label = t.__qualname__ if isinstance(t, type) else repr(t).replace("typing.", "")
+    name = annotation.parameter.name
+    if namespace is not None and name != "_":
+        label = f"{util.get_qualname(namespace)}.{name}"
+    return label
+
+
+@util.slotted(dict=False)
+@dataclasses.dataclass
+class ProfileStats:
+    """Aggregated timings for a single operation of a protocol."""
+
+    calls: int = 0
+    """The number of calls recorded."""
+    total_ns: int = 0
+    """The cumulative wall-time of those calls, in nanoseconds."""
+    max_ns: int = 0
+    """The slowest recorded call, in nanoseconds."""
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls else 0.0
+
+
+# The protocol attributes to instrument for each operation.
+_OPS = {
+    "deserialize": ("deserialize", "transmute"),
+    "serialize": ("serialize", "primitive"),
+    "validate": ("validate",),
+}
+
+
+class Profiler:
+    """Opt-in call counts and timings for the protocols built by a resolver.
+
+    Notes
+    -----
+    While the profiler is enabled, the deserializer, serializer and validator of
+    every live protocol are swapped for instrumented wrappers. They're restored once
+    it's disabled, so protocols have no overhead outside of a profiling window.
+    Enable it for the whole process with the ``TYPIC_PROFILE`` environment variable,
+    or for a window with :py:meth:`Profiler.profile`. Only calls made through the
+    protocol are recorded. Times are inclusive of any nested protocols.
+    """
+
+    def __init__(self, *, enabled: bool = None):
+        self.enabled = False
+        """Whether calls to protocols are being recorded."""
+        self._stats: Dict[Tuple[str, str], ProfileStats] = {}
+        # Protocols by id, with their label and whether they're instrumented. Held
+        #   weakly, so profiling doesn't pin any types.
+        self._protocols: Dict[int, Tuple[weakref.ref, str]] = {}
+        self._instrumented: Set[int] = set()
+        self._lock = threading.RLock()
+        if _profile_init() if enabled is None else enabled:
+            self.start()
+
+    def instrument(self, func: _FT, *, label: str, op: str) -> _FT:
+        """Wrap `func` to record its calls under `label` and `op`."""
+        stats = self._stats.setdefault((label, op), ProfileStats())
+        clock = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def profiled(*args, **kwargs):
+            # A copy may outlive the window, e.g. in a delayed protocol.
+            if not self.enabled:
+                return func(*args, **kwargs)
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                stats.calls += 1
+                stats.total_ns += elapsed
+                if elapsed > stats.max_ns:
+                    stats.max_ns = elapsed
+
+        return profiled  # type: ignore
+
+    def register(self, protocol: SerdeProtocol, *, label: str):
+        """Track `protocol` so it's instrumented whenever the profiler is enabled."""
+        key = id(protocol)
+
+        def forget(
+            ref, *, __key=key, __protocols=self._protocols, __ids=self._instrumented
+        ):
+            __protocols.pop(__key, None)
+            __ids.discard(__key)
+
+        with self._lock:
+            self._protocols[key] = (weakref.ref(protocol, forget), label)
+            if self.enabled:
+                self._swap(key, protocol, label)
+
+    def _swap(self, key: int, protocol: Optional[SerdeProtocol], label: str):
+        if protocol is None or key in self._instrumented:
+            return
+        for op, attrs in _OPS.items():
+            profiled = self.instrument(getattr(protocol, attrs[0]), label=label, op=op)
+            for attr in attrs:
+                setattr(protocol, attr, profiled)
+        self._instrumented.add(key)
+
+    def _restore(self, key: int, protocol: Optional[SerdeProtocol]):
+        if protocol is not None and key in self._instrumented:
+            # The wrappers hold the originals, so we don't have to.
+            for attrs in _OPS.values():
+                for attr in attrs:
+                    setattr(protocol, attr, getattr(protocol, attr).__wrapped__)
+        self._instrumented.discard(key)
+
+    def start(self):
+        """Instrument all protocols and start recording their calls."""
+        with self._lock:
+            self.enabled = True
+            for key, (ref, label) in (*self._protocols.items(),):
+                self._swap(key, ref(), label)
+
+    def stop(self):
+        """Stop recording and restore the original functions of all protocols."""
+        with self._lock:
+            self.enabled = False
+            for key, (ref, label) in (*self._protocols.items(),):
+                self._restore(key, ref())
+
+    def stats(self) -> Dict[str, Dict[str, ProfileStats]]:
+        """A snapshot of the recorded stats, by label and operation.
+
+        Labels are ordered by their total time, slowest first.
+
+        Examples
+        --------
+        >>> import dataclasses
+        >>> import typic
+        >>>
+        >>> @dataclasses.dataclass
+        ... class Point:
+        ...     x: int
+        ...
+        >>> with typic.profile():
+        ...     typic.transmute(Point, {"x": "1"})
+        ...
+        Point(x=1)
+        >>> typic.stats()["Point"]["deserialize"].calls
+        1
+        """
+        labels: Dict[str, Dict[str, ProfileStats]] = {}
+        for (label, op), stats in self._stats.items():
+            if stats.calls:
+                labels.setdefault(label, {})[op] = dataclasses.replace(stats)
+        return dict(
+            sorted(
+                labels.items(),
+                key=lambda it: sum(s.total_ns for s in it[1].values()),
+                reverse=True,
+            )
+        )
+
+    def reset(self):
+        """Clear the recorded stats."""
+        for stats in self._stats.values():
+            stats.calls = stats.total_ns = stats.max_ns = 0
+
+    @contextlib.contextmanager
+    def profile(self, *, reset: bool = True) -> Iterator[Profiler]:
+        """Instrument all protocols and record their calls in this block.
+
+        Parameters
+        ----------
+        reset : (kw-only)
+            Whether to clear any previously recorded stats first.
+        """
+        enabled = self.enabled
+        if reset:
+            self.reset()
+        self.start()
+        try:
+            yield self
+        finally:
+            if not enabled:
+                self.stop()
+
+
+profiler = Profiler()
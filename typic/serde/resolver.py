@@ -3,10 +3,14 @@ from __future__ import annotations
 import dataclasses
 import functools
 import inspect
+import os
+import threading
 import warnings
 from enum import Enum
 from operator import attrgetter, methodcaller
 from typing import (
+    IO,
+    AnyStr,
     Mapping,
     Any,
     Type,
@@ -19,11 +23,14 @@ from typing import (
     Iterator,
     Dict,
     Iterable,
+    List,
 )
 
 from typic import checks, constraints as constr, util, strict as st
+from typic.cache import caches, owner, owns, pin
 from typic.common import (
     EMPTY,
+    LAZY_INIT_ENV,
     ORIG_SETTER_NAME,
     SERDE_FLAGS_ATTR,
     TYPIC_ANNOS_NAME,
@@ -31,8 +38,8 @@ from typic.common import (
     Case,
     ReadOnly,
 )
-from typic.compat import lru_cache
-from typic.ext import json
+from typic.compat import ForwardRef
+from typic.ext import json, stream
 from typic.strict import StrictModeT
 from .binder import Binder
 from .common import (
@@ -51,14 +58,32 @@ from .common import (
     TranslatorT,
     PrimitiveT,
     FieldIteratorT,
+    BatchValidatorT,
 )
 from .des import DesFactory
+from .profiler import get_label, profiler
 from .ser import SerFactory
 from .translator import TranslatorFactory
 
 _T = TypeVar("_T")
 
 
+def _lazy_init() -> bool:
+    return os.environ.get(LAZY_INIT_ENV, "").lower() in {"1", "true", "yes", "on"}
+
+
+def _annotation_refs(
+    anno: Union[Annotation, DelayedAnnotation, ForwardDelayedAnnotation]
+) -> Any:
+    # Delayed annotations are resolved lazily, so only their target is inspected.
+    if isinstance(anno, DelayedAnnotation):
+        return anno.type
+    if isinstance(anno, ForwardDelayedAnnotation):
+        return anno.ref
+    return anno.resolved, anno.un_resolved, anno.origin
+
+
+@owns
 class Resolver:
     """A type serializer/deserializer resolver."""
 
@@ -70,15 +95,26 @@ class Resolver:
     OPTIONALS = (None, ...)
     LITERALS = (int, bytes, str, bool, Enum, type(None))
 
-    def __init__(self):
+    def __init__(self, *, lazy: bool = None):
         self.des = DesFactory(self)
         self.ser = SerFactory(self)
         self.binder = Binder(self)
         self.translator = TranslatorFactory(self)
         self.bind = self.binder.bind
-        self.__cache = {}
-        self.__stack = set()
-        for typ in checks.STDLIB_TYPES:
+        self.__cache = caches.cache("resolver.protocol", refkey=_annotation_refs)
+        self.__stack: util.LocalSet[Type] = util.LocalSet()
+        self.__lock = threading.RLock()
+        self.lazy = _lazy_init() if lazy is None else lazy
+        if not self.lazy:
+            self.prime()
+
+    def prime(self):
+        """Eagerly build the protocols for the standard library types.
+
+        This is done on initialization, unless the resolver is ``lazy``, in which
+        case these protocols are built on first use.
+        """
+        for typ in checks.STDLIB_TYPES_TUPLE:
             self.resolve(typ)
             self.resolve(Optional[typ])
             self.resolve(typ, is_optional=True)
@@ -110,6 +146,23 @@ class Resolver:
 
         return transmuted
 
+    def transmute_many(
+        self, annotation: Type[ObjectT], values: Iterable[Any], *, lazy: bool = False
+    ) -> Union[List[ObjectT], Iterator[ObjectT]]:
+        """Convert each value in an iterable `into` the target annotation.
+
+        Parameters
+        ----------
+        annotation :
+            The provided annotation for determining the coercion
+        values :
+            The iterable of values (or JSON array) to be transmuted
+        lazy : (kw-only)
+            Whether to return an iterator, rather than a list.
+        """
+        resolved: SerdeProtocol = self.resolve(annotation)
+        return resolved.transmute_many(values, lazy=lazy)
+
     def translate(self, value: ObjectT, target: Type[_T]) -> _T:
         """Translate an instance `from` its type `to` a target type.
 
@@ -152,6 +205,43 @@ class Resolver:
             return resolved.transmute(value)
         return value
 
+    def check(
+        self, annotation: Type[ObjectT], value: Any
+    ) -> constr.ValidationResult:
+        """Check an input against the type-constraints without raising an error.
+
+        Parameters
+        ----------
+        annotation
+            The type or annotation to validate against
+        value
+            The value to check
+
+        Returns
+        -------
+        :py:class:`~typic.constraints.ValidationResult`
+            A result which is truthy if the value is valid.
+        """
+        resolved: SerdeProtocol = self.resolve(annotation)
+        return resolved.check(value)
+
+    def validate_many(
+        self, annotation: Type[ObjectT], values: Iterable[Any], *, lazy: bool = False
+    ) -> Union[List[ObjectT], Iterator[ObjectT]]:
+        """Validate each value in an iterable against the type-constraints.
+
+        Parameters
+        ----------
+        annotation
+            The type or annotation to validate against
+        values
+            The iterable of values (or JSON array) to check
+        lazy : (kw-only)
+            Whether to return an iterator, rather than a list.
+        """
+        resolved: SerdeProtocol = self.resolve(annotation)
+        return resolved.validate_many(values, lazy=lazy)
+
     def iterate(
         self, obj, *, values: bool = False, exclude: Iterable[str] = ()
     ) -> Iterator[Union[Tuple[str, Any], Any]]:
@@ -280,12 +370,104 @@ class Resolver:
         proto: SerdeProtocol = self.resolve(t)
         return proto.tojson(obj, indent=indent, ensure_ascii=ensure_ascii, **kwargs)
 
+    def tojson_iter(
+        self, obj: ObjectT, *, chunk_size: int = stream.DEFAULT_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Lazily encode any object to JSON, yielding chunks of bytes.
+
+        The object's serializer is called with ``lazy=True``, so the top-level
+        container is never materialized: only one of its items is held in memory
+        at a time.
+
+        Examples
+        --------
+        >>> import typic
+        >>> b"".join(typic.tojson_iter({"foo": [1, 2]}))
+        b'{"foo":[1,2]}'
+        >>> b"".join(typic.tojson_iter(range(3), chunk_size=1))
+        b'[0,1,2]'
+        """
+        t = obj.__class__
+        if checks.isenumtype(t):
+            obj = obj.value  # type: ignore
+            t = obj.__class__
+        proto: SerdeProtocol = self.resolve(t)
+        return stream.iterencode(
+            proto.primitive(obj, lazy=True),
+            array=self.ser.isarray(proto.annotation.resolved_origin),
+            chunk_size=chunk_size,
+        )
+
+    def dump(
+        self, obj: ObjectT, fp: IO, *, chunk_size: int = stream.DEFAULT_CHUNK_SIZE
+    ) -> int:
+        """Encode any object to JSON and write it incrementally to a file-like object.
+
+        Output is buffered and written every `chunk_size` bytes. Text streams are
+        written decoded chunks. To write to a socket, use :py:meth:`socket.makefile`.
+
+        Returns
+        -------
+        The number of bytes written.
+        """
+        return stream.write(self.tojson_iter(obj, chunk_size=chunk_size), fp)
+
     def decode(
         self, annotation: Type[ObjectT], value: Any, decoder: DecoderT[bytes], **kwargs
     ) -> ObjectT:
         proto: SerdeProtocol = self.resolve(annotation)
         return proto.transmute(decoder(value, **kwargs))  # type: ignore
 
+    def iterdecode(
+        self,
+        annotation: Type[ObjectT],
+        fp: IO[AnyStr],
+        *,
+        format: stream.StreamFormatT = "ndjson",
+        errors: stream.ErrorPolicyT = "raise",
+        chunk_size: int = stream.DEFAULT_CHUNK_SIZE,
+        decoder: DecoderT = None,
+    ) -> stream.DecodeIterator[ObjectT]:
+        """Lazily decode a stream of JSON records into the given type.
+
+        The stream is read in chunks of `chunk_size`, so memory use is bound by the
+        largest record, rather than the size of the input.
+
+        Parameters
+        ----------
+        annotation
+            The type to deserialize each record into.
+        fp
+            A file-like object opened in text or binary mode.
+        format : (kw-only)
+            ``"ndjson"`` for newline-delimited JSON or ``"array"`` for a JSON array.
+        errors : (kw-only)
+            How to handle a record which fails to decode or deserialize:
+            ``"raise"``, ``"skip"``, or ``"collect"`` (stored in ``.errors``).
+        chunk_size : (kw-only)
+            The number of bytes (or characters) to read at a time.
+        decoder : (kw-only)
+            The decoder for NDJSON records. Defaults to :py:func:`typic.ext.json.loads`.
+
+        Examples
+        --------
+        >>> import io
+        >>> import typic
+        >>> from typing import Dict
+        >>> fp = io.BytesIO(b'{"a": 1}\\n{"a": "2"}\\n')
+        >>> [*typic.iterdecode(Dict[str, int], fp)]
+        [{'a': 1}, {'a': 2}]
+        """
+        proto: SerdeProtocol = self.resolve(annotation)
+        return stream.DecodeIterator(
+            fp,
+            proto.transmute,
+            format=format,
+            errors=errors,
+            chunk_size=chunk_size,
+            loads=decoder,
+        )
+
     def encode(self, obj: Any, encoder: EncoderT[PrimitiveT], **kwargs) -> bytes:
         t = obj.__class__
         if checks.isenumtype(t):
@@ -294,7 +476,7 @@ class Resolver:
         proto: SerdeProtocol = self.resolve(t)
         return encoder(proto.primitive(obj), **kwargs)  # type: ignore
 
-    @lru_cache(maxsize=None)
+    @caches.memoize("resolver.configuration")
     def _get_configuration(self, origin: Type, flags: SerdeFlags) -> SerdeConfig:
         if hasattr(origin, SERDE_FLAGS_ATTR):
             flags = getattr(origin, SERDE_FLAGS_ATTR)
@@ -509,11 +691,12 @@ class Resolver:
         )
         return anno
 
-    @staticmethod
     def _finalize_deserializer(
+        self,
         annotation: Annotation[Type[ObjectT]],
         deserializer: DeserializerT[ObjectT],
         constraints: constr.ConstraintsProtocolT[ObjectT],
+        namespace: Type = None,
     ) -> Tuple[DeserializerT[ObjectT], constr.ValidateT[ObjectT]]:
         # Set the default returns.
         validator = constraints.validate
@@ -543,27 +726,62 @@ class Resolver:
                 return __d(__v(val))
 
             rdeserializer = cast(DeserializerT[ObjectT], des)
+            # Opt-in: skip the validator's traversal where the deserializer validates.
+            if annotation.serde.flags.fused and isinstance(
+                constraints, constr.ObjectConstraints
+            ):
+                fused = self.des.fused(
+                    annotation, d, validator, constraints, namespace=namespace
+                )
+                rdeserializer = fused or rdeserializer
 
         return rdeserializer, validator
 
+    def _resolve_delayed(self, annotation: Type[ObjectT], **kwargs) -> SerdeProtocol:
+        # Delayed annotations are resolved on first use, which may be outside of
+        #   `resolve`, so drop anything this adds to the recursion stack.
+        stack = {*self.__stack}
+        anno = self.annotation(annotation, **kwargs)
+        resolved = self._resolve_from_annotation(anno)
+        for t in {*self.__stack} - stack:
+            self.__stack.discard(t)
+        return resolved
+
     def _resolve_from_annotation(
         self,
         anno: Annotation[Type[ObjectT]],
         *,
         namespace: Type = None,
     ) -> SerdeProtocol[ObjectT]:
-        if anno in self.__cache:
-            return self.__cache[anno]
+        cached = self.__cache.get(anno)
+        if cached is not None:
+            return cached
         if isinstance(anno, (DelayedAnnotation, ForwardDelayedAnnotation)):
             return DelayedSerdeProtocol(anno)
-
+        # Only one thread may build protocols at a time.
+        #   Re-entrant, since building a protocol resolves those of its fields.
+        with self.__lock:
+            cached = self.__cache.get(anno)
+            if cached is not None:
+                return cached
+            return self._build_from_annotation(anno, namespace=namespace)
+
+    def _build_from_annotation(
+        self,
+        anno: Annotation[Type[ObjectT]],
+        *,
+        namespace: Type = None,
+    ) -> SerdeProtocol[ObjectT]:
         # Build the deserializer
         constraints = constr.get_constraints(
             anno.resolved, nullable=anno.optional, cls=namespace
         )
         deserializer = self.des.factory(anno, namespace=namespace)
         deserializer, validator = self._finalize_deserializer(
-            annotation=anno, deserializer=deserializer, constraints=constraints
+            annotation=anno,
+            deserializer=deserializer,
+            constraints=constraints,
+            namespace=namespace,
         )
         # Build the serializer
         serializer = self.ser.factory(anno)
@@ -575,6 +793,8 @@ class Resolver:
             validator=validator,
             serializer=serializer,
         )
+        # Let the profiler instrument the hot-paths while it's enabled.
+        profiler.register(proto, label=get_label(anno, namespace))
         self.__cache[anno] = proto
         return proto
 
@@ -643,6 +863,13 @@ class Resolver:
         except TypeError:
             iterator = cast(FieldIteratorT, self.iterate)
 
+        # Create the batch protocols.
+        name = util.get_defname("deserializer", annotation.signature())
+        deserialize_many = self.des.batch(
+            deserializer, name=f"{name}_many", annotation=annotation
+        )
+        validate_many = self.des.batch(validator, name=f"{name}_validate_many")
+
         return SerdeProtocol(
             annotation=annotation,
             constraints=constraints,
@@ -654,6 +881,9 @@ class Resolver:
             translate=cast(TranslatorT, translate),
             tojson=cast(EncoderT, tojson),
             iterate=iterator,
+            deserialize_many=deserialize_many,
+            validate_many=cast(BatchValidatorT, validate_many),
+            check=constraints.check,
         )
 
     def _iterator_from_annotation(
@@ -679,7 +909,7 @@ class Resolver:
 
         return cast(FieldIteratorT, iterator)
 
-    @lru_cache(maxsize=None)
+    @caches.memoize("resolver.resolve")
     def resolve(
         self,
         annotation: Type[ObjectT],
@@ -739,7 +969,7 @@ class Resolver:
         self.__stack.clear()
         return resolved
 
-    @lru_cache(maxsize=None)
+    @caches.memoize("resolver.protocols")
     def protocols(self, obj, *, strict: bool = False) -> SerdeProtocolsT:
         """Get a mapping of param/attr name -> :py:class:`SerdeProtocol`
 
@@ -774,7 +1004,8 @@ class Resolver:
         if dataclasses.is_dataclass(obj):
             fields = {f.name: f for f in dataclasses.fields(obj)}
         ann = {}
-        for name in params.keys() | hints.keys():
+        # Preserve the declaration order so resolution is deterministic.
+        for name in {**params, **hints}:
             if name == "return":
                 continue
             param = params.get(name)
@@ -812,15 +1043,51 @@ class Resolver:
                 annotation, name=name, parameter=param, is_strict=strict, namespace=obj
             )
             ann[name] = resolved
-        try:
-            setattr(obj, TYPIC_ANNOS_NAME, ann)
-        # We wrapped a bound method, or
-        # are wrapping a static-/classmethod
-        # after they were wrapped with @static/class
-        except (AttributeError, TypeError):
-            pass
+        # Only a pinned resolver may attach its protocols to the class, since they'd
+        #   keep any other resolver alive for as long as the class.
+        if owner(self) is None:
+            try:
+                setattr(obj, TYPIC_ANNOS_NAME, ann)
+            # We wrapped a bound method, or
+            # are wrapping a static-/classmethod
+            # after they were wrapped with @static/class
+            except (AttributeError, TypeError):
+                pass
 
         return ann
 
 
-resolver = Resolver()
+# The default resolver lives as long as the process, so its entries stay in the caches.
+resolver = pin(Resolver())
+pin(resolver.translator)
+
+
+def restore_protocol(
+    annotation: Type[ObjectT],
+    flags: SerdeFlags,
+    is_optional: bool,
+    is_strict: StrictModeT,
+) -> SerdeProtocol[ObjectT]:
+    """Get the protocol for a pickled :py:class:`SerdeProtocol` from this process."""
+    # Most protocols were resolved with the defaults, so check that first.
+    protocol = resolver.resolve(annotation)
+    anno = protocol.annotation
+    if (anno.serde.flags, anno.optional, anno.strict) == (
+        flags,
+        is_optional,
+        is_strict,
+    ):
+        return protocol
+    return resolver.resolve(
+        annotation, flags=flags, is_optional=is_optional, is_strict=is_strict
+    )
+
+
+def restore_delayed_protocol(
+    delayed: Type[Union[DelayedAnnotation, ForwardDelayedAnnotation]],
+    fields: Dict[str, Any],
+) -> DelayedSerdeProtocol:
+    """Get a pickled :py:class:`DelayedSerdeProtocol` in this process, unresolved."""
+    if "ref" in fields:
+        fields = {**fields, "ref": ForwardRef(fields["ref"])}
+    return DelayedSerdeProtocol(delayed(resolver=resolver, **fields))
@@ -6,6 +6,7 @@ import decimal
 import enum
 import inspect
 import ipaddress
+import keyword
 import pathlib
 import re
 import uuid
@@ -28,15 +29,16 @@ from typing import (
     cast,
     TYPE_CHECKING,
     Iterable,
-    MutableMapping,
     Dict,
     Optional,
     TypeVar,
 )
 
 from typic import util, checks, gen, types
+from typic.cache import caches
 from typic.common import DEFAULT_ENCODING
 from typic.compat import Literal, Record
+from . import iso
 from .common import (
     SerializerT,
     SerdeConfig,
@@ -87,10 +89,10 @@ class SerFactory:
         decimal.Decimal: str,
         bytes: cast(SerializerT, _decode),
         bytearray: cast(SerializerT, _decode),
-        datetime.date: cast(SerializerT, util.isoformat),
-        datetime.datetime: cast(SerializerT, util.isoformat),
-        datetime.time: cast(SerializerT, util.isoformat),
-        datetime.timedelta: cast(SerializerT, util.isoformat),
+        datetime.date: cast(SerializerT, iso.isoformat),
+        datetime.datetime: cast(SerializerT, iso.isoformat),
+        datetime.time: cast(SerializerT, iso.isoformat),
+        datetime.timedelta: cast(SerializerT, iso.isoduration),
     }
 
     _LISTITER = (
@@ -105,6 +107,8 @@ class SerFactory:
     )
     _DICTITER = (dict, Mapping, Mapping_abc, MappingProxyType, types.FrozenDict, Record)
     _PRIMITIVES = (str, int, bool, float, type(None), type(...))
+    # Primitives whose serializers return a value of the exact type as-is.
+    _PASSTHROUGH = (str, int, bool, float)
     _DYNAMIC = frozenset(
         {Union, Any, inspect.Parameter.empty, dataclasses.MISSING, ClassVar, Literal}
     )
@@ -112,11 +116,11 @@ class SerFactory:
 
     def __init__(self, resolver: Resolver):
         self.resolver = resolver
-        self._serializer_cache: MutableMapping[str, SerializerT] = {}
+        self._serializer_cache = caches.cache("ser.factory")
 
     @staticmethod
     def _get_name(annotation: Annotation) -> str:
-        return util.get_defname("serializer", annotation)
+        return util.get_defname("serializer", annotation.signature())
 
     def _check_add_null_check(self, func: gen.Function, annotation: Annotation):
         if annotation.optional:
@@ -242,12 +246,63 @@ class SerFactory:
             ns["omit"] = annotation.serde.flags.omit
             gencall += " and v not in omit"
             itercall += " and v not in omit"
+        # The field set is static, so write out the dict literal when we can.
+        else:
+            unrolled = self._unrolled_class_serializer(annotation, fields_ser, ns)
+            if unrolled:
+                with func.b("if lazy:", **ns) as b:
+                    b.l(f"{gen.Keyword.RET} ({gencall})")
+                func.l(f"{gen.Keyword.RET} {unrolled}")
+                return
 
         func.l(f"{gen.Keyword.RET} ({gencall}) if lazy else {{{itercall}}}", **ns)
 
+    def _unrolled_class_serializer(
+        self,
+        annotation: Annotation,
+        fields_ser: Mapping[str, SerializerT],
+        ns: Dict[str, Any],
+    ) -> Optional[str]:
+        # Mappings (i.e., TypedDicts) don't expose their fields as attributes.
+        if checks.ismappingtype(annotation.resolved_origin):
+            return None
+        fields = self.resolver.translator.get_fields(
+            annotation.resolved,
+            as_source=True,
+            exclude=(*annotation.serde.flags.exclude,),
+        )
+        fields_out = annotation.serde.fields_out
+        names = [f for f in (fields or ()) if f in fields_out]
+        if not names or not all(
+            f.isidentifier() and not keyword.iskeyword(f) and f in fields_ser
+            for f in names
+        ):
+            return None
+        items = []
+        for i, f in enumerate(names):
+            ser_name = f"__field_ser_{i}"
+            ns[ser_name] = fields_ser[f]
+            value = f"{ser_name}(o.{f})"
+            anno = annotation.serde.fields[f]
+            if (
+                isinstance(anno, Annotation)
+                and anno.static
+                and anno.resolved_origin in self._PASSTHROUGH
+            ):
+                ns[f"{ser_name}_t"] = anno.resolved_origin
+                value = (
+                    f"(v if (v := o.{f}).__class__ is {ser_name}_t else {ser_name}(v))"
+                )
+            items.append(f"{fields_out[f]!r}: {value}")
+        return f"{{{', '.join(items)}}}"
+
+    # Primitives which are safe to share between calls.
+    _SCALARS = frozenset((str, int, float, bool, type(None)))
+
     def _compile_enum_serializer(self, annotation: Annotation) -> SerializerT:
         origin: Type[enum.Enum] = cast(Type[enum.Enum], annotation.resolved_origin)
         ts = {type(x.value) for x in origin}
+        fallback: SerializerT
         # If we can predict a single type the return the serializer for that
         if len(ts) == 1:
             t = ts.pop()
@@ -284,15 +339,55 @@ class SerFactory:
                 ):
                     return _vser(o.value, lazy=lazy, name=name)
 
-            return cast(SerializerT, serializer)
+            fallback = cast(SerializerT, serializer)
         # Else default to lazy serialization
-        return cast(SerializerT, self.resolver.primitive)
+        else:
+            fallback = cast(SerializerT, self.resolver.primitive)
+        # Pre-compute the output for each member, keyed by the member's name.
+        #   Members whose output is mutable get the serializer for their value.
+        prims: Dict[str, Any] = {}
+        sers: Dict[str, SerializerT] = {}
+        for member in origin:
+            vser = self.resolver.resolve(type(member.value)).primitive
+            prim = vser(member.value)
+            if type(prim) in self._SCALARS:
+                prims[member.name] = prim
+            else:
+                sers[member.name] = vser
+        func_name = self._get_name(annotation)
+        anno_name = f"{func_name}_anno"
+        ns = {
+            anno_name: origin,
+            "prims": prims,
+            "sers": sers,
+            "fallback": fallback,
+            "empty": util.empty,
+        }
+        with gen.Block(ns) as main:
+            with self._define(main, func_name) as func:
+                # Composite flags aren't members, so they're not in the tables.
+                with func.b(f"if o.__class__ is {anno_name}:") as b:
+                    b.l("prim = prims.get(o._name_, empty)")
+                    with b.b("if prim is not empty:") as bb:
+                        bb.l(f"{gen.Keyword.RET} prim")
+                    if sers:
+                        b.l("ser = sers.get(o._name_)")
+                        with b.b("if ser is not None:") as bb:
+                            bb.l(
+                                f"{gen.Keyword.RET} ser(o.value, lazy=lazy, name=name)"
+                            )
+                func.l(f"{gen.Keyword.RET} fallback(o, lazy=lazy, name=name)")
+        return main.compile(name=func_name, ns=ns)
 
     def _compile_defined_serializer(
         self,
         annotation: Annotation[Type[_T]],
         ser: SerializerT[_T],
     ) -> SerializerT[_T]:
+        key = annotation.signature()
+        cached = self._serializer_cache.get(key)
+        if cached is not None:
+            return cached
         func_name = self._get_name(annotation)
         ser_name = "ser"
         ns = {ser_name: ser}
@@ -306,6 +401,7 @@ class SerFactory:
                 func.l(f"{gen.Keyword.RET} {line}")
 
         serializer: SerializerT = main.compile(name=func_name, ns=ns)
+        self._serializer_cache[key] = serializer
         return serializer
 
     def _compile_defined_subclass_serializer(
@@ -326,10 +422,12 @@ class SerFactory:
 
     def _compile_serializer(self, annotation: Annotation[Type[_T]]) -> SerializerT[_T]:
         # Check for an optional and extract the type if possible.
-        func_name = self._get_name(annotation)
+        key = annotation.signature()
         # We've been here before...
-        if func_name in self._serializer_cache:
-            return self._serializer_cache[func_name]
+        cached = self._serializer_cache.get(key)
+        if cached is not None:
+            return cached
+        func_name = self._get_name(annotation)
 
         serializer: SerializerT
         origin = annotation.resolved_origin
@@ -339,7 +437,8 @@ class SerFactory:
             or not annotation.static
             or checks.isuniontype(origin)
         ):
-            serializer = cast(SerializerT, self.resolver.primitive)
+            serializer = self._compile_dispatch_serializer(annotation, func_name)
+            self._serializer_cache[key] = serializer
         # Routines (functions or methods) can't be serialized...
         elif issubclass(origin, abc.Callable) or inspect.isroutine(origin):  # type: ignore
             name = util.get_qualname(origin)
@@ -350,10 +449,11 @@ class SerFactory:
                     )
 
             serializer = main.compile(name=func_name)
-            self._serializer_cache[func_name] = serializer
+            self._serializer_cache[key] = serializer
         # Enums are special
         elif checks.isenumtype(annotation.resolved):
             serializer = self._compile_enum_serializer(annotation)
+            self._serializer_cache[key] = serializer
         # Primitives don't require further processing.
         # Just check for nullable and the correct type.
         elif origin in self._PRIMITIVES:
@@ -368,7 +468,7 @@ class SerFactory:
                     func.l(f"{gen.Keyword.RET} {line}")
 
             serializer = main.compile(name=func_name, ns=ns)
-            self._serializer_cache[func_name] = serializer
+            self._serializer_cache[key] = serializer
 
         # Defined cases are pre-compiled, but we have to check for optionals.
         elif origin in self._DEFINED:
@@ -386,26 +486,73 @@ class SerFactory:
             with gen.Block(ns) as main:
                 with self._define(main, func_name) as func:
                     # Mapping types need special nested processing as well
-                    istypeddict = checks.istypeddict(origin)
-                    istypedtuple = checks.istypedtuple(origin)
-                    istypicklass = checks.istypicklass(origin)
-                    if not istypeddict and issubclass(origin, self._DICTITER):
+                    if not checks.istypeddict(origin) and issubclass(
+                        origin, self._DICTITER
+                    ):
                         self._build_dict_serializer(func, annotation)
                     # Array types need nested processing.
-                    elif (
-                        not istypedtuple
-                        and not istypeddict
-                        and not istypicklass
-                        and issubclass(origin, self._LISTITER)
-                    ):
+                    elif self.isarray(origin):
                         self._build_list_serializer(func, annotation)
                     # Build a serializer for a structured class.
                     else:
                         self._build_class_serializer(func, annotation)
             serializer = main.compile(name=func_name, ns=ns)
-            self._serializer_cache[func_name] = serializer
+            self._serializer_cache[key] = serializer
         return serializer
 
+    # An upper bound on the classes seen by a dispatch serializer.
+    #   Inputs to an `Any` field can be of any class, so don't hold on to them all.
+    _DISPATCH_MAXSIZE = 256
+
+    def _compile_dispatch_serializer(
+        self, annotation: Annotation, func_name: str
+    ) -> SerializerT:
+        # Resolve the members of a Union up-front.
+        #   Their serializers are bound when first used, since we may be building
+        #   one of them right now.
+        protocols = {
+            a: self.resolver.resolve(a)
+            for a in annotation.args
+            if inspect.isclass(a) and not checks.isenumtype(a)
+        }
+        if annotation.optional:
+            protocols[type(None)] = self.resolver.resolve(type(None))
+        dispatch: Dict[Type, SerializerT] = {}
+
+        def register(t: Type) -> SerializerT:
+            if checks.isenumtype(t):
+                serializer = cast(SerializerT, self.resolver.primitive)
+            else:
+                proto = protocols.get(t) or self.resolver.resolve(t)
+                serializer = proto.primitive
+            if len(dispatch) < self._DISPATCH_MAXSIZE:
+                dispatch[t] = serializer
+            return serializer
+
+        ns = {"dispatch": dispatch, "register": register}
+        with gen.Block(ns) as main:
+            with self._define(main, func_name) as func:
+                func.l("t = o.__class__")
+                func.l("serializer = dispatch.get(t) or register(t)")
+                func.l(f"{gen.Keyword.RET} serializer(o, lazy=lazy, name=name)")
+        return main.compile(name=func_name, ns=ns)
+
+    def isarray(self, origin: Type) -> bool:
+        """Whether the serializer for this type produces an array.
+
+        When called with ``lazy=True``, these serializers yield values, rather than
+        key-value pairs.
+        """
+        return (
+            not checks.istypedtuple(origin)
+            and not checks.istypeddict(origin)
+            and not checks.istypicklass(origin)
+            and not issubclass(
+                origin, (*self._PRIMITIVES, *self._DEFINED, *self._DICTITER)
+            )
+            and issubclass(origin, self._LISTITER)
+        )
+
     @staticmethod
     def _define(main: gen.Block, name: str) -> gen.Function:
         return main.func(
@@ -26,7 +26,7 @@ from typic.checks import (
     isbuiltinsubtype,
     istypicklass,
 )
-from typic.compat import lru_cache
+from typic.cache import caches, owns
 from typic.gen import Block, Keyword, ParameterKind
 from typic.util import (
     cached_type_hints,
@@ -52,6 +52,7 @@ class TranslatorTypeError(TypeError): ...
 class TranslatorValueError(ValueError): ...
 
 
+@owns
 class TranslatorFactory:
     """Translation protocol factory for higher-order objects.
 
@@ -104,7 +105,7 @@ class TranslatorFactory:
     ):
         return {x: inspect.Parameter(x, kind) for x in attrs if x not in exclude}
 
-    @lru_cache(maxsize=None)
+    @caches.memoize("translator.get_fields")
     def get_fields(
         self, type: Type, as_source: bool = False, exclude: Iterable[str] = ()
     ) -> Optional[Mapping[str, inspect.Parameter]]:
@@ -143,7 +144,7 @@ class TranslatorFactory:
         # Can't be done.
         return None if undefined else {f: params[f] for f in params.keys() - exclude}
 
-    @lru_cache(maxsize=None)
+    @caches.memoize("translator.iterator")
     def iterator(
         self,
         type: Type,
@@ -232,7 +233,7 @@ class TranslatorFactory:
                 func.l(f"{Keyword.RET} {retval}")
         return main.compile(name=func_name)
 
-    @lru_cache(maxsize=None)
+    @caches.memoize("translator.compile")
     def _compile_translator(
         self, source: Type, target: Type, exclude: Tuple[str, ...] = ()
     ) -> TranslatorT:
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import dataclasses
+import inspect
+import time
+from typing import Any, Dict, Iterator, List, Set, Type
+
+from typic import checks, util
+from typic.constraints.common import DelayedConstraints, ForwardDelayedConstraints
+from typic.ext.schema import builder as schema_builder
+from typic.serde.common import DelayedSerdeProtocol, SerdeProtocol
+from typic.serde.resolver import resolver
+from typic.serde.translator import TranslatorTypeError, TranslatorValueError
+
+__all__ = ("warmup", "WarmupStats")
+
+
+@util.slotted(dict=False)
+@dataclasses.dataclass
+class WarmupStats:
+    """The time spent warming up a single type, in nanoseconds."""
+
+    protocol_ns: int = 0
+    """Resolving the protocol, its constraints, and its field iterators."""
+    translators_ns: int = 0
+    """Compiling translators to the other types which were warmed up."""
+    schema_ns: int = 0
+    """Building the JSON schema."""
+
+    @property
+    def total_ns(self) -> int:
+        return self.protocol_ns + self.translators_ns + self.schema_ns
+
+
+def _force(proto: SerdeProtocol) -> SerdeProtocol:
+    if isinstance(proto, DelayedSerdeProtocol):
+        proto.__delayed_init__()
+    return proto
+
+
+_CONSTRAINT_ATTRS = ("constraints", "values", "keys", "items", "patterns")
+
+
+def _force_constraints(constraints: Any, seen: Set[int]):
+    if constraints is None or id(constraints) in seen:
+        return
+    seen.add(id(constraints))
+    if isinstance(constraints, (tuple, list)):
+        for c in constraints:
+            _force_constraints(c, seen)
+        return
+    if isinstance(constraints, dict):
+        for c in constraints.values():
+            _force_constraints(c, seen)
+        return
+    # Delayed constraints are evaluated on first access.
+    if isinstance(constraints, (DelayedConstraints, ForwardDelayedConstraints)):
+        _force_constraints(constraints.constraints, seen)
+        return
+    # Compile the validator. Anything else here is a plain value, not a constraint.
+    if not hasattr(constraints, "validator"):
+        return
+    for attr in _CONSTRAINT_ATTRS:
+        _force_constraints(getattr(constraints, attr, None), seen)
+
+
+def _reachable(t: Any) -> Iterator[Type]:
+    if inspect.isclass(t) and t is not Any and not checks.isstdlibtype(t):
+        yield t
+    for arg in util.get_args(t):
+        yield from _reachable(arg)
+
+
+def _warm_protocol(t: Type, seen: Set[int]) -> List[Type]:
+    proto = _force(resolver.resolve(t))
+    _force_constraints(proto.constraints, seen)
+    # Force the batch deserializer and the field iterators.
+    proto.transmute_many(())
+    children: List[Type] = []
+    if resolver.translator.get_fields(t) is None:
+        return children
+    try:
+        resolver.translator.iterator(t)
+        resolver.translator.iterator(t, values=True)
+    except TypeError:
+        pass
+    for field in resolver.protocols(t).values():
+        field = _force(field)
+        _force_constraints(field.constraints, seen)
+        children.extend(_reachable(field.annotation.resolved))
+    return children
+
+
+def warmup(
+    *types: Type,
+    include_translators: bool = False,
+    include_schema: bool = False,
+) -> Dict[Type, WarmupStats]:
+    """Eagerly compile everything needed to (de)serialize the given types.
+
+    This walks every class reachable from the fields of `types`, forcing the
+    resolution of any forward references and compiling the protocols, constraint
+    validators and field iterators along the way. Call this before forking workers or
+    accepting requests, so the first request doesn't pay for it.
+
+    Parameters
+    ----------
+    *types
+        The types to warm up.
+    include_translators : (kw-only)
+        Whether to compile translators between each pair of the given types, where a
+        translation is possible.
+    include_schema : (kw-only)
+        Whether to build the JSON schema for each type reached.
+
+    Returns
+    -------
+    A mapping of each type reached to the time spent warming it up, in the order they
+    were reached. Times are inclusive of any reachable types which hadn't been
+    compiled yet.
+
+    Examples
+    --------
+    >>> import dataclasses
+    >>> import typic
+    >>>
+    >>> @dataclasses.dataclass
+    ... class Point:
+    ...     x: int
+    ...
+    >>> report = typic.warmup(Point)
+    >>> [*report]
+    [<class 'typic.serde.warmup.Point'>]
+    >>> report[Point].protocol_ns > 0
+    True
+    """
+    report: Dict[Type, WarmupStats] = {}
+    constraints: Set[int] = set()
+    clock = time.perf_counter_ns
+    queue = [*types]
+    while queue:
+        t = queue.pop(0)
+        if t in report:
+            continue
+        stats = report[t] = WarmupStats()
+        start = clock()
+        queue.extend(_warm_protocol(t, constraints))
+        stats.protocol_ns = clock() - start
+        if include_schema:
+            start = clock()
+            schema_builder.get_field(resolver.resolve(t))
+            stats.schema_ns = clock() - start
+    if include_translators:
+        for source in types:
+            start = clock()
+            translator = resolver.resolve(source).annotation.translator
+            for target in types:
+                if source is target:
+                    continue
+                try:
+                    translator(target)
+                except (TranslatorTypeError, TranslatorValueError):
+                    pass
+            report[source].translators_ns += clock() - start
+    return report
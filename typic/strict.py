@@ -18,6 +18,10 @@ class _Strict:
     def __hash__(self):
         return hash(self.__STRICT)
 
+    def __reduce__(self):
+        # This is a singleton, pickle it by reference.
+        return "STRICT_MODE"
+
     def is_strict_mode(self) -> bool:
         return self.__STRICT
 
@@ -80,6 +80,9 @@ class FrozenDict(Generic[KT, VT], dict):
     def __deepcopy__(self, memodict: dict = None) -> "FrozenDict":
         return self.__class__({x: copy.deepcopy(y, memodict) for x, y in self.items()})
 
+    def __reduce__(self):
+        return self.__class__, ({**self},)
+
     @cached_property
     def __hash(self) -> int:
         return hash(frozenset(self.items()))
@@ -6,11 +6,12 @@ import collections.abc
 import dataclasses
 import functools
 import inspect
+import itertools
 import sys
 import types
 import warnings
 from datetime import date, datetime, timedelta, time
-from threading import RLock
+from threading import RLock, local
 from types import MappingProxyType, MemberDescriptorType
 import typing
 from typing import (  # type: ignore  # ironic...
@@ -32,6 +33,9 @@ from typing import (  # type: ignore  # ironic...
     MutableSet,
     Dict,
     Optional,
+    DefaultDict,
+    Iterator,
+    Set,
     _eval_type,
 )
 
@@ -39,6 +43,7 @@ import pendulum
 from future_typing import transform_annotation
 
 import typic.checks as checks
+from typic.cache import caches, weakcache
 from typic.compat import ForwardRef, lru_cache, KW_ONLY, get_origin
 from typic.ext import json
 
@@ -59,7 +64,9 @@ __all__ = (
     "get_tag_for_types",
     "get_type_hints",
     "get_unique_name",
+    "isoduration",
     "isoformat",
+    "new_defname",
     "origin",
     "resolve_supertype",
     "safe_eval",
@@ -148,7 +155,7 @@ def filtered_str(self) -> str:
     return f"({', '.join(fields)})"
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def origin(annotation: Any) -> Any:
     """Get the highest-order 'origin'-type for subclasses of typing._SpecialForm.
 
@@ -190,7 +197,7 @@ def origin(annotation: Any) -> Any:
     return actual
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def get_args(annotation: Any) -> Tuple[Any, ...]:
     """Get the args supplied to an annotation, excluding :py:class:`typing.TypeVar`.
 
@@ -211,7 +218,7 @@ def get_args(annotation: Any) -> Tuple[Any, ...]:
     )
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def get_name(obj: Union[Type, ForwardRef, Callable]) -> str:
     """Safely retrieve the name of either a standard object or a type annotation.
 
@@ -233,7 +240,7 @@ def get_name(obj: Union[Type, ForwardRef, Callable]) -> str:
     return strobj.rsplit(".")[-1]
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def get_qualname(obj: Union[Type, ForwardRef, Callable]) -> str:
     """Safely retrieve the qualname of either a standard object or a type annotation.
 
@@ -274,17 +281,33 @@ def get_qualname(obj: Union[Type, ForwardRef, Callable]) -> str:
     return strobj
 
 
-@lru_cache(maxsize=None)
+_NAME_SEQUENCES: DefaultDict[str, Iterator[int]] = collections.defaultdict(
+    itertools.count
+)
+
+
+def _sequenced(name: str) -> str:
+    # Names are allocated in resolution order, rather than from `id()` or `hash()`,
+    #   so the same program generates the same names in every process.
+    return f"{name}_{next(_NAME_SEQUENCES[name])}"
+
+
+@weakcache
 def get_unique_name(obj: Type) -> str:
-    return f"{get_name(obj)}_{id(obj)}".replace("-", "_")
+    return _sequenced(get_name(obj))
 
 
-@lru_cache(maxsize=None)
+# A name must not change once allocated, or code cached for it would be missed.
+@caches.memoize("util.get_defname", bounded=False)
 def get_defname(pre: str, obj: Hashable) -> str:
-    return f"{pre}_{hash(obj)}".replace("-", "_")
+    return _sequenced(pre)
+
+
+def new_defname(pre: str) -> str:
+    return _sequenced(pre)
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def resolve_supertype(annotation: Type[Any]) -> Any:
     """Get the highest-order supertype for a NewType.
 
@@ -450,7 +473,7 @@ def signature(obj: Union[Callable, Type]) -> inspect.Signature:
     )
 
 
-cached_signature = lru_cache(maxsize=None)(signature)
+cached_signature = weakcache(signature)
 
 
 def _safe_get_type_hints(annotation: Union[Type, Callable]) -> Dict[str, Type[Any]]:
@@ -502,10 +525,10 @@ def get_type_hints(obj: Union[Type, Callable]) -> Dict[str, Type[Any]]:
     return {f: t for f, t in hints.items() if t is not KW_ONLY}
 
 
-cached_type_hints = lru_cache(maxsize=None)(get_type_hints)
+cached_type_hints = weakcache(get_type_hints)
 
 
-@lru_cache(maxsize=None)
+@caches.memoize("util.cached_issubclass")
 def cached_issubclass(st: Type, t: Union[Type, Tuple[Type, ...]]) -> bool:
     """A cached result of :py:func:`issubclass`."""
     return issubclass(st, t)
@@ -539,7 +562,7 @@ def simple_attributes(t: Type) -> Tuple[str, ...]:
 _DYNAMIC_ATTRIBUTES = (SQLAMetaData, sqla_registry)
 
 
-cached_simple_attributes = lru_cache(maxsize=None)(simple_attributes)
+cached_simple_attributes = weakcache(simple_attributes)
 """A cached result of :py:func:`simple_attributes`."""
 
 
@@ -563,7 +586,7 @@ def typed_dict_signature(obj: Callable) -> inspect.Signature:
     )
 
 
-@lru_cache(maxsize=None)
+@weakcache
 def safe_get_params(obj: Type) -> Mapping[str, inspect.Parameter]:
     params: Mapping[str, inspect.Parameter]
     try:
@@ -670,7 +693,36 @@ def slotted(
     return wrap if _cls is None else wrap(_cls)
 
 
-_stack: MutableSet[Type] = set()
+class LocalSet(local, MutableSet[VT]):
+    """A set which is local to the current thread.
+
+    Used for tracking recursion while resolving types, so that concurrent resolutions
+    in other threads can't interfere.
+    """
+
+    def __init__(self):
+        self.data: Set[VT] = set()
+
+    def __contains__(self, item) -> bool:
+        return item in self.data
+
+    def __iter__(self) -> Iterator[VT]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def add(self, value: VT):
+        self.data.add(value)
+
+    def discard(self, value: VT):
+        self.data.discard(value)
+
+    def clear(self):
+        self.data.clear()
+
+
+_stack: MutableSet[str] = LocalSet()
 
 
 class joinedrepr(str):
@@ -723,38 +775,46 @@ class collectionrepr(str):
 ReprT = Union[str, joinedrepr, collectionrepr]
 
 
-@functools.lru_cache(maxsize=100_000)
 def isoformat(t: Union[date, datetime, time, timedelta]) -> str:
-    if isinstance(t, (date, datetime, time)):
-        return t.isoformat()
-    d = t
-    if not isinstance(d, pendulum.Duration):
-        d = pendulum.duration(
-            days=t.days,
-            seconds=t.seconds,
-            microseconds=t.microseconds,
-        )
+    if isinstance(t, timedelta):
+        return isoduration(t)
+    return t.isoformat()
+
+
+_MICROSECOND = timedelta(microseconds=1)
+_US_PER_DAY = 86_400_000_000
+# pendulum.Duration doesn't support floor-division by a plain timedelta.
+_td_floordiv = timedelta.__floordiv__
 
-    periods = [
-        ("Y", d.years),
-        ("M", d.months),
-        ("D", d.remaining_days),
-    ]
-    period = "P"
-    for sym, val in periods:
-        period += f"{val}{sym}"
-    times = [
-        ("H", d.hours),
-        ("M", d.minutes),
-        ("S", d.remaining_seconds),
-    ]
-    time_ = "T"
-    for sym, val in times:
-        time_ += f"{val}{sym}"
-    if d.microseconds:
-        time_ = time_[:-1]
-        time_ += f".{d.microseconds:06}S"
-    return period + time_
+
+def isoduration(d: timedelta) -> str:
+    """Format a :py:class:`datetime.timedelta` as an ISO-8601 duration.
+
+    Days are never folded into months or years, unless `d` is a
+    :py:class:`pendulum.Duration` which was built with them.
+
+    Examples
+    --------
+    >>> import datetime
+    >>> from typic.util import isoduration
+    >>> isoduration(datetime.timedelta(days=10, seconds=3661, microseconds=5))
+    'P0Y0M10DT1H1M1.000005S'
+    >>> isoduration(datetime.timedelta(seconds=-1))
+    '-P0Y0M0DT0H0M1S'
+    """
+    us = _td_floordiv(d, _MICROSECOND)
+    sign = "-" if us < 0 else ""
+    us = abs(us)
+    years = months = 0
+    if isinstance(d, pendulum.Duration):
+        years, months = abs(d.years), abs(d.months)
+        us -= (years * 365 + months * 30) * _US_PER_DAY
+    days, us = divmod(us, _US_PER_DAY)
+    seconds, us = divmod(us, 1_000_000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    fraction = f".{us:06}" if us else ""
+    return f"{sign}P{years}Y{months}M{days}DT{hours}H{minutes}M{seconds}{fraction}S"
 
 
 @slotted(dict=False)
@@ -769,7 +829,7 @@ class TaggedUnion:
 empty = object()
 
 
-@functools.lru_cache(maxsize=None)
+@caches.memoize("util.get_tag_for_types")
 def get_tag_for_types(types: Tuple[Type, ...]) -> Optional[TaggedUnion]:
     if any(
         t in {None, ...} or not inspect.isclass(t) or checks.isstdlibtype(t)